@@ -15,9 +15,9 @@ async def _run_game_async() -> None:
     game = tunneling_game.Game()
     while game.running:
         game.handle_input()
-        game.update()
+        game.advance(game.clock.get_time())
         game.draw()
-        game.clock.tick(tunneling_game.FPS)
+        game.end_frame()
         # 브라우저 이벤트 루프에 양보
         await asyncio.sleep(0)
     pygame.quit()
@@ -0,0 +1,154 @@
+"""Headless checks for World.step and the indexes it relies on.
+
+Run from the repository root: python -m pytest -q
+"""
+
+import os
+import random
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import tunneling_game as tg
+
+needs_numpy = pytest.mark.skipif(tg.np is None, reason="MonsterEngine needs numpy")
+
+
+def scripted_actions(seed, ticks):
+    """A reproducible mix of moves, digs and drops (own RNG, independent of the world seed)."""
+    rng = random.Random(seed)
+    actions = []
+    for _ in range(ticks):
+        roll = rng.random()
+        if roll < 0.05:
+            actions.append(tg.Action(dig=True))
+        elif roll < 0.08:
+            actions.append(tg.Action(down=True))
+        elif roll < 0.09:
+            actions.append(tg.Action(jump=True))
+        else:
+            actions.append(tg.Action(move=rng.choice((-1, 0, 1))))
+    return actions
+
+
+def monster_state(world):
+    if world.monster_engine is not None:
+        world.monster_engine.sync(world.monsters)
+    return [(m.floor, float(m.x), m.direction, m.turn_cooldown) for m in world.monsters]
+
+
+def run_trace(seed, actions, engine=True, invisible=False):
+    """Step a fresh world through the actions and record the state after every tick."""
+    world = tg.World(seed)
+    if not engine:
+        world.monster_engine = None
+    if invisible:
+        world.player.is_invisible = True
+        world.player.invisible_end_floor = tg.TOTAL_FLOORS
+    trace = []
+    for tick, action in enumerate(actions):
+        state = world.step(action)
+        player = world.player
+        trace.append((state, player.x, player.current_floor, player.is_digging))
+        if tick % 100 == 99:
+            trace.append(tuple(monster_state(world)))
+        if state != "playing":
+            break
+    holes = [list(floor['holes']) for floor in world.floors]
+    return world, trace, holes
+
+
+def test_same_seed_same_trace():
+    # Invisible so the run digs several floors deep and picks up gimmicks instead of dying early
+    actions = scripted_actions(0, 3000)
+    world_a, trace_a, holes_a = run_trace(1234, actions, invisible=True)
+    world_b, trace_b, holes_b = run_trace(1234, actions, invisible=True)
+    assert world_a.player.current_floor > 1
+    assert trace_a == trace_b
+    assert holes_a == holes_b
+    assert world_a.gimmick_index.versions == world_b.gimmick_index.versions
+
+
+def test_different_seed_different_layout():
+    assert tg.World(1).layout != tg.World(2).layout
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_hole_set_matches_naive_intervals(seed):
+    rng = random.Random(seed)
+    holes = tg.HoleSet()
+    covered = set()
+    for _ in range(300):
+        start = rng.randrange(0, 800)
+        end = start + rng.randrange(0, 60)
+        changed = holes.add(start, end)
+        new_points = set(range(start, end + 1)) - covered
+        covered |= new_points
+        if not changed:
+            assert not new_points
+
+        intervals = list(holes)
+        assert intervals == sorted(intervals)
+        # Merged intervals never overlap or share an end point
+        assert all(prev_end < next_start for (_, prev_end), (next_start, _) in zip(intervals, intervals[1:]))
+        assert {x for s, e in intervals for x in range(s, e + 1)} == covered
+        for x in rng.sample(range(-5, 870), 40):
+            assert holes.contains(x) == (x in covered)
+    assert holes.version == len(holes.changes)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_gimmick_index_matches_linear_scan(seed):
+    rng = random.Random(seed)
+    types = ['teleport', 'invisible', 'slow', 'speed', 'stun']
+    # Several gimmicks per floor with overlaps, so the list-order tie break is exercised
+    gimmicks = [tg.Gimmick(rng.randrange(1, 6), rng.choice(types), rng.randrange(0, 700)) for _ in range(60)]
+    index = tg.GimmickIndex(gimmicks)
+
+    def naive_at(floor_num, x):
+        for gimmick in gimmicks:
+            if gimmick.is_active and gimmick.floor == floor_num and gimmick.x <= x <= gimmick.x + gimmick.width:
+                return gimmick
+        return None
+
+    removed_per_floor = [0] * tg.TOTAL_FLOORS
+    for _ in range(40):
+        for floor_num in range(7):
+            for x in rng.sample(range(-10, 800), 30):
+                assert index.at(floor_num, x) is naive_at(floor_num, x)
+            on_floor = [g for g in gimmicks if g.is_active and g.floor == floor_num]
+            assert index.on_floor(floor_num) == sorted(on_floor, key=lambda g: g.x)
+
+        active = [g for g in gimmicks if g.is_active]
+        if not active:
+            break
+        used = rng.choice(active)
+        used.is_active = False
+        index.remove(used)
+        removed_per_floor[used.floor] += 1
+        assert index.versions == removed_per_floor
+
+
+@needs_numpy
+def test_monster_engine_matches_python_update():
+    # Invisible player so the run lasts the whole 6000 ticks and every turning floor gets exercised
+    actions = [tg.IDLE] * 6000
+    world_engine, trace_engine, _ = run_trace(99, actions, engine=True, invisible=True)
+    world_python, trace_python, _ = run_trace(99, actions, engine=False, invisible=True)
+    assert any(m.can_random_turn for m in world_python.monsters)
+    assert trace_engine == trace_python
+    assert monster_state(world_engine) == monster_state(world_python)
+
+
+@needs_numpy
+@pytest.mark.parametrize("seed", range(6))
+def test_monster_engine_matches_python_collisions(seed):
+    # Visible player: both paths must end the run on the same tick
+    actions = scripted_actions(seed, 4000)
+    world_engine, trace_engine, _ = run_trace(seed, actions, engine=True)
+    world_python, trace_python, _ = run_trace(seed, actions, engine=False)
+    assert trace_engine == trace_python
+    assert world_engine.state == world_python.state
@@ -0,0 +1,216 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+# Workers import the game too (also under the spawn start method)
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+POLICIES = ["greedy", "cautious"]
+BATCH_SIZE = 50  # seeds per pool task
+
+_default_tuning = None
+
+
+def apply_tuning(tunneling_game, params: dict) -> None:
+    """Reset MONSTER_TUNING to the shipped values, then apply this config's overrides."""
+    global _default_tuning
+    if _default_tuning is None:
+        _default_tuning = dict(tunneling_game.MONSTER_TUNING)
+    tunneling_game.MONSTER_TUNING.clear()
+    tunneling_game.MONSTER_TUNING.update(_default_tuning, **params)
+
+
+def greedy_policy(world, tunneling_game):
+    """Dig straight down and ignore monsters."""
+    return tunneling_game.Action(dig=True, down=True)
+
+
+def ticks_until_contact(player, monster, screen_width: int) -> float:
+    """Rough number of ticks before a monster on the player's floor overlaps the player."""
+    left, right = player.x, player.x + player.width
+    m_left, m_right = monster.x, monster.x + monster.width
+    if m_right > left and m_left < right:
+        return 0
+    if monster.speed <= 0:
+        return float("inf")
+    if m_right <= left:
+        gap, toward = left - m_right, monster.direction > 0
+        wall_trip = 2 * max(0, m_left - 50)
+    else:
+        gap, toward = m_left - right, monster.direction < 0
+        wall_trip = 2 * max(0, screen_width - 50 - m_right)
+    # Moving away: it comes back after bouncing off the wall behind it
+    return (gap if toward else gap + wall_trip) / monster.speed
+
+
+def nearest_threat(world, tunneling_game, floor_num: int):
+    """(monster, ticks until contact) for the closest monster on a floor, assuming the player stays put."""
+    bucket = world.monsters_by_floor[floor_num]
+    if world.monster_engine is not None:
+        world.monster_engine.sync(bucket)
+    threat, eta = None, float("inf")
+    for monster in bucket:
+        monster_eta = ticks_until_contact(world.player, monster, tunneling_game.SCREEN_WIDTH)
+        if monster_eta < eta:
+            threat, eta = monster, monster_eta
+    return threat, eta
+
+
+def cautious_policy(world, tunneling_game):
+    """Step away from monsters that would arrive before the hole is done, and only drop when the floor below is clear."""
+    Action = tunneling_game.Action
+    player = world.player
+    if player.is_stunned or player.is_invisible:
+        return greedy_policy(world, tunneling_game)
+
+    threat, eta = nearest_threat(world, tunneling_game, player.current_floor)
+    in_hole = world.floors[player.current_floor]["holes"].contains(player.x + player.width // 2)
+    remaining = player.dig_timer if player.is_digging else (0 if in_hole else player.dig_duration)
+    if threat is not None and eta < remaining + 10:
+        if eta < 10 and player.current_floor > 0 and nearest_threat(world, tunneling_game, player.current_floor - 1)[1] > 30:
+            # Too close to outrun: hop back up through the hole we came down
+            return Action(jump=True)
+        # Run away from the threat (towards the open side if already against a wall)
+        away = 1 if threat.x < player.x else -1
+        if not 50 <= player.x + away * player.base_speed <= tunneling_game.SCREEN_WIDTH - player.width - 50:
+            away = -away
+        return Action(move=away)
+
+    if in_hole and not player.is_digging:
+        _, below_eta = nearest_threat(world, tunneling_game, min(player.current_floor + 1, tunneling_game.TOTAL_FLOORS - 1))
+        return Action(down=below_eta > 30)
+    return Action(dig=not player.is_digging)
+
+
+def run_batch(task: tuple) -> list:
+    """Play one batch of seeded runs and return (state, floor, ticks) per run."""
+    params, policy_name, seeds, max_ticks = task
+    import tunneling_game
+
+    apply_tuning(tunneling_game, params)
+    policy = {"greedy": greedy_policy, "cautious": cautious_policy}[policy_name]
+    results = []
+    for seed in seeds:
+        world = tunneling_game.World(seed=seed)
+        while world.state == "playing" and world.ticks < max_ticks:
+            world.step(policy(world, tunneling_game))
+        state = world.state if world.state != "playing" else "timeout"
+        results.append((state, world.player.current_floor, world.ticks))
+    return results
+
+
+def percentile(values: list, fraction: float):
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else None
+
+
+def summarize(params: dict, policy: str, runs: list, tick_ms: float, total_floors: int) -> dict:
+    """Per-floor death rates, clear/timeout rates and clear-time distribution for one config."""
+    deaths = [0] * total_floors
+    reached = [0] * total_floors
+    clear_times = []
+    for state, floor, ticks in runs:
+        for f in range(floor + 1):
+            reached[f] += 1
+        if state == "dead":
+            deaths[floor] += 1
+        elif state == "clear":
+            clear_times.append(round(ticks * tick_ms / 1000, 2))
+    clear_times.sort()
+    count = len(runs)
+    return {
+        "params": params,
+        "policy": policy,
+        "runs": count,
+        "clear_rate": round(len(clear_times) / count, 4),
+        "timeout_rate": round(sum(1 for state, _, _ in runs if state == "timeout") / count, 4),
+        "reached_by_floor": reached,
+        # floor -> share of runs that reached the floor and died there (floors with no deaths are omitted)
+        "death_rate_by_floor": {f: round(deaths[f] / reached[f], 4) for f in range(total_floors) if deaths[f]},
+        "clear_time_s": {
+            "mean": round(statistics.fmean(clear_times), 2) if clear_times else None,
+            "p10": percentile(clear_times, 0.1),
+            "p50": percentile(clear_times, 0.5),
+            "p90": percentile(clear_times, 0.9),
+        },
+    }
+
+
+def parse_sweeps(specs: list, defaults: dict) -> list:
+    """KEY=v1,v2 ... -> every combination as a list of override dicts ([{}] without sweeps)."""
+    axes = []
+    for spec in specs:
+        key, _, values = spec.partition("=")
+        if key not in defaults or not values:
+            raise SystemExit(f"unknown or empty sweep '{spec}' (keys: {', '.join(defaults)})")
+        cast = type(defaults[key])
+        axes.append([(key, cast(value)) for value in values.split(",")])
+    return [dict(combo) for combo in itertools.product(*axes)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run many seeded headless games and aggregate difficulty stats.")
+    parser.add_argument("--runs", type=int, default=1000, help="seeded runs per config and policy")
+    parser.add_argument("--policy", action="append", choices=POLICIES, help="player policy (default: all)")
+    parser.add_argument("--sweep", action="append", default=[], metavar="KEY=V1,V2", help="MONSTER_TUNING values to sweep")
+    parser.add_argument("--seed-base", type=int, default=0, help="first seed (every config uses the same seeds)")
+    parser.add_argument("--max-minutes", type=float, default=5.0, help="end a run as a timeout after this much game time")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--out", default="balance_results.json")
+    args = parser.parse_args()
+
+    import tunneling_game
+
+    configs = parse_sweeps(args.sweep, tunneling_game.MONSTER_TUNING)
+    policies = args.policy or POLICIES
+    max_ticks = int(args.max_minutes * 60 * tunneling_game.FPS)
+    seeds = list(range(args.seed_base, args.seed_base + args.runs))
+
+    tasks, owners = [], []
+    for config_index, params in enumerate(configs):
+        for policy in policies:
+            for start in range(0, len(seeds), BATCH_SIZE):
+                tasks.append((params, policy, seeds[start:start + BATCH_SIZE], max_ticks))
+                owners.append((config_index, policy))
+
+    started = time.perf_counter()
+    runs = {}
+    with multiprocessing.Pool(args.workers) as pool:
+        for owner, batch in zip(owners, pool.imap(run_batch, tasks)):
+            runs.setdefault(owner, []).extend(batch)
+    elapsed = time.perf_counter() - started
+
+    results = [
+        summarize(configs[config_index], policy, batch, tunneling_game.TICK_MS, tunneling_game.TOTAL_FLOORS)
+        for (config_index, policy), batch in runs.items()
+    ]
+    Path(args.out).write_text(
+        json.dumps({"defaults": tunneling_game.MONSTER_TUNING, "seeds": [seeds[0], seeds[-1]], "results": results}, separators=(",", ":")),
+        encoding="utf-8",
+    )
+
+    print(f"{'config':<40}{'policy':<10}{'clear':>8}{'timeout':>9}{'p50 s':>8}  deadliest floors")
+    for result in results:
+        label = ",".join(f"{key}={value}" for key, value in result["params"].items()) or "defaults"
+        # Ignore floors too few runs reach for their rate to mean anything
+        common = {f: rate for f, rate in result["death_rate_by_floor"].items() if result["reached_by_floor"][f] >= result["runs"] * 0.05}
+        worst = sorted(common.items(), key=lambda item: -item[1])[:3]
+        p50 = result["clear_time_s"]["p50"]
+        print(
+            f"{label:<40}{result['policy']:<10}{result['clear_rate']:>8.1%}{result['timeout_rate']:>9.1%}"
+            f"{(f'{p50:.1f}' if p50 is not None else '-'):>8}  "
+            + ", ".join(f"B{floor} {rate:.0%}" for floor, rate in worst)
+        )
+    total = len(seeds) * len(configs) * len(policies)
+    print(f"OK: {total} runs in {elapsed:.1f}s with {args.workers} workers -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
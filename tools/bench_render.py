@@ -0,0 +1,198 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+BACKENDS = ["surface", "sdl2-software", "sdl2"]
+# Lighting gate: run deep enough that the darkness layer is on
+LIGHT_BENCH_FLOOR = 35
+# Backends the lighting budget fails on. The SDL2 renderers are reported but not gated: they are
+# opt-in desktop backends (the web build has no _sdl2 and always uses surface), they redraw the
+# whole field every frame, and SDL's software renderer pays ~4 ns per pixel for the MOD blend
+# (~1.5 ms for 800x505). Headless CI has no GPU, so "sdl2" measures that software path too.
+LIGHT_GATED_BACKENDS = ["surface"]
+
+
+def post_key(pygame, key: int, char: str) -> None:
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char, mod=0, scancode=0))
+
+
+def import_game():
+    sys.path.insert(0, str(ROOT))
+    import pygame
+
+    if os.environ.get("SDL_VIDEODRIVER") == "dummy":
+        # The dummy video driver cannot create system cursors
+        pygame.mouse.set_cursor = lambda *args, **kwargs: None
+
+    import tunneling_game
+
+    return pygame, tunneling_game
+
+
+def percentiles(times: list) -> dict:
+    times = sorted(times)
+    return {
+        "p50_ms": round(times[len(times) // 2], 3),
+        "p95_ms": round(times[int(len(times) * 0.95)], 3),
+    }
+
+
+def run_backend(backend: str, frames: int) -> dict:
+    """Play a scripted session with one backend and time Game.draw()."""
+    pygame, tunneling_game = import_game()
+    game = tunneling_game.Game(render_backend=backend, seed=0)
+
+    # Same script for every backend: dig, scroll around in view mode, dig again
+    script = {
+        10: lambda: post_key(pygame, pygame.K_s, "s"),
+        frames // 3: lambda: post_key(pygame, pygame.K_v, "v"),
+        2 * frames // 3: lambda: post_key(pygame, pygame.K_v, "v"),
+    }
+    draw_times = []
+    for frame in range(frames):
+        if frame in script:
+            script[frame]()
+        if frames // 3 < frame < 2 * frames // 3 and frame % 5 == 0:
+            pygame.event.post(pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1 if frame % 200 < 100 else 1))
+        if frame % 40 == 0:
+            post_key(pygame, pygame.K_s, "s")
+
+        game.handle_input()
+        game.update()
+        start = time.perf_counter()
+        game.draw()
+        draw_times.append((time.perf_counter() - start) * 1000)
+
+    pygame.quit()
+    return {
+        "backend": game.render_backend,
+        "frames": frames,
+        "mean_ms": round(statistics.fmean(draw_times), 3),
+        **percentiles(draw_times),
+    }
+
+
+def run_light_bench(backend: str, frames: int) -> dict:
+    """Time lit and unlit Game.draw() on the same frames in one process.
+
+    Two games with the same seed get the same input every frame, so they stay in lockstep;
+    only lighting_enabled differs. View mode stays off (it disables lighting), and which game
+    draws first alternates per frame so neither side always gets the warmer caches.
+    """
+    pygame, tunneling_game = import_game()
+    games = {}
+    for lit in (True, False):
+        game = tunneling_game.Game(render_backend=backend, seed=0)
+        game.lighting_enabled = lit
+        # Same as the dev test mode: start deep and stay invisible so the run never ends early
+        game.player.current_floor = LIGHT_BENCH_FLOOR
+        game.player.is_invisible = True
+        game.player.invisible_end_floor = 999
+        games[lit] = game
+    if backend == "surface":
+        # Both games were given the one display surface; compose each into its own copy
+        for game in games.values():
+            game.compositor.screen = pygame.display.get_surface().copy()
+
+    times = {True: [], False: []}
+    for frame in range(frames):
+        # Dig, then drop through the hole: the light follows the player and the camera scrolls
+        keys = []
+        if frame % 80 == 0:
+            keys.append((pygame.K_l, "l"))
+        elif frame % 80 == 70:
+            keys.append((pygame.K_s, "s"))
+        order = (True, False) if frame % 2 == 0 else (False, True)
+        for lit in order:
+            game = games[lit]
+            for key, char in keys:
+                post_key(pygame, key, char)
+            game.handle_input()
+            game.update()
+            start = time.perf_counter()
+            game.draw()
+            times[lit].append((time.perf_counter() - start) * 1000)
+
+    lit_player, unlit_player = games[True].player, games[False].player
+    if (lit_player.x, lit_player.current_floor) != (unlit_player.x, unlit_player.current_floor):
+        raise SystemExit("lit and unlit games diverged; the timings are not comparable")
+
+    pygame.quit()
+    lit, unlit = percentiles(times[True]), percentiles(times[False])
+    return {
+        "backend": games[True].render_backend,
+        "frames": frames,
+        "floor": games[True].player.current_floor,
+        "lit": lit,
+        "unlit": unlit,
+        "cost_p50_ms": round(lit["p50_ms"] - unlit["p50_ms"], 3),
+        "cost_p95_ms": round(lit["p95_ms"] - unlit["p95_ms"], 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare rendering backends (time spent in Game.draw per frame).")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--backend", action="append", choices=BACKENDS, help="backend to run (default: all)")
+    parser.add_argument("--headless", action="store_true", help="use SDL's dummy video driver (no window, no GPU)")
+    parser.add_argument(
+        "--light-budget-ms",
+        type=float,
+        help=f"fail if lighting adds more than this to the median draw time (measured from B{LIGHT_BENCH_FLOOR})",
+    )
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--light", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    if args.child:
+        bench = run_light_bench if args.light else run_backend
+        print(json.dumps(bench(args.child, args.frames)))
+        return
+
+    # Each backend runs in its own process so SDL windows/renderers never share state
+    def run_child(backend: str, *extra: str) -> dict:
+        cmd = [sys.executable, __file__, "--child", backend, "--frames", str(args.frames), *extra]
+        out = subprocess.run(cmd, cwd=ROOT, env=os.environ, capture_output=True, text=True, check=True).stdout
+        return json.loads(out.strip().splitlines()[-1])
+
+    results = [run_child(backend) for backend in args.backend or BACKENDS]
+    print(f"{'backend':<16}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for result in results:
+        print(f"{result['backend']:<16}{result['mean_ms']:>10.3f}{result['p50_ms']:>10.3f}{result['p95_ms']:>10.3f}")
+
+    if args.light_budget_ms is None:
+        return
+
+    print()
+    print(f"lighting cost from B{LIGHT_BENCH_FLOOR}, lit - unlit on the same frames (budget {args.light_budget_ms:.2f} ms at p50)")
+    print(f"{'backend':<16}{'lit p50':>10}{'unlit p50':>11}{'cost p50':>10}{'cost p95':>10}")
+    over_budget = False
+    for backend in args.backend or BACKENDS:
+        result = run_child(backend, "--light")
+        ok = result["cost_p50_ms"] <= args.light_budget_ms
+        if backend in LIGHT_GATED_BACKENDS:
+            over_budget = over_budget or not ok
+            status = "OK" if ok else "OVER BUDGET"
+        else:
+            status = "not gated"
+        print(
+            f"{result['backend']:<16}{result['lit']['p50_ms']:>10.3f}{result['unlit']['p50_ms']:>11.3f}"
+            f"{result['cost_p50_ms']:>+10.3f}{result['cost_p95_ms']:>+10.3f}  {status}"
+        )
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SHEET_WIDTH = 2048
+# The whole sheet stays decoded (RGBA) for the session: 2048x1024 = 8 MiB at most
+SHEET_MAX_HEIGHT = 1024
+PADDING = 1
+# Skip images covering more than 1/N of the screen
+MAX_IMAGE_SCREEN_FRACTION = 5
+# Sprites that are cheaper to draw than to decode from the sheet (the glow pulse frames are
+# big, mostly transparent ellipses: ~600k pixels for ~6 ms of drawing)
+SKIP_SPRITES = {"gimmick_glow"}
+# Two warm-up passes with different run data (seed, reached floor, time, typed name).
+# Only cache entries both passes produce are baked, so seed/score/name text never ends up in the sheet.
+WARM_PASSES = [
+    {"seed": 1, "floor": 0, "final_time": 0, "name": ""},
+    {"seed": 2, "floor": 7, "final_time": 83456, "name": "atlas"},
+]
+
+
+def warm_caches(pygame, game, tunneling_game, run: dict) -> None:
+    """Render every static visual once so the game's own caches hold them."""
+    # Player: normal frames only. Gimmick effect variants are 21 frames each, only show up
+    # after a gimmick fires, and would more than double the sheet, so they stay procedural.
+    tunneling_game.get_player_frames(False, False, 0)
+    for monster in game.monsters:
+        tunneling_game.get_monster_frames(monster.type)
+    tunneling_game.get_princess_sprite()
+    tunneling_game.get_heart_sprite()
+
+    # Floor bodies, labels and label cards
+    for floor in game.floors:
+        game.floor_cache.get(floor)
+
+    # HUD, a dug hole, view mode and every overlay screen
+    def frames(count: int) -> None:
+        for _ in range(count):
+            game.handle_input()
+            game.update()
+            game.draw()
+
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_s, unicode="s", mod=0, scancode=0))
+    frames(80)
+    game.toggle_view_mode()
+    frames(2)
+    game.toggle_view_mode()
+    game.player.current_floor = run["floor"]
+    game.final_time = run["final_time"]
+    game.player_name = run["name"]
+    game.rankings = []  # ranking.json on the build machine is not part of the game
+    for state in ("gameover", "name_input", "clear"):
+        game.game_state = state
+        game.draw()
+    game.game_state = "playing"
+
+
+def largest_image(value) -> int:
+    """Pixel count of the biggest surface in a cache value."""
+    if isinstance(value, int):
+        return 0
+    if isinstance(value, (tuple, list)):
+        return max((largest_image(item) for item in value), default=0)
+    return value.get_width() * value.get_height()
+
+
+def static_entries(pygame, tunneling_game) -> dict:
+    """(cache name, key) -> value for entries every warm-up pass renders identically."""
+    passes = []
+    for run in WARM_PASSES:
+        for cache in tunneling_game.ATLAS_CACHES.values():
+            cache.clear()
+        game = tunneling_game.Game(render_backend="surface", seed=run["seed"])
+        warm_caches(pygame, game, tunneling_game, run)
+        passes.append({
+            (cache_name, key): value
+            for cache_name, cache in tunneling_game.ATLAS_CACHES.items()
+            for key, value in cache.items()
+        })
+    # Full-screen gradients and the end-of-run modal cards are drawn once when first shown,
+    # never on the first frame, and would take most of the sheet
+    max_image = tunneling_game.SCREEN_WIDTH * tunneling_game.SCREEN_HEIGHT // MAX_IMAGE_SCREEN_FRACTION
+    first, last = passes[0], passes[-1]
+    return {
+        entry: value for entry, value in last.items()
+        if entry in first and largest_image(value) < max_image
+        and not (entry[0] == "sprite" and entry[1][0] in SKIP_SPRITES)
+    }
+
+
+class SheetBuilder:
+    """Skyline-pack unique surfaces into one RGBA sheet."""
+
+    def __init__(self, pygame):
+        self.pygame = pygame
+        self.rects = {}  # pixel content -> [x, y, w, h]
+        self.pending = []  # (surface, content key)
+
+    def add(self, surface) -> dict:
+        pygame = self.pygame
+        content = (surface.get_size(), pygame.image.tobytes(surface, "RGBA"))
+        if content not in self.rects:
+            self.rects[content] = None
+            self.pending.append((surface, content))
+        opaque = not surface.get_flags() & pygame.SRCALPHA
+        return {"rect": content, "opaque": opaque}
+
+    def pack(self):
+        pygame = self.pygame
+        # Skyline: [x, top, width] segments across the sheet; each image goes where its top edge ends up lowest
+        skyline = [[0, 0, SHEET_WIDTH]]
+        height = 0
+        for surface, content in sorted(self.pending, key=lambda item: -item[0].get_height()):
+            width = surface.get_width() + PADDING
+            best = None
+            for start in range(len(skyline)):
+                x = skyline[start][0]
+                if x + width > SHEET_WIDTH:
+                    break
+                top, end = 0, start
+                while skyline[end][0] < x + width:
+                    top = max(top, skyline[end][1])
+                    end += 1
+                    if end == len(skyline):
+                        break
+                if best is None or top < best[0]:
+                    best = (top, x)
+            top, x = best
+            self.rects[content] = [x, top, surface.get_width(), surface.get_height()]
+            bottom = top + surface.get_height()
+            height = max(height, bottom)
+
+            # Raise the skyline under the image, keeping the uncovered tail of the last segment
+            merged = []
+            for seg_x, seg_top, seg_width in skyline:
+                seg_end = seg_x + seg_width
+                if seg_end <= x or seg_x >= x + width:
+                    merged.append([seg_x, seg_top, seg_width])
+                    continue
+                if seg_x < x:
+                    merged.append([seg_x, seg_top, x - seg_x])
+                if not merged or merged[-1][0] + merged[-1][2] <= x:
+                    merged.append([x, bottom + PADDING, width])
+                if seg_end > x + width:
+                    merged.append([x + width, seg_top, seg_end - x - width])
+            skyline = merged
+        if height > SHEET_MAX_HEIGHT:
+            raise SystemExit(f"atlas sheet would be {SHEET_WIDTH}x{height}, over the {SHEET_WIDTH}x{SHEET_MAX_HEIGHT} cap")
+        sheet = pygame.Surface((SHEET_WIDTH, max(1, height)), pygame.SRCALPHA)
+        sheet.fill((0, 0, 0, 0))
+        for surface, content in self.pending:
+            # Copy pixels as-is (the sheet starts fully transparent)
+            sheet.blit(surface, self.rects[content][:2], special_flags=pygame.BLEND_RGBA_MAX)
+        return sheet
+
+
+def encode(value, builder: SheetBuilder):
+    if isinstance(value, int):
+        return value
+    if isinstance(value, tuple):
+        return {"tuple": [encode(item, builder) for item in value]}
+    if isinstance(value, list):
+        return {"list": [encode(item, builder) for item in value]}
+    return builder.add(value)
+
+
+def resolve(value, builder: SheetBuilder):
+    """Swap the content placeholders for packed rects once the sheet is laid out."""
+    if isinstance(value, int):
+        return value
+    if "rect" in value:
+        return {"rect": builder.rects[value["rect"]], "opaque": value["opaque"]}
+    if "tuple" in value:
+        return {"tuple": [resolve(item, builder) for item in value["tuple"]]}
+    return {"list": [resolve(item, builder) for item in value["list"]]}
+
+
+def main() -> None:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    sys.path.insert(0, str(ROOT))
+    import pygame
+
+    # The dummy video driver cannot create system cursors
+    pygame.mouse.set_cursor = lambda *args, **kwargs: None
+
+    import tunneling_game
+
+    image_path = Path(tunneling_game.ATLAS_IMAGE_PATH)
+    index_path = Path(tunneling_game.ATLAS_INDEX_PATH)
+    # Never bake from an old atlas: remove it before the game loads it
+    for path in (image_path, index_path):
+        if path.exists():
+            path.unlink()
+
+    builder = SheetBuilder(pygame)
+    entries = []
+    for (cache_name, key), value in static_entries(pygame, tunneling_game).items():
+        entries.append({"cache": cache_name, "key": key, "value": encode(value, builder)})
+    sheet = builder.pack()
+    for entry in entries:
+        entry["value"] = resolve(entry["value"], builder)
+
+    image_path.parent.mkdir(parents=True, exist_ok=True)
+    pygame.image.save(sheet, str(image_path))
+    index = {
+        "source_hash": tunneling_game.atlas_source_hash(),
+        "image": image_path.name,
+        "entries": entries,
+    }
+    index_path.write_text(json.dumps(index, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+    print(f"OK: {len(entries)} cache entries, {len(builder.pending)} unique images")
+    print(f"OK: {image_path} ({sheet.get_width()}x{sheet.get_height()}, {image_path.stat().st_size // 1024} KiB)")
+    print(f"OK: {index_path}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,48 @@ import pygame
 import sys
 import random
 import json
+import math
 import os
-from datetime import timedelta
+import hashlib
+import struct
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque, namedtuple
+from datetime import date, timedelta
+
+try:
+    from pygame._sdl2 import video as sdl2_video
+except ImportError:
+    # _sdl2 모듈이 없는 빌드에서는 서피스 렌더링만 사용
+    sdl2_video = None
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy가 없으면 파티클 효과 없이 실행
+    np = None
 
 # 한글 폰트(웹/배포 포함) 경로
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 KOREAN_FONT_PATH = os.path.join(BASE_DIR, "fonts", "NotoSansKR.ttf")
 _FONT_CACHE = {}
+_GRADIENT_CACHE = {}
+_SPRITE_CACHE = {}
+_TEXT_CACHE = OrderedDict()
+_SHAPE_CACHE = OrderedDict()
+_GLYPH_ATLASES = {}
+TEXT_CACHE_SIZE = 256
+SHAPE_CACHE_SIZE = 128
+
+# 빌드 시 생성하는 스프라이트 아틀라스 (tools/build_atlas.py) - 없으면 절차적으로 그린다
+ATLAS_IMAGE_PATH = os.path.join(BASE_DIR, "assets", "atlas.png")
+ATLAS_INDEX_PATH = os.path.join(BASE_DIR, "assets", "atlas.json")
+ATLAS_CACHES = {
+    "sprite": _SPRITE_CACHE,
+    "gradient": _GRADIENT_CACHE,
+    "shape": _SHAPE_CACHE,
+    "text": _TEXT_CACHE,
+}
 
 # 실행 환경 플래그
 # - 웹(브라우저) 빌드: pygbag/emscripten 환경에서 sys.platform == "emscripten"
@@ -17,14 +52,58 @@ IS_WEB_BUILD = (sys.platform == "emscripten")
 #   Windows(PowerShell):  $env:TUNNELINGGAME_DEVTOOLS="1"
 #   Windows(CMD):         set TUNNELINGGAME_DEVTOOLS=1
 DEV_TOOLS_ENABLED = os.getenv("TUNNELINGGAME_DEVTOOLS", "").strip().lower() in ("1", "true", "yes", "y")
+# - 렌더링 백엔드: surface(기본) / sdl2(Renderer, 가능하면 하드웨어 가속) / sdl2-software(Renderer, 소프트웨어 렌더러)
+#   Windows(CMD):         set TUNNELINGGAME_RENDERER=sdl2
+RENDER_BACKEND = os.getenv("TUNNELINGGAME_RENDERER", "surface").strip().lower()
+# - 화질: auto(기본, 프레임 시간에 따라 자동) 또는 단계 고정(0~4 / high, no-glow, no-shadow, flat, low)
+#   Windows(CMD):         set TUNNELINGGAME_QUALITY=2
+QUALITY_SETTING = os.getenv("TUNNELINGGAME_QUALITY", "auto").strip().lower()
+# - 시드: 비우면 판마다 새 배치, 숫자면 항상 같은 배치, daily면 날짜별로 같은 배치 (일일 도전)
+#   Windows(CMD):         set TUNNELINGGAME_SEED=daily
+SEED_SETTING = os.getenv("TUNNELINGGAME_SEED", "").strip().lower()
 
-# Pygame 초기화
-pygame.init()
-try:
-    pygame.mixer.init()
-except Exception:
-    # 웹 빌드/일부 환경에서는 오디오 초기화가 실패할 수 있음 (게임 진행에는 영향 없음)
-    pass
+# 랜덤 방향 전환용 난수를 몇 틱 분량씩 한 번에 뽑아 둔다 (TurnRolls)
+MONSTER_RANDOM_BLOCK = 32
+# 시드별 배치 캐시 크기 (같은 시드로 여러 판 돌릴 때 재사용)
+LAYOUT_CACHE_SIZE = 64
+
+# 몬스터 난이도 값 (tools/balance_farm.py --sweep 으로 조정)
+MONSTER_TUNING = {
+    "base_speed": 1.0,  # 지하 1층 기본 속도 (픽셀/틱)
+    "speed_step": 0.5,  # speed_step_floors 층마다 더하는 속도
+    "speed_step_floors": 3,
+    "speed_scale_shallow": 0.855,  # 지하 1~9층 배율
+    "speed_scale_mid": 0.8123,  # 10~40층 배율
+    "speed_scale_deep": 0.722,  # 41층 이상 배율
+    "random_turn_floor": 41,  # 이 층부터 랜덤 방향 전환
+    "random_turn_chance": 0.01,  # 틱당 방향 전환 확률
+    "turn_cooldown": 60,  # 방향 전환 후 쿨다운 (틱)
+    "monsters_min": 1,  # 층별 몬스터 수 범위
+    "monsters_max": 2,
+}
+
+# 화질 단계 - 느려질수록 글로우 -> 그림자 -> 그라디언트 배경 -> 파티클 밀도 순으로 줄인다
+QUALITY_TIERS = [
+    ("high", {"glows": True, "shadows": True, "gradients": True, "particles": 1.0}),
+    ("no-glow", {"glows": False, "shadows": True, "gradients": True, "particles": 1.0}),
+    ("no-shadow", {"glows": False, "shadows": False, "gradients": True, "particles": 1.0}),
+    ("flat", {"glows": False, "shadows": False, "gradients": False, "particles": 1.0}),
+    ("low", {"glows": False, "shadows": False, "gradients": False, "particles": 0.25}),
+]
+RENDER_QUALITY = dict(QUALITY_TIERS[0][1])  # 그리기 코드가 참조하는 현재 단계 설정
+QUALITY_WINDOW_MS = 1500  # 작업 시간 평균을 내는 구간 (그리기 속도와 관계없이 실제 시간)
+QUALITY_COOLDOWN_MS = 500  # 단계를 바꾼 직후 평균에서 빼는 시간 (캐시 다시 굽기 등)
+QUALITY_DOWN_RATIO = 0.9  # 작업 시간이 프레임 예산의 90%를 넘으면 한 단계 내림
+QUALITY_UP_RATIO = 0.5  # 50% 아래로 내려가면 한 단계 올림
+
+def init_pygame():
+    """Pygame 초기화 (화면을 여는 Game에서 호출 - World만 쓰는 도구/테스트는 SDL을 건드리지 않는다)"""
+    pygame.init()
+    try:
+        pygame.mixer.init()
+    except Exception:
+        # 웹 빌드/일부 환경에서는 오디오 초기화가 실패할 수 있음 (게임 진행에는 영향 없음)
+        pass
 
 
 def get_game_font(size: int) -> pygame.font.Font:
@@ -47,6 +126,62 @@ def get_game_font(size: int) -> pygame.font.Font:
     _FONT_CACHE[key] = font
     return font
 
+def render_text(size, text, color, antialias=True):
+    """텍스트 렌더링 LRU 캐시 ((크기, 문자열, 색상, 안티앨리어스)별로 보관)"""
+    key = (size, text, tuple(color), antialias)
+    surf = _TEXT_CACHE.get(key)
+    if surf is not None:
+        _TEXT_CACHE.move_to_end(key)
+        return surf
+    
+    surf = get_game_font(size).render(text, antialias, color)
+    _TEXT_CACHE[key] = surf
+    if len(_TEXT_CACHE) > TEXT_CACHE_SIZE:
+        _TEXT_CACHE.popitem(last=False)
+    return surf
+
+class GlyphAtlas:
+    """숫자 글리프 아틀라스 - 매 프레임 바뀌는 타이머 문자열을 캐시된 글리프로 조합"""
+    CHARS = "0123456789:."
+    
+    def __init__(self, size, color):
+        font = get_game_font(size)
+        glyphs = [font.render(ch, True, color) for ch in self.CHARS]
+        self.height = max(glyph.get_height() for glyph in glyphs)
+        self.surface = pygame.Surface((sum(glyph.get_width() for glyph in glyphs), self.height), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self.rects = {}
+        x = 0
+        for ch, glyph in zip(self.CHARS, glyphs):
+            self.surface.blit(glyph, (x, 0))
+            self.rects[ch] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+    
+    def measure(self, text):
+        """문자열 너비(px)"""
+        return sum(self.rects[ch].width for ch in text)
+    
+    def draw(self, surface, text, **rect_kwargs):
+        """글리프를 이어 붙여 그리기 (rect_kwargs: center=..., topleft=... 등)"""
+        rect = pygame.Rect(0, 0, self.measure(text), self.height)
+        for name, value in rect_kwargs.items():
+            setattr(rect, name, value)
+        x = rect.x
+        for ch in text:
+            area = self.rects[ch]
+            surface.blit(self.surface, (x, rect.y), area)
+            x += area.width
+        return rect
+
+def get_glyph_atlas(size, color):
+    """크기/색상별 숫자 글리프 아틀라스"""
+    key = (size, tuple(color))
+    if key not in _GLYPH_ATLASES:
+        _GLYPH_ATLASES[key] = GlyphAtlas(size, color)
+    return _GLYPH_ATLASES[key]
+
 # 게임 설정
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -56,7 +191,38 @@ FLOOR_HEIGHT = 80
 PLAYER_SIZE = 60
 MONSTER_SIZE = 50
 TOTAL_FLOORS = 51  # 지상 1층 + 지하 50층
-FPS = 60
+FPS = 60  # 시뮬레이션 틱 속도 (모든 타이머/속도는 틱 단위)
+TICK_MS = 1000 / FPS
+MAX_CATCH_UP_STEPS = 5  # 한 프레임에 따라잡는 최대 틱 수 (이보다 밀리면 게임이 느려진다)
+RENDER_FPS = 144  # 그리기 상한 (틱 사이 위치는 보간)
+QUALITY_BUDGET_MS = 1000 / FPS  # 화질 조절 예산: 60FPS를 지키는 프레임 작업 시간 (약 16.7ms, 그리기 상한 144FPS가 아니다)
+SCREEN_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+CHUNK_FLOORS = 4  # 월드 청크 하나에 들어가는 층 수
+CHUNK_HEIGHT = CHUNK_FLOORS * FLOOR_HEIGHT
+WORLD_CACHE_BUDGET = 8 * 1024 * 1024  # 월드 청크 캐시 메모리 예산(bytes)
+MINIMAP_FLOOR_HEIGHT = 9  # 미니맵에서 한 층의 높이(px)
+MINIMAP_RECT = pygame.Rect(SCREEN_WIDTH - 108, GAME_FIELD_Y + 12, 100, TOTAL_FLOORS * MINIMAP_FLOOR_HEIGHT + 10)
+FIELD_RECT = pygame.Rect(0, GAME_FIELD_Y, SCREEN_WIDTH, SCREEN_HEIGHT - GAME_FIELD_Y)
+
+# 조명: 깊을수록 어두워지고(최하층 밝기 85/255) 플레이어 주변만 밝다
+LIGHT_MIN_AMBIENT = 85
+LIGHT_AMBIENT_STEP = 16  # 밝기 단계 (마스크 재생성 횟수를 줄이기 위해 양자화)
+LIGHT_RADIUS = 120
+LIGHT_RADIUS_INVISIBLE = 180  # 투명화 중에는 빛이 넓어진다
+LIGHT_RADIUS_STEP = 10
+# SDL2 렌더러 블렌드 모드 (pygame._sdl2에 상수가 없어 SDL_BlendMode 값을 그대로 쓴다)
+SDL_BLENDMODE_NONE = 0
+SDL_BLENDMODE_MOD = 4
+
+# 파티클 이미터: 이름 -> (슬롯 수 = 하드 캡, 중력(px/틱²), 최대 수명(틱))
+PARTICLE_EMITTERS = {
+    'dirt': (1200, 0.25, 40),
+    'sparkle': (1500, -0.03, 50),
+    'burst': (1000, 0.12, 70),
+}
+PARTICLE_DRAG = 0.97
+PARTICLE_FADE_TICKS = 8  # 남은 수명이 이 틱 단위로 줄 때마다 한 단계씩 흐려진다
+DIRT_COLORS = [(214, 170, 120), (180, 130, 90), (146, 94, 56)]
 
 # 현대적인 색상 팔레트
 BG_DARK = (15, 23, 42)
@@ -99,8 +265,8 @@ GIMMICK_STUN = (23, 23, 23)  # 검정색 - 마비
 GLOW_COLOR = (96, 165, 250, 100)
 SHADOW_COLOR = (0, 0, 0, 80)
 
-def draw_rounded_rect(surface, color, rect, radius=10, border_width=0, border_color=None):
-    """둥근 모서리 사각형"""
+def _draw_rounded_rect_primitives(surface, color, rect, radius=10, border_width=0, border_color=None):
+    """둥근 모서리 사각형 (도형 프리미티브로 직접 그리기)"""
     x, y, w, h = rect
     pygame.draw.rect(surface, color, (x + radius, y, w - 2*radius, h))
     pygame.draw.rect(surface, color, (x, y + radius, w, h - 2*radius))
@@ -115,6 +281,1299 @@ def draw_rounded_rect(surface, color, rect, radius=10, border_width=0, border_co
         pygame.draw.rect(surface, border_color, (x, y + radius, border_width, h - 2*radius))
         pygame.draw.rect(surface, border_color, (x + w - border_width, y + radius, border_width, h - 2*radius))
 
+def get_rounded_rect_surface(width, height, radius=10, color=CARD_BG, border_width=0, border_color=None):
+    """둥근 모서리 사각형 도형 캐시 ((크기, 반지름, 채움색, 테두리)별로 한 번만 그린다)"""
+    key = (width, height, radius, tuple(color), border_width, tuple(border_color) if border_color else None)
+    surf = _SHAPE_CACHE.get(key)
+    if surf is not None:
+        _SHAPE_CACHE.move_to_end(key)
+        return surf
+    
+    surf = _new_sprite_surface((width, height))
+    _draw_rounded_rect_primitives(surf, color, (0, 0, width, height), radius, border_width, border_color)
+    
+    _SHAPE_CACHE[key] = surf
+    if len(_SHAPE_CACHE) > SHAPE_CACHE_SIZE:
+        _SHAPE_CACHE.popitem(last=False)
+    return surf
+
+def draw_rounded_rect(surface, color, rect, radius=10, border_width=0, border_color=None):
+    """둥근 모서리 사각형 (캐시된 도형 blit)"""
+    x, y, w, h = pygame.Rect(rect)
+    if w <= 0 or h <= 0:
+        return
+    surface.blit(get_rounded_rect_surface(w, h, radius, color, border_width, border_color), (x, y))
+
+def draw_nine_slice_rect(surface, color, rect, radius=10, border_width=0, border_color=None):
+    """가변 크기 카드 - 최소 크기 도형 하나를 9분할해 늘려 그린다"""
+    x, y, w, h = pygame.Rect(rect)
+    # 기준 도형: 모서리 원이 서로 겹치지 않는 최소 크기 + 늘릴 가운데 2px
+    base_size = 3 * radius + 2
+    if radius <= 0 or w < base_size or h < base_size:
+        draw_rounded_rect(surface, color, rect, radius, border_width, border_color)
+        return
+    base = get_rounded_rect_surface(base_size, base_size, radius, color, border_width, border_color)
+    
+    r = radius
+    mid = base_size - 2 * r  # 기준 도형의 가운데 구간
+    inner_w = w - 2 * r
+    inner_h = h - 2 * r
+    # 모서리 4개는 그대로
+    surface.blit(base, (x, y), (0, 0, r, r))
+    surface.blit(base, (x + w - r, y), (base_size - r, 0, r, r))
+    surface.blit(base, (x, y + h - r), (0, base_size - r, r, r))
+    surface.blit(base, (x + w - r, y + h - r), (base_size - r, base_size - r, r, r))
+    # 변 4개와 가운데는 늘려서
+    slices = [
+        ((r, 0, mid, r), (x + r, y), (inner_w, r)),
+        ((r, base_size - r, mid, r), (x + r, y + h - r), (inner_w, r)),
+        ((0, r, r, mid), (x, y + r), (r, inner_h)),
+        ((base_size - r, r, r, mid), (x + w - r, y + r), (r, inner_h)),
+        ((r, r, mid, mid), (x + r, y + r), (inner_w, inner_h)),
+    ]
+    for area, dest, size in slices:
+        stretched = pygame.transform.scale(base.subsurface(area), size, get_scratch_surface(size))
+        surface.blit(stretched, dest)
+
+def get_gradient_surface(size, top_color, bottom_color, alpha_range=None):
+    """세로 그라디언트 서피스 (크기/색상/알파 램프별로 한 번만 생성해 캐시)."""
+    key = (tuple(size), tuple(top_color), tuple(bottom_color), alpha_range)
+    if key in _GRADIENT_CACHE:
+        return _GRADIENT_CACHE[key]
+
+    width, height = size
+    if alpha_range is None:
+        surf = pygame.Surface((width, height))
+    else:
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+
+    for y in range(height):
+        t = y / height
+        color = tuple(int(top_color[i] + (bottom_color[i] - top_color[i]) * t) for i in range(3))
+        if alpha_range is not None:
+            color += (int(alpha_range[0] + (alpha_range[1] - alpha_range[0]) * t),)
+        pygame.draw.line(surf, color, (0, y), (width, y))
+
+    # 디스플레이가 준비되어 있으면 화면 포맷으로 변환 (blit 속도 향상)
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert() if alpha_range is None else surf.convert_alpha()
+
+    _GRADIENT_CACHE[key] = surf
+    return surf
+
+def get_world_background():
+    """월드 배경 (그라디언트를 끈 화질에서는 단색)"""
+    if RENDER_QUALITY["gradients"]:
+        return get_gradient_surface((SCREEN_WIDTH, SCREEN_HEIGHT), BG_DARKER, BG_DARK)
+    return get_gradient_surface((SCREEN_WIDTH, SCREEN_HEIGHT), BG_DARK, BG_DARK)
+
+def draw_modal_backdrop(surface, alpha_range):
+    """모달 화면 뒤 어둡게 깔기 (빈 오버레이 레이어에 가장 먼저 그린다, 그라디언트를 끄면 단색 채우기)"""
+    if RENDER_QUALITY["gradients"]:
+        surface.blit(get_gradient_surface((SCREEN_WIDTH, SCREEN_HEIGHT), BG_DARKER, BG_DARKER, alpha_range), (0, 0))
+    else:
+        surface.fill(BG_DARKER + ((alpha_range[0] + alpha_range[1]) // 2,))
+
+def draw_glow_ellipse(surface, color, size, pos):
+    """반투명 타원 글로우 (모달 제목 뒤 펄스)"""
+    glow_surf = get_scratch_surface(size)
+    pygame.draw.ellipse(glow_surf, color, (0, 0, size[0], size[1]))
+    surface.blit(glow_surf, pos)
+
+class SurfacePool:
+    """임시 SRCALPHA 서피스 풀 - 크기 버킷별 버퍼를 프레임마다 비워서 재사용"""
+    BUCKET = 32  # 버킷 크기 단위(px)
+    TRIM_FRAMES = 120  # 이 프레임 수 동안 한 번도 안 쓴 버퍼는 버림 (베이크 때만 쓰인 버퍼 정리)
+    
+    def __init__(self):
+        self.buckets = {}  # (버킷 너비, 버킷 높이) -> 서피스 목록
+        self.in_use = {}  # 이번 프레임에 꺼내 간 버킷별 개수
+        self.window_use = {}  # 이번 정리 구간에서 버킷별 최대 동시 사용 개수
+        self.frames_since_trim = 0
+        self.hits = 0
+        self.misses = 0
+        self.allocated_bytes = 0
+        self.frame_bytes = 0
+        self.peak_bytes = 0
+    
+    def begin_frame(self):
+        """프레임 시작 - 이전 프레임에서 빌려간 버퍼를 모두 반납 처리"""
+        for key, count in self.in_use.items():
+            if count > self.window_use.get(key, 0):
+                self.window_use[key] = count
+        self.in_use.clear()
+        self.frame_bytes = 0
+        
+        self.frames_since_trim += 1
+        if self.frames_since_trim >= self.TRIM_FRAMES:
+            self.trim()
+    
+    def trim(self):
+        """최근 정리 구간에 쓰인 개수만 남기고 나머지 버퍼 해제"""
+        for key in list(self.buckets):
+            surfaces = self.buckets[key]
+            keep = self.window_use.get(key, 0)
+            if keep < len(surfaces):
+                self.allocated_bytes -= (len(surfaces) - keep) * key[0] * key[1] * 4
+                del surfaces[keep:]
+            if not surfaces:
+                del self.buckets[key]
+        self.window_use.clear()
+        self.frames_since_trim = 0
+    
+    def acquire(self, size):
+        """요청 크기의 투명 서피스 반환 (버킷 버퍼의 subsurface, 이번 프레임 동안 유효)"""
+        width = max(1, int(size[0]))
+        height = max(1, int(size[1]))
+        key = (-(-width // self.BUCKET) * self.BUCKET, -(-height // self.BUCKET) * self.BUCKET)
+        
+        surfaces = self.buckets.setdefault(key, [])
+        index = self.in_use.get(key, 0)
+        if index < len(surfaces):
+            buffer = surfaces[index]
+            self.hits += 1
+        else:
+            buffer = pygame.Surface(key, pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                buffer = buffer.convert_alpha()
+            surfaces.append(buffer)
+            self.misses += 1
+            self.allocated_bytes += key[0] * key[1] * 4
+        self.in_use[key] = index + 1
+        
+        self.frame_bytes += key[0] * key[1] * 4
+        self.peak_bytes = max(self.peak_bytes, self.frame_bytes)
+        
+        area = pygame.Rect(0, 0, width, height)
+        buffer.fill((0, 0, 0, 0), area)
+        return buffer.subsurface(area)
+    
+    def stats(self):
+        """풀 사용 통계"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'allocated_bytes': self.allocated_bytes,
+            'peak_bytes': self.peak_bytes,
+        }
+
+_SURFACE_POOL = SurfacePool()
+
+def get_scratch_surface(size):
+    """글로우/그림자용 임시 서피스 (현재 프레임 동안만 사용)"""
+    return _SURFACE_POOL.acquire(size)
+
+def visible_floor_range(camera_y):
+    """카메라 위치에서 화면에 보이는 층 범위 [first_floor, last_floor]"""
+    # 층 상단 y가 GAME_FIELD_Y - FLOOR_HEIGHT ~ SCREEN_HEIGHT 안에 있으면 보이는 층
+    first_floor = max(0, -((FLOOR_HEIGHT - camera_y) // FLOOR_HEIGHT))
+    last_floor = min(TOTAL_FLOORS - 1, (SCREEN_HEIGHT - GAME_FIELD_Y + camera_y) // FLOOR_HEIGHT)
+    return int(first_floor), int(last_floor)
+
+class HoleSet:
+    """층 하나의 구멍 구간 집합 - 겹치거나 맞닿은 구간은 합쳐서 시작점 순으로 보관 (양 끝 포함)"""
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.version = 0  # 구간이 바뀔 때마다 1 증가
+        self.changes = []  # 버전별로 새로 생긴(합쳐진) 구간, changes[v] = v -> v + 1 변경
+    
+    def add(self, start, end):
+        """구간 추가 - 기존 구멍 안에 완전히 들어가면 아무것도 바꾸지 않고 False"""
+        # start 이후에 끝나고 end 이전에 시작하는 구간들이 [first, last)
+        first = bisect_left(self.ends, start)
+        last = bisect_right(self.starts, end)
+        if first < last:
+            if last - first == 1 and self.starts[first] <= start and end <= self.ends[first]:
+                return False
+            start = min(start, self.starts[first])
+            end = max(end, self.ends[last - 1])
+        self.starts[first:last] = [start]
+        self.ends[first:last] = [end]
+        self.version += 1
+        self.changes.append((start, end))
+        return True
+    
+    def contains(self, x):
+        """x가 구멍 안에 있는지"""
+        i = bisect_right(self.starts, x) - 1
+        return i >= 0 and x <= self.ends[i]
+    
+    def changes_since(self, version):
+        """version 이후 새로 생긴 구간 (나중 구간이 겹치는 이전 구간을 덮으므로 순서대로 그리면 된다)"""
+        return self.changes[version:]
+    
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+    
+    def __len__(self):
+        return len(self.starts)
+
+class GimmickIndex:
+    """층별 활성 기믹 색인 - x 순으로 정렬해 bisect로 위치 조회, 사용한 기믹은 색인에서 뺀다"""
+    def __init__(self, gimmicks):
+        self.order = {id(gimmick): i for i, gimmick in enumerate(gimmicks)}  # 겹칠 때 우선순위 (목록 순서)
+        self.max_width = max((gimmick.width for gimmick in gimmicks), default=0)
+        self.xs = [[] for _ in range(TOTAL_FLOORS)]
+        self.active = [[] for _ in range(TOTAL_FLOORS)]
+        self.versions = [0] * TOTAL_FLOORS  # 층별 변경 횟수 (기믹이 빠질 때마다 +1)
+        for gimmick in sorted(gimmicks, key=lambda gimmick: gimmick.x):
+            if gimmick.is_active:
+                self.xs[gimmick.floor].append(gimmick.x)
+                self.active[gimmick.floor].append(gimmick)
+    
+    def on_floor(self, floor_num):
+        """층의 활성 기믹 목록 (x 순)"""
+        return self.active[floor_num]
+    
+    def at(self, floor_num, x):
+        """x 위치(양 끝 포함)에 있는 활성 기믹 (없으면 None, 겹치면 먼저 배치된 기믹)"""
+        xs = self.xs[floor_num]
+        first = bisect_left(xs, x - self.max_width)
+        last = bisect_right(xs, x)
+        found = None
+        for gimmick in self.active[floor_num][first:last]:
+            if x <= gimmick.x + gimmick.width and (found is None or self.order[id(gimmick)] < self.order[id(found)]):
+                found = gimmick
+        return found
+    
+    def remove(self, gimmick):
+        """사용한 기믹을 색인에서 제거"""
+        xs = self.xs[gimmick.floor]
+        active = self.active[gimmick.floor]
+        i = bisect_left(xs, gimmick.x)
+        while active[i] is not gimmick:
+            i += 1
+        del xs[i]
+        del active[i]
+        self.versions[gimmick.floor] += 1
+
+def floor_signature(floor, floor_gimmicks):
+    """층 내용 식별값 (구멍 버전 + 남아 있는 기믹) - 캐시 무효화 판단용"""
+    return (floor['holes'].version, tuple(id(g) for g in floor_gimmicks))
+
+class FloorSurfaceCache:
+    """층별 서피스 캐시 (층 몸체 + 구멍 + 라벨을 한 장으로 합성해 보관, 최근 사용 순 LRU)"""
+    def __init__(self, label_size, max_floors=16):
+        self.label_size = label_size
+        self.max_floors = max_floors
+        self.surfaces = OrderedDict()
+        self.hole_versions = {}  # 층별로 이미 합성된 구멍 버전
+    
+    def get(self, floor):
+        """층 서피스 반환 - 새로 파이거나 합쳐진 구멍만 기존 서피스에 덧그린다"""
+        floor_num = floor['floor_num']
+        holes = floor['holes']
+        
+        surf = self.surfaces.get(floor_num)
+        if surf is None:
+            surf = self._render_base(floor_num)
+            self.surfaces[floor_num] = surf
+            new_spans = list(holes)
+            if len(self.surfaces) > self.max_floors:
+                evicted, _ = self.surfaces.popitem(last=False)
+                del self.hole_versions[evicted]
+        else:
+            self.surfaces.move_to_end(floor_num)
+            new_spans = holes.changes_since(self.hole_versions[floor_num])
+        
+        self.hole_versions[floor_num] = holes.version
+        if new_spans:
+            for hole_start, hole_end in new_spans:
+                self._draw_hole(surf, hole_start, hole_end)
+            # 테두리와 라벨은 구멍 위에 그려지므로 다시 덮어준다
+            self._draw_border_and_label(surf, floor_num)
+        return surf
+    
+    def render_into(self, surf, floor):
+        """층 하나를 surf에 바로 그리기 (캐시에 넣지 않음 - 미니맵처럼 전체 층을 한 번씩 훑을 때 LRU를 밀어내지 않게)"""
+        floor_num = floor['floor_num']
+        self._draw_base(surf, floor_num)
+        if len(floor['holes']):
+            for hole_start, hole_end in floor['holes']:
+                self._draw_hole(surf, hole_start, hole_end)
+            self._draw_border_and_label(surf, floor_num)
+    
+    def _render_base(self, floor_num):
+        """구멍이 없는 층 서피스 생성"""
+        surf = _new_sprite_surface((SCREEN_WIDTH, FLOOR_HEIGHT))
+        self._draw_base(surf, floor_num)
+        return surf
+    
+    def _draw_base(self, surf, floor_num):
+        """층 몸체(그라디언트)와 테두리/라벨 그리기"""
+        if floor_num == 0:
+            base_color = GROUND_SURFACE
+            dark_color = GROUND_SURFACE_DARK
+        else:
+            base_color = GROUND_UNDERGROUND
+            dark_color = GROUND_UNDERGROUND_DARK
+        
+        body = get_gradient_surface((SCREEN_WIDTH - 109, FLOOR_HEIGHT - 10), base_color, dark_color)
+        surf.blit(body, (55, 5))
+        self._draw_border_and_label(surf, floor_num)
+    
+    def _draw_hole(self, surf, hole_start, hole_end):
+        """구멍 하나 그리기"""
+        hole_width = hole_end - hole_start
+        hole_rect = pygame.Rect(hole_start, 0, hole_width, FLOOR_HEIGHT)
+        if hole_rect.right > 55 and hole_rect.left < SCREEN_WIDTH - 55:
+            draw_rounded_rect(surf, HOLE_COLOR, hole_rect, 10, 3, CARD_BORDER)
+            for i in range(FLOOR_HEIGHT - 6):
+                alpha = i / FLOOR_HEIGHT
+                shade = int(23 + 20 * alpha)
+                pygame.draw.line(surf, (shade, shade, shade), (hole_start + 10, 3 + i), (hole_start + hole_width - 10, 3 + i))
+    
+    def _draw_border_and_label(self, surf, floor_num):
+        """층 테두리와 층 라벨(B1, 지상 등) 그리기"""
+        floor_rect = pygame.Rect(55, 5, SCREEN_WIDTH - 110, FLOOR_HEIGHT - 10)
+        pygame.draw.rect(surf, CARD_BORDER, floor_rect, 2, border_radius=8)
+        
+        if floor_num == 0:
+            floor_label = "지상"
+            label_color = SUCCESS
+            label_width = 38
+        elif floor_num == TOTAL_FLOORS - 1:
+            floor_label = "B50"
+            label_color = (255, 192, 203)  # 공주가 있는 층이므로 분홍색 유지
+            label_width = 42
+        else:
+            floor_label = f"B{floor_num}"
+            label_color = TEXT_SECONDARY
+            label_width = 38 if floor_num < 10 else 42
+        
+        label_bg = pygame.Rect(10, FLOOR_HEIGHT // 2 - 12, label_width, 24)
+        draw_rounded_rect(surf, CARD_BG, label_bg, 5)
+        pygame.draw.rect(surf, CARD_BORDER, label_bg, 1, border_radius=5)
+        
+        floor_text = render_text(self.label_size, floor_label, label_color)
+        text_rect = floor_text.get_rect(center=(label_bg.centerx, label_bg.centery))
+        surf.blit(floor_text, text_rect)
+
+# 스프라이트 캐시: 글로우/날개/삽이 몸체 밖으로 나가는 범위만큼 여백을 둔다
+SPRITE_PADDING = 25
+PLAYER_SPRITE_SIZE = (PLAYER_SIZE + 80, PLAYER_SIZE + 50)
+MONSTER_SPRITE_SIZE = (MONSTER_SIZE + 50, MONSTER_SIZE + 60)
+
+# 기믹 글로우 펄스 룩업 테이블: 틱마다 위상 0.1씩 진행, 2π(≈6.28)에서 한 바퀴
+GIMMICK_PULSE_STEPS = 63
+GIMMICK_PULSE_LUT = [int(20 + 10 * abs(math.cos(math.radians(step * 0.1 * 50)))) for step in range(GIMMICK_PULSE_STEPS)]
+
+def _new_sprite_surface(size):
+    """투명 배경 스프라이트 서피스 생성"""
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    surf.fill((0, 0, 0, 0))
+    return surf
+
+def _draw_player_shape(surface, x, y_pos, shovel_angle, is_invisible, is_stunned, speed_state, glows=True, shadows=True):
+    """플레이어 도형 그리기 (shovel_angle이 None이면 대기 자세, 상태 표시 원은 화질과 관계없이 유지)"""
+    width = height = PLAYER_SIZE
+    
+    # 그림자
+    if shadows:
+        shadow_surf = get_scratch_surface((width + 10, 8))
+        pygame.draw.ellipse(shadow_surf, (0, 0, 0, 60), (0, 0, width + 10, 8))
+        surface.blit(shadow_surf, (x - 5, y_pos + height))
+    
+    # 투명화 상태
+    if is_invisible:
+        glow_color = GIMMICK_INVISIBLE + (80,)
+        glow_surf = get_scratch_surface((width + 30, height + 30))
+        pygame.draw.circle(glow_surf, glow_color, (width // 2 + 15, height // 2 + 15), width // 2 + 15)
+        surface.blit(glow_surf, (x - 15, y_pos - 15))
+    
+    # 마비 상태 표시
+    if is_stunned:
+        stun_surf = get_scratch_surface((width + 20, height + 20))
+        pygame.draw.circle(stun_surf, (100, 100, 255, 100), (width // 2 + 10, height // 2 + 10), width // 2 + 10)
+        surface.blit(stun_surf, (x - 10, y_pos - 10))
+    
+    # 속도 효과 표시
+    if speed_state != 0:
+        effect_color = GIMMICK_SPEED if speed_state > 0 else GIMMICK_SLOW
+        effect_surf = get_scratch_surface((width + 20, height + 20))
+        pygame.draw.circle(effect_surf, effect_color + (50,), (width // 2 + 10, height // 2 + 10), width // 2 + 10)
+        surface.blit(effect_surf, (x - 10, y_pos - 10))
+    
+    if shovel_angle is not None and glows:
+        glow_surf = get_scratch_surface((width + 20, height + 20))
+        pygame.draw.circle(glow_surf, WARNING + (50,), (width//2 + 10, height//2 + 10), width//2 + 10)
+        surface.blit(glow_surf, (x - 10, y_pos - 10))
+    
+    body_rect = pygame.Rect(x + 5, y_pos + 20, width - 10, height - 25)
+    draw_rounded_rect(surface, PLAYER_COLOR, body_rect, 8)
+    pygame.draw.circle(surface, (255, 220, 177), (x + width//2, y_pos + 15), 15)
+    pygame.draw.circle(surface, (245, 210, 167), (x + width//2, y_pos + 15), 15, 2)
+    pygame.draw.circle(surface, (50, 50, 50), (x + width//2 - 5, y_pos + 13), 2)
+    pygame.draw.circle(surface, (50, 50, 50), (x + width//2 + 5, y_pos + 13), 2)
+    
+    if shovel_angle is not None:
+        shovel_x = x + width
+        shovel_y = y_pos + 20 + shovel_angle
+        pygame.draw.line(surface, (101, 67, 33), (shovel_x, shovel_y), (shovel_x + 30, shovel_y + 30), 5)
+        pygame.draw.polygon(surface, (156, 163, 175), [(shovel_x + 30, shovel_y + 30), (shovel_x + 45, shovel_y + 35), (shovel_x + 35, shovel_y + 45)])
+    else:
+        pygame.draw.line(surface, (101, 67, 33), (x + width + 5, y_pos + 30), (x + width + 5, y_pos + 55), 5)
+        pygame.draw.polygon(surface, (156, 163, 175), [(x + width + 5, y_pos + 55), (x + width + 15, y_pos + 60), (x + width + 5, y_pos + 65)])
+
+def get_player_frames(is_invisible, is_stunned, speed_state):
+    """플레이어 상태별 프레임 목록 (0: 대기, 1~20: dig_timer % 20 에 해당하는 파기 자세, 현재 화질 기준)"""
+    glows, shadows = RENDER_QUALITY["glows"], RENDER_QUALITY["shadows"]
+    key = ('player', is_invisible, is_stunned, speed_state, glows, shadows)
+    if key in _SPRITE_CACHE:
+        return _SPRITE_CACHE[key]
+    
+    frames = []
+    for shovel_angle in [None] + [i - 10 for i in range(20)]:
+        surf = _new_sprite_surface(PLAYER_SPRITE_SIZE)
+        _draw_player_shape(surf, SPRITE_PADDING, SPRITE_PADDING, shovel_angle, is_invisible, is_stunned, speed_state, glows, shadows)
+        frames.append(surf)
+    
+    _SPRITE_CACHE[key] = frames
+    return frames
+
+def _draw_monster_shape(surface, monster_type, x, y_pos, wing_offset=0, glows=True, shadows=True):
+    """몬스터 도형 그리기"""
+    width = height = MONSTER_SIZE
+    
+    if shadows:
+        shadow_surf = get_scratch_surface((width + 10, 8))
+        pygame.draw.ellipse(shadow_surf, (0, 0, 0, 60), (0, 0, width + 10, 8))
+        surface.blit(shadow_surf, (x - 5, y_pos + height))
+    
+    if monster_type == 'skeleton':
+        if glows:
+            glow_surf = get_scratch_surface((width + 20, height + 20))
+            pygame.draw.circle(glow_surf, SKELETON_COLOR + (30,), (width//2 + 10, height//2 + 10), width//2 + 10)
+            surface.blit(glow_surf, (x - 10, y_pos - 10))
+        
+        pygame.draw.circle(surface, SKELETON_COLOR, (x + width//2, y_pos + 15), 15)
+        pygame.draw.circle(surface, (203, 213, 225), (x + width//2, y_pos + 15), 15, 2)
+        body_rect = pygame.Rect(x + 10, y_pos + 25, width - 20, height - 30)
+        draw_rounded_rect(surface, SKELETON_COLOR, body_rect, 5)
+        pygame.draw.circle(surface, DANGER, (x + 15, y_pos + 12), 4)
+        pygame.draw.circle(surface, DANGER, (x + 35, y_pos + 12), 4)
+        
+    elif monster_type == 'bat':
+        if glows:
+            glow_surf = get_scratch_surface((width + 40, height + 20))
+            pygame.draw.ellipse(glow_surf, BAT_COLOR + (40,), (0, 0, width + 40, height + 20))
+            surface.blit(glow_surf, (x - 20, y_pos + 10))
+        
+        pygame.draw.ellipse(surface, BAT_COLOR, (x + 5, y_pos + 15, width - 10, 25))
+        left_wing = [(x + 5, y_pos + 25), (x - 15, y_pos + 20 + wing_offset), (x + 5, y_pos + 35)]
+        pygame.draw.polygon(surface, BAT_COLOR, left_wing)
+        pygame.draw.polygon(surface, INFO, left_wing, 2)
+        right_wing = [(x + width - 5, y_pos + 25), (x + width + 15, y_pos + 20 + wing_offset), (x + width - 5, y_pos + 35)]
+        pygame.draw.polygon(surface, BAT_COLOR, right_wing)
+        pygame.draw.polygon(surface, INFO, right_wing, 2)
+        
+    elif monster_type == 'zombie':
+        if glows:
+            glow_surf = get_scratch_surface((width + 20, height + 20))
+            pygame.draw.circle(glow_surf, ZOMBIE_COLOR + (40,), (width//2 + 10, height//2 + 10), width//2 + 10)
+            surface.blit(glow_surf, (x - 10, y_pos - 10))
+        
+        body_rect = pygame.Rect(x + 5, y_pos + 20, width - 10, height - 25)
+        draw_rounded_rect(surface, ZOMBIE_COLOR, body_rect, 5)
+        pygame.draw.circle(surface, (52, 211, 153), (x + width//2, y_pos + 15), 15)
+        pygame.draw.circle(surface, ZOMBIE_COLOR, (x + width//2, y_pos + 15), 15, 2)
+        pygame.draw.circle(surface, DANGER, (x + 15, y_pos + 12), 5)
+        pygame.draw.circle(surface, DANGER, (x + 35, y_pos + 12), 5)
+        
+    elif monster_type == 'dracula':
+        if glows:
+            glow_surf = get_scratch_surface((width + 25, height + 25))
+            pygame.draw.circle(glow_surf, DRACULA_COLOR + (50,), (width//2 + 12, height//2 + 12), width//2 + 12)
+            surface.blit(glow_surf, (x - 12, y_pos - 12))
+        
+        # 망토
+        pygame.draw.polygon(surface, (50, 10, 10), [(x, y_pos + 20), (x + width, y_pos + 20), (x + width + 10, y_pos + 50), (x - 10, y_pos + 50)])
+        
+        body_rect = pygame.Rect(x + 8, y_pos + 22, width - 16, height - 27)
+        draw_rounded_rect(surface, DRACULA_COLOR, body_rect, 5)
+        pygame.draw.circle(surface, (245, 220, 177), (x + width//2, y_pos + 15), 15)
+        pygame.draw.circle(surface, DRACULA_COLOR, (x + width//2, y_pos + 15), 15, 2)
+        pygame.draw.circle(surface, (255, 0, 0), (x + 15, y_pos + 12), 4)
+        pygame.draw.circle(surface, (255, 0, 0), (x + 35, y_pos + 12), 4)
+        
+    elif monster_type == 'orc':
+        if glows:
+            glow_surf = get_scratch_surface((width + 22, height + 22))
+            pygame.draw.circle(glow_surf, ORC_COLOR + (45,), (width//2 + 11, height//2 + 11), width//2 + 11)
+            surface.blit(glow_surf, (x - 11, y_pos - 11))
+        
+        body_rect = pygame.Rect(x + 3, y_pos + 18, width - 6, height - 23)
+        draw_rounded_rect(surface, ORC_COLOR, body_rect, 6)
+        pygame.draw.circle(surface, (34, 139, 34), (x + width//2, y_pos + 15), 17)
+        pygame.draw.circle(surface, ORC_COLOR, (x + width//2, y_pos + 15), 17, 2)
+        # 송곳니
+        pygame.draw.polygon(surface, (255, 255, 255), [(x + 18, y_pos + 20), (x + 20, y_pos + 25), (x + 22, y_pos + 20)])
+        pygame.draw.polygon(surface, (255, 255, 255), [(x + 28, y_pos + 20), (x + 30, y_pos + 25), (x + 32, y_pos + 20)])
+        pygame.draw.circle(surface, (255, 50, 50), (x + 15, y_pos + 12), 5)
+        pygame.draw.circle(surface, (255, 50, 50), (x + 35, y_pos + 12), 5)
+
+def get_monster_frames(monster_type):
+    """몬스터 타입별 프레임 목록 (박쥐는 날갯짓 20프레임, 나머지는 1프레임)"""
+    glows, shadows = RENDER_QUALITY["glows"], RENDER_QUALITY["shadows"]
+    key = ('monster', monster_type, glows, shadows)
+    if key in _SPRITE_CACHE:
+        return _SPRITE_CACHE[key]
+    
+    if monster_type == 'bat':
+        wing_offsets = [abs(i - 10) for i in range(20)]
+    else:
+        wing_offsets = [0]
+    
+    by_offset = {}
+    for wing_offset in set(wing_offsets):
+        surf = _new_sprite_surface(MONSTER_SPRITE_SIZE)
+        _draw_monster_shape(surf, monster_type, SPRITE_PADDING, SPRITE_PADDING, wing_offset, glows, shadows)
+        by_offset[wing_offset] = surf
+    frames = [by_offset[offset] for offset in wing_offsets]
+    
+    _SPRITE_CACHE[key] = frames
+    return frames
+
+def get_princess_sprite():
+    """공주 스프라이트 (분홍색 드레스, 좌상단 = 드레스 왼쪽 끝 x, 머리 위 y)"""
+    key = ('princess',)
+    if key not in _SPRITE_CACHE:
+        surf = _new_sprite_surface((51, 56))
+        pygame.draw.circle(surf, (255, 220, 177), (25, 15), 15)
+        pygame.draw.polygon(surf, (255, 192, 203), [(5, 30), (45, 30), (50, 55), (0, 55)])
+        _SPRITE_CACHE[key] = surf
+    return _SPRITE_CACHE[key]
+
+def get_heart_sprite():
+    """하트 스프라이트 (좌상단 = 하트 중심에서 (-18, -10))"""
+    key = ('heart',)
+    if key not in _SPRITE_CACHE:
+        surf = _new_sprite_surface((37, 31))
+        pygame.draw.circle(surf, (255, 0, 127), (10, 10), 10)
+        pygame.draw.circle(surf, (255, 0, 127), (26, 10), 10)
+        pygame.draw.polygon(surf, (255, 0, 127), [(0, 10), (18, 30), (36, 10)])
+        _SPRITE_CACHE[key] = surf
+    return _SPRITE_CACHE[key]
+
+def atlas_source_hash():
+    """아틀라스를 구울 때 사용한 코드 식별값 (그리기 코드가 바뀌면 옛 아틀라스를 쓰지 않도록)"""
+    with open(os.path.abspath(__file__), "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def _decode_atlas_value(sheet, value, surfaces):
+    """아틀라스 색인 값 복원 - {"rect"}: 서피스, {"list"}/{"tuple"}: 묶음, 정수는 그대로"""
+    if isinstance(value, int):
+        return value
+    if "rect" in value:
+        rect = tuple(value["rect"])
+        if rect not in surfaces:
+            surf = sheet.subsurface(rect)
+            if value.get("opaque") and pygame.display.get_surface() is not None:
+                surf = surf.convert()
+            surfaces[rect] = surf
+        return surfaces[rect]
+    if "tuple" in value:
+        return tuple(_decode_atlas_value(sheet, item, surfaces) for item in value["tuple"])
+    return [_decode_atlas_value(sheet, item, surfaces) for item in value["list"]]
+
+def _atlas_key(value):
+    """JSON 배열로 저장한 캐시 키를 원래 튜플로 (문자열/숫자/bool/None은 그대로)"""
+    if isinstance(value, list):
+        return tuple(_atlas_key(item) for item in value)
+    return value
+
+def load_sprite_atlas(image_path=ATLAS_IMAGE_PATH, index_path=ATLAS_INDEX_PATH):
+    """구워 둔 아틀라스로 스프라이트/그라디언트/도형/텍스트 캐시를 미리 채운다 (실패하면 False)"""
+    if not (os.path.exists(image_path) and os.path.exists(index_path)):
+        return False
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("source_hash") != atlas_source_hash():
+            print("⚠️ 스프라이트 아틀라스가 현재 코드와 맞지 않아 사용하지 않습니다. (tools/build_atlas.py로 다시 생성)")
+            return False
+        sheet = pygame.image.load(image_path)
+        if pygame.display.get_surface() is not None:
+            sheet = sheet.convert_alpha()
+        else:
+            # 디스플레이 서피스가 없으면(SDL2 렌더러) 직접 만든 SRCALPHA 서피스와 같은 포맷으로
+            sheet = sheet.convert(pygame.Surface((1, 1), pygame.SRCALPHA))
+        surfaces = {}  # 같은 영역은 같은 서피스 객체로 (텍스처 업로드도 한 번)
+        for entry in index["entries"]:
+            key = _atlas_key(entry["key"])
+            ATLAS_CACHES[entry["cache"]][key] = _decode_atlas_value(sheet, entry["value"], surfaces)
+    except (OSError, ValueError, KeyError, pygame.error) as e:
+        print(f"⚠️ 스프라이트 아틀라스 로드 실패: {e}")
+        return False
+    return True
+
+class WorldChunkCache:
+    """월드 청크 캐시 - 층/구멍/기믹 바닥을 고정 높이 세로 청크로 합성해 바이트 예산 LRU로 보관"""
+    def __init__(self, floors, gimmick_index, floor_cache, budget_bytes=WORLD_CACHE_BUDGET):
+        self.floors = floors
+        self.gimmick_index = gimmick_index
+        self.floor_cache = floor_cache
+        self.budget_bytes = budget_bytes
+        self.chunks = OrderedDict()  # 청크 번호 -> (서피스, 층별 시그니처 목록)
+        self.versions = {}  # 청크 번호 -> 다시 합성된 횟수
+        self.bytes = 0
+        self.chunk_count = (TOTAL_FLOORS + CHUNK_FLOORS - 1) // CHUNK_FLOORS
+    
+    def visible_range(self, camera_y):
+        """화면에 걸치는 청크 번호 범위 [first, last]"""
+        top = camera_y - GAME_FIELD_Y
+        first = max(0, top // CHUNK_HEIGHT)
+        last = min(self.chunk_count - 1, (top + SCREEN_HEIGHT - 1) // CHUNK_HEIGHT)
+        return int(first), int(last)
+    
+    def screen_rect(self, index, camera_y):
+        """청크의 화면 좌표 영역"""
+        return pygame.Rect(0, GAME_FIELD_Y + index * CHUNK_HEIGHT - camera_y, SCREEN_WIDTH, CHUNK_HEIGHT)
+    
+    def get(self, index):
+        """청크 서피스 반환 - 구멍/기믹이 바뀐 층의 띠만 다시 합성"""
+        entry = self.chunks.get(index)
+        if entry is None:
+            surf = _new_sprite_surface((SCREEN_WIDTH, CHUNK_HEIGHT))
+            entry = (surf, [None] * CHUNK_FLOORS)
+            self.chunks[index] = entry
+            self.bytes += SCREEN_WIDTH * CHUNK_HEIGHT * 4
+            self._evict()
+        else:
+            self.chunks.move_to_end(index)
+        
+        surf, signatures = entry
+        changed = False
+        for i in range(CHUNK_FLOORS):
+            floor_num = index * CHUNK_FLOORS + i
+            if floor_num >= TOTAL_FLOORS:
+                break
+            signature = self._signature(floor_num)
+            if signatures[i] != signature:
+                self._render_floor(surf, i, floor_num)
+                signatures[i] = signature
+                changed = True
+        if changed:
+            self.versions[index] = self.versions.get(index, 0) + 1
+        return surf
+    
+    def _signature(self, floor_num):
+        return floor_signature(self.floors[floor_num], self.gimmick_index.on_floor(floor_num))
+    
+    def _render_floor(self, surf, band, floor_num):
+        """청크 안의 층 띠 하나를 다시 합성"""
+        y = band * FLOOR_HEIGHT
+        surf.fill((0, 0, 0, 0), (0, y, SCREEN_WIDTH, FLOOR_HEIGHT))
+        surf.blit(self.floor_cache.get(self.floors[floor_num]), (0, y))
+        for gimmick in self.gimmick_index.on_floor(floor_num):
+            gimmick.draw_base(surf, y)
+    
+    def _evict(self):
+        """예산을 넘으면 가장 오래 안 쓴 청크부터 버린다"""
+        while self.bytes > self.budget_bytes and len(self.chunks) > 1:
+            self.chunks.popitem(last=False)
+            self.bytes -= SCREEN_WIDTH * CHUNK_HEIGHT * 4
+
+class Minimap:
+    """전체 던전 미니맵 - 층별로 축소해 둔 월드 이미지 위에 움직이는 점만 매 프레임 그린다"""
+    def __init__(self, floors, gimmick_index, monsters, floor_cache, monster_engine=None):
+        self.floors = floors
+        self.gimmick_index = gimmick_index
+        self.monsters = monsters
+        self.monster_engine = monster_engine
+        self.floor_cache = floor_cache
+        self.scale = MINIMAP_FLOOR_HEIGHT / FLOOR_HEIGHT
+        self.map_rect = pygame.Rect(0, 0, int(SCREEN_WIDTH * self.scale), TOTAL_FLOORS * MINIMAP_FLOOR_HEIGHT)
+        self.map_rect.topleft = (MINIMAP_RECT.x + 5, MINIMAP_RECT.y + 5)
+        self.image = pygame.Surface(self.map_rect.size)
+        self.image.fill(BG_DARKER)
+        self.band = pygame.Surface((SCREEN_WIDTH, FLOOR_HEIGHT))  # 층 하나를 원래 크기로 그려 축소하는 작업용 (다시 그릴 때마다 재사용)
+        self.hole_versions = [None] * TOTAL_FLOORS  # 층별로 이미 축소해 둔 구멍/기믹 버전
+        self.gimmick_versions = [None] * TOTAL_FLOORS
+    
+    def update_image(self):
+        """구멍/기믹 버전이 바뀐 층만 다시 축소해서 미니맵 이미지에 반영"""
+        hole_versions = [floor['holes'].version for floor in self.floors]
+        gimmick_versions = self.gimmick_index.versions
+        if hole_versions == self.hole_versions and gimmick_versions == self.gimmick_versions:
+            return
+        for floor_num in range(TOTAL_FLOORS):
+            if (hole_versions[floor_num] == self.hole_versions[floor_num]
+                    and gimmick_versions[floor_num] == self.gimmick_versions[floor_num]):
+                continue
+            
+            band = self.band
+            band.fill(BG_DARKER)
+            self.floor_cache.render_into(band, self.floors[floor_num])
+            for gimmick in self.gimmick_index.on_floor(floor_num):
+                gimmick.draw_base(band, 0)
+            small = pygame.transform.smoothscale(band, (self.map_rect.width, MINIMAP_FLOOR_HEIGHT))
+            # 축소된 띠의 가장자리는 반투명이라 이전 그림 위가 아닌 빈 배경 위에 올린다
+            row = pygame.Rect(0, floor_num * MINIMAP_FLOOR_HEIGHT, self.map_rect.width, MINIMAP_FLOOR_HEIGHT)
+            self.image.fill(BG_DARKER, row)
+            self.image.blit(small, row)
+        self.hole_versions = hole_versions
+        self.gimmick_versions = list(gimmick_versions)
+    
+    def camera_y_at(self, pos):
+        """미니맵 클릭 위치를 화면 중앙에 오게 하는 카메라 y"""
+        world_y = (pos[1] - self.map_rect.y) / self.scale
+        return int(world_y - (SCREEN_HEIGHT - GAME_FIELD_Y) // 2)
+    
+    def draw(self, surface, camera_y, player):
+        """미니맵 패널 그리기 (그린 영역 반환)"""
+        self.update_image()
+        draw_rounded_rect(surface, CARD_BG, MINIMAP_RECT, 8, 2, CARD_BORDER)
+        surface.blit(self.image, self.map_rect)
+        
+        # 몬스터 점
+        map_x, map_y = self.map_rect.topleft
+        engine = self.monster_engine
+        if engine is not None:
+            # 엔진 배열에서 바로 좌표를 구해 3x3 점을 한 번에 찍는다 (Monster 객체 동기화 없이)
+            dot_x = map_x + ((engine.x + engine.width // 2) * self.scale).astype(np.intp)
+            dot_y = map_y + engine.floor.astype(np.intp) * MINIMAP_FLOOR_HEIGHT + MINIMAP_FLOOR_HEIGHT // 2
+            pixels = pygame.surfarray.pixels3d(surface)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    pixels[dot_x + dx, dot_y + dy] = DANGER
+            del pixels  # 서피스 잠금 해제
+        else:
+            for monster in self.monsters:
+                dot_x = map_x + int((monster.x + monster.width // 2) * self.scale)
+                dot_y = map_y + monster.floor * MINIMAP_FLOOR_HEIGHT + MINIMAP_FLOOR_HEIGHT // 2
+                surface.fill(DANGER, (dot_x - 1, dot_y - 1, 3, 3))
+        
+        # 플레이어 점
+        dot_x = map_x + int((player.x + player.width // 2) * self.scale)
+        dot_y = map_y + player.current_floor * MINIMAP_FLOOR_HEIGHT + MINIMAP_FLOOR_HEIGHT // 2
+        surface.fill(PLAYER_COLOR, (dot_x - 2, dot_y - 2, 5, 5))
+        
+        # 현재 카메라가 보고 있는 영역
+        view_rect = pygame.Rect(
+            map_x,
+            map_y + int(camera_y * self.scale),
+            self.map_rect.width,
+            int((SCREEN_HEIGHT - GAME_FIELD_Y) * self.scale),
+        ).clip(self.map_rect)
+        pygame.draw.rect(surface, TEXT_PRIMARY, view_rect, 1)
+        return MINIMAP_RECT
+
+def ambient_for_floor(floor_num):
+    """층 깊이별 주변 밝기 (지상 255, LIGHT_MIN_AMBIENT부터 LIGHT_AMBIENT_STEP 간격으로 양자화 - B50이 정확히 최솟값)"""
+    if floor_num <= 0:
+        return 255
+    level = 255 - (255 - LIGHT_MIN_AMBIENT) * floor_num // (TOTAL_FLOORS - 1)
+    return level - (level - LIGHT_MIN_AMBIENT) % LIGHT_AMBIENT_STEP
+
+def get_light_blob(radius, ambient):
+    """원형 빛 마스크 (가운데 흰색 -> 가장자리 주변 밝기, BLEND_MULT용 불투명 서피스)"""
+    key = ('light', radius, ambient)
+    if key not in _SPRITE_CACHE:
+        surf = pygame.Surface((radius * 2, radius * 2))
+        surf.fill((ambient, ambient, ambient))
+        for r in range(radius, 0, -2):
+            t = 1 - r / radius
+            level = int(ambient + (255 - ambient) * min(1.0, t * 1.6))
+            pygame.draw.circle(surf, (level, level, level), (radius, radius), r)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        _SPRITE_CACHE[key] = surf
+    return _SPRITE_CACHE[key]
+
+class LightingLayer:
+    """조명 마스크 - 캐시된 빛 원형 + 주변 밝기 채우기를 BLEND_MULT로 곱한다 (엔티티와 HUD 사이)"""
+    def __init__(self):
+        self.ambient = 255
+        self.radius = LIGHT_RADIUS
+        self.center = (0, 0)
+        self.blob = None
+    
+    def set_state(self, ambient, radius, center):
+        """이번 프레임 상태 반영 - 반지름/밝기가 바뀐 경우에만 마스크를 다시 고른다"""
+        radius = max(LIGHT_RADIUS_STEP, int(radius) // LIGHT_RADIUS_STEP * LIGHT_RADIUS_STEP)
+        if self.blob is None or (ambient, radius) != (self.ambient, self.radius):
+            self.blob = get_light_blob(radius, ambient)
+        self.ambient = ambient
+        self.radius = radius
+        self.center = center
+    
+    def state(self):
+        return (self.ambient, self.radius, self.center)
+    
+    def bounds(self):
+        """빛 원형의 화면 영역"""
+        rect = self.blob.get_rect(center=self.center)
+        return rect.clip(FIELD_RECT)
+    
+    def _split(self, rect):
+        """rect를 (빛 원형과 겹치는 부분, 나머지 주변 영역 목록)으로 나눈다"""
+        rect = rect.clip(FIELD_RECT)
+        blob_rect = self.blob.get_rect(center=self.center)
+        inner = rect.clip(blob_rect)
+        if inner.width == 0 or inner.height == 0:
+            return None, [rect] if rect.width and rect.height else []
+        outer = [
+            pygame.Rect(rect.left, rect.top, rect.width, inner.top - rect.top),
+            pygame.Rect(rect.left, inner.bottom, rect.width, rect.bottom - inner.bottom),
+            pygame.Rect(rect.left, inner.top, inner.left - rect.left, inner.height),
+            pygame.Rect(inner.right, inner.top, rect.right - inner.right, inner.height),
+        ]
+        inner_area = inner.move(-blob_rect.x, -blob_rect.y)
+        return (inner, inner_area), [r for r in outer if r.width > 0 and r.height > 0]
+    
+    def apply(self, surface, rect):
+        """화면의 rect 영역에 조명을 곱한다 (빛 원형 blit 1회 + 주변 채우기)"""
+        inner, outer = self._split(pygame.Rect(rect))
+        if inner is not None:
+            surface.blit(self.blob, inner[0], inner[1], special_flags=pygame.BLEND_MULT)
+        ambient = (self.ambient, self.ambient, self.ambient)
+        for r in outer:
+            surface.fill(ambient, r, special_flags=pygame.BLEND_MULT)
+    
+    def draw_textured(self, renderer, textures):
+        """SDL2 렌더러용 - 같은 마스크를 곱하기(MOD) 블렌드로 그린다"""
+        inner, outer = self._split(FIELD_RECT)
+        if inner is not None:
+            texture = textures.get(self.blob)
+            texture.blend_mode = SDL_BLENDMODE_MOD
+            texture.draw(srcrect=inner[1], dstrect=inner[0])
+        renderer.draw_blend_mode = SDL_BLENDMODE_MOD
+        renderer.draw_color = (self.ambient, self.ambient, self.ambient, 255)
+        for r in outer:
+            renderer.fill_rect(r)
+        renderer.draw_blend_mode = SDL_BLENDMODE_NONE
+
+def get_particle_dots(color):
+    """파티클 점 스프라이트 (3x3, 흐려지는 단계별 4장: 0=가장 흐림)"""
+    key = ('particle', tuple(color))
+    if key not in _SPRITE_CACHE:
+        dots = []
+        for alpha in (70, 130, 190, 255):
+            dot = _new_sprite_surface((3, 3))
+            dot.fill(tuple(color) + (alpha,), (1, 0, 1, 3))
+            dot.fill(tuple(color) + (alpha,), (0, 1, 3, 1))
+            dots.append(dot)
+        _SPRITE_CACHE[key] = dots
+    return _SPRITE_CACHE[key]
+
+class ParticleSystem:
+    """배열 기반 파티클 풀 - 위치/속도/수명/색 인덱스를 미리 할당한 NumPy 배열에 보관하고 한꺼번에 갱신
+    
+    이미터마다 배열의 고정 구간을 링 버퍼로 써서 개수가 하드 캡을 넘지 않는다 (넘치면 가장 오래된 것부터 덮어씀).
+    좌표는 월드 기준(y에 camera_y를 더한 값)이라 카메라가 움직여도 그대로 둔다."""
+    def __init__(self, rng=None):
+        capacity = sum(slots for slots, _, _ in PARTICLE_EMITTERS.values())
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.life = np.zeros(capacity, np.int16)  # 남은 틱 (0 = 빈 슬롯)
+        self.color = np.zeros(capacity, np.uint8)  # palette 인덱스
+        self.gravity = np.zeros(capacity, np.float32)
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.density = 1.0  # 방출 개수 배율 (화질 단계)
+        
+        self.slices = {}  # 이미터 -> (시작, 슬롯 수, 최대 수명)
+        self.heads = {}  # 이미터 -> 다음에 쓸 위치
+        start = 0
+        for name, (slots, gravity, max_life) in PARTICLE_EMITTERS.items():
+            self.slices[name] = (start, slots, max_life)
+            self.heads[name] = 0
+            self.gravity[start:start + slots] = gravity
+            start += slots
+        
+        # 색상표 + 색상별 점 스프라이트 (인덱스 = 색 * 4 + 흐림 단계)
+        self.palette = DIRT_COLORS + [DANGER, TEXT_PRIMARY, WARNING]
+        self.palette += [gimmick_color(gimmick_type) for gimmick_type in ('teleport', 'invisible', 'slow', 'speed', 'stun')]
+        self.dots = [dot for color in self.palette for dot in get_particle_dots(color)]
+        self.active = False
+    
+    def color_indices(self, colors):
+        return [self.palette.index(tuple(color)) for color in colors]
+    
+    def emit(self, emitter, count, x, y, colors, speed=(1.0, 3.0), angle=(0.0, 2 * math.pi), spread=(0, 0)):
+        """파티클 count개 방출 (x, y: 월드 좌표, angle: 라디안 범위(0 = 오른쪽, 아래가 +), spread: 위치 흩어짐 반폭)"""
+        start, slots, max_life = self.slices[emitter]
+        # 배율을 곱한 소수 부분은 확률로 반올림 (틱마다 몇 개씩 뿌리는 흙도 평균 밀도가 맞도록)
+        count = min(int(count * self.density + self.rng.random()), slots)
+        if count <= 0:
+            return
+        head = self.heads[emitter]
+        idx = start + (head + np.arange(count)) % slots
+        self.heads[emitter] = (head + count) % slots
+        
+        rng = self.rng
+        self.pos[idx, 0] = x + rng.uniform(-spread[0], spread[0], count) if spread[0] else x
+        self.pos[idx, 1] = y + rng.uniform(-spread[1], spread[1], count) if spread[1] else y
+        theta = rng.uniform(angle[0], angle[1], count)
+        magnitude = rng.uniform(speed[0], speed[1], count)
+        self.vel[idx, 0] = np.cos(theta) * magnitude
+        self.vel[idx, 1] = np.sin(theta) * magnitude
+        self.life[idx] = rng.integers(max_life // 2, max_life + 1, count)
+        self.color[idx] = rng.choice(self.color_indices(colors), count)
+        self.active = True
+    
+    def update(self):
+        """전체 파티클 한 틱 진행 (살아 있는 슬롯만 수명 감소)"""
+        if not self.active:
+            return
+        self.vel[:, 1] += self.gravity
+        self.vel *= PARTICLE_DRAG
+        self.pos += self.vel
+        np.subtract(self.life, 1, out=self.life, where=self.life > 0)
+        self.active = bool(self.life.any())
+    
+    def draw(self, surface, camera_y):
+        """이미터별로 살아 있는 파티클을 점 스프라이트로 한 번에 blit (이미터별 그린 영역 목록 반환)"""
+        rects = []
+        if not self.active:
+            return rects
+        for start, slots, _ in self.slices.values():
+            life = self.life[start:start + slots]
+            idx = np.flatnonzero(life)
+            if len(idx) == 0:
+                continue
+            xs = self.pos[start + idx, 0].astype(np.int32) - 1
+            ys = (self.pos[start + idx, 1] - camera_y).astype(np.int32) - 1
+            visible = (xs > -3) & (xs < SCREEN_WIDTH) & (ys >= GAME_FIELD_Y) & (ys < SCREEN_HEIGHT)
+            if not visible.any():
+                continue
+            idx, xs, ys = idx[visible], xs[visible], ys[visible]
+            sprite_ids = self.color[start + idx].astype(np.int32) * 4 + np.minimum(life[idx] // PARTICLE_FADE_TICKS, 3)
+            dots = self.dots
+            surface.fblits([(dots[i], pos) for i, pos in zip(sprite_ids.tolist(), zip(xs.tolist(), ys.tolist()))])
+            left, top = int(xs.min()), int(ys.min())
+            rects.append(pygame.Rect(left, top, int(xs.max()) - left + 3, int(ys.max()) - top + 3))
+        return rects
+
+def parse_quality_setting(value):
+    """화질 설정 문자열 -> 고정할 단계 번호 (auto이거나 알 수 없으면 None)"""
+    names = [name for name, _ in QUALITY_TIERS]
+    if value in names:
+        return names.index(value)
+    if value.isdigit() and int(value) < len(QUALITY_TIERS):
+        return int(value)
+    if value != "auto":
+        print(f"⚠️ 알 수 없는 화질 설정 '{value}' - auto로 동작합니다.")
+    return None
+
+class QualityGovernor:
+    """프레임 작업 시간을 보고 화질 단계를 조절 (내리는 기준과 올리는 기준을 떨어뜨려 오락가락하지 않게)"""
+    def __init__(self, setting="auto", window_ms=QUALITY_WINDOW_MS):
+        self.pinned = parse_quality_setting(setting)
+        self.tier = self.pinned if self.pinned is not None else 0
+        self.window_ms = window_ms
+        self.samples = deque()  # (작업 시간, 프레임 간격) ms
+        self.span_ms = 0.0  # samples에 담긴 프레임 간격 합
+        self.cooldown_ms = 0.0
+    
+    @property
+    def name(self):
+        return QUALITY_TIERS[self.tier][0]
+    
+    def pin(self, tier):
+        """단계 고정 (None이면 자동)"""
+        self.pinned = tier
+        if tier is not None:
+            self.tier = tier
+        self.samples.clear()
+        self.span_ms = 0.0
+    
+    def record(self, work_ms, frame_ms):
+        """한 프레임의 작업 시간과 프레임 간격(ms) 기록 - 최근 window_ms 동안의 평균 작업 시간으로 판단, 단계가 바뀌면 True"""
+        if self.pinned is not None:
+            return False
+        if self.cooldown_ms > 0:
+            # 단계를 바꾼 직후(캐시 다시 굽기 등)의 프레임은 평균에 넣지 않는다
+            self.cooldown_ms -= frame_ms
+            return False
+        self.samples.append((work_ms, frame_ms))
+        self.span_ms += frame_ms
+        while self.span_ms - self.samples[0][1] >= self.window_ms:
+            self.span_ms -= self.samples.popleft()[1]
+        if self.span_ms < self.window_ms:
+            return False
+        
+        budget = QUALITY_BUDGET_MS
+        average = sum(work for work, _ in self.samples) / len(self.samples)
+        if average > budget * QUALITY_DOWN_RATIO and self.tier < len(QUALITY_TIERS) - 1:
+            self.tier += 1
+        elif average < budget * QUALITY_UP_RATIO and self.tier > 0:
+            self.tier -= 1
+        else:
+            return False
+        self.samples.clear()
+        self.span_ms = 0.0
+        self.cooldown_ms = QUALITY_COOLDOWN_MS
+        return True
+
+class RenderLayer:
+    """합성용 레이어 - 화면 크기 서피스와 이번 프레임의 더티 영역 목록"""
+    def __init__(self, opaque=False):
+        if opaque:
+            self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert() if opaque else self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self.dirty = []
+    
+    def mark(self, rect):
+        """더티 영역 추가 (화면 밖은 잘라낸다)"""
+        rect = pygame.Rect(rect).clip(SCREEN_RECT)
+        if rect.width > 0 and rect.height > 0:
+            self.dirty.append(rect)
+    
+    def mark_all(self):
+        self.dirty = [SCREEN_RECT.copy()]
+    
+    def clear(self, rect=None):
+        """투명하게 지우기 (rect가 없으면 전체)"""
+        if rect is None:
+            self.surface.fill((0, 0, 0, 0))
+            self.mark_all()
+        else:
+            self.surface.fill((0, 0, 0, 0), rect)
+            self.mark(rect)
+    
+    def take_dirty(self):
+        dirty = self.dirty
+        self.dirty = []
+        return dirty
+
+def merge_rects(rects):
+    """겹치는 사각형을 합쳐 표시 영역 수를 줄인다 (합친 넓이가 늘어나지 않는 경우만)"""
+    merged = []
+    for rect in rects:
+        for i, other in enumerate(merged):
+            if other.colliderect(rect):
+                union = other.union(rect)
+                if union.w * union.h <= other.w * other.h + rect.w * rect.h:
+                    merged[i] = union
+                    break
+        else:
+            merged.append(rect.copy())
+    return merged
+
+class Compositor:
+    """레이어 합성기 - 월드/엔티티/HUD/오버레이 레이어의 더티 영역만 다시 합성해 표시"""
+    def __init__(self, screen):
+        self.screen = screen
+        self.world = RenderLayer(opaque=True)  # 배경 + 층 (정적)
+        self.entities = RenderLayer()  # 기믹, 몬스터, 플레이어, 공주
+        self.hud = RenderLayer()  # 상단 UI
+        self.overlay = RenderLayer()  # 게임오버/이름 입력/클리어 화면
+        self.entity_target = self.entities.surface  # 엔티티 draw 코드가 그리는 대상
+        self.overlay_active = False
+        self.full_redraw = True
+        self._entity_rects = []  # 이전 프레임에 엔티티를 그린 영역
+        self.lighting = None
+        self._light_state = None
+        self._light_rect = None
+    
+    def invalidate(self):
+        """다음 present에서 화면 전체를 다시 합성"""
+        self.full_redraw = True
+    
+    def begin_entities(self):
+        """이전 프레임의 엔티티 영역을 지우고 더티로 표시"""
+        for rect in self._entity_rects:
+            self.entities.clear(rect)
+        self._entity_rects = []
+    
+    def add_entity_rect(self, rect):
+        """이번 프레임에 엔티티를 그린 영역 등록"""
+        if rect is not None:
+            self._entity_rects.append(pygame.Rect(rect))
+            self.entities.mark(rect)
+    
+    def set_overlay_active(self, active):
+        if active != self.overlay_active:
+            self.overlay_active = active
+            self.overlay.clear()
+    
+    def set_lighting(self, lighting):
+        """이번 프레임 조명 (None이면 끔) - 빛만 움직였으면 이전/현재 빛 영역만 다시 합성"""
+        state = lighting.state() if lighting is not None else None
+        if state != self._light_state:
+            if state is None or self._light_state is None or state[:2] != self._light_state[:2]:
+                self.full_redraw = True
+            else:
+                self.world.mark(self._light_rect)
+                self.world.mark(lighting.bounds())
+            self._light_state = state
+            self._light_rect = lighting.bounds() if lighting is not None else None
+        self.lighting = lighting
+    
+    def present(self):
+        """더티 영역만 화면에 합성하고 display.update로 표시"""
+        layers = [self.world, self.entities, self.hud, self.overlay]
+        if self.full_redraw:
+            for layer in layers:
+                layer.take_dirty()
+            rects = [SCREEN_RECT.copy()]
+            self.full_redraw = False
+        else:
+            rects = []
+            for layer in layers:
+                rects.extend(layer.take_dirty())
+            rects = merge_rects(rects)
+        
+        for rect in rects:
+            self.screen.blit(self.world.surface, rect, rect)
+            self.screen.blit(self.entities.surface, rect, rect)
+            if self.lighting is not None:
+                self.lighting.apply(self.screen, rect)
+            self.screen.blit(self.hud.surface, rect, rect)
+            if self.overlay_active:
+                self.screen.blit(self.overlay.surface, rect, rect)
+        
+        if rects:
+            pygame.display.update(rects)
+
+def choose_render_backend(requested):
+    """요청한 렌더링 백엔드를 쓸 수 있으면 그대로, 아니면 'surface' 반환"""
+    if requested in ("sdl2", "sdl2-software"):
+        if sdl2_video is not None and not IS_WEB_BUILD:
+            return requested
+        print("⚠️ SDL2 렌더러를 사용할 수 없어 기본 렌더링으로 실행합니다.")
+    elif requested != "surface":
+        print(f"⚠️ 알 수 없는 렌더링 백엔드 '{requested}' - 기본 렌더링으로 실행합니다.")
+    return "surface"
+
+class TextureCache:
+    """서피스 -> 텍스처 캐시 (캐시된 스프라이트/글로우/배경은 한 번만 업로드)"""
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.textures = {}  # id(서피스) -> (서피스, 텍스처) - 서피스를 붙잡아 두어 id 재사용을 막는다
+    
+    def get(self, surface):
+        entry = self.textures.get(id(surface))
+        if entry is None:
+            entry = (surface, sdl2_video.Texture.from_surface(self.renderer, surface))
+            self.textures[id(surface)] = entry
+        return entry[1]
+
+class TextureTarget:
+    """서피스 대신 넘기는 그리기 대상 - blit을 받아 캐시된 텍스처로 렌더러에 바로 그린다"""
+    def __init__(self, textures):
+        self.textures = textures
+    
+    def blit(self, source, dest):
+        rect = pygame.Rect(dest[0], dest[1], source.get_width(), source.get_height())
+        self.textures.get(source).draw(dstrect=rect)
+        return rect
+    
+    def fblits(self, blit_sequence):
+        for source, dest in blit_sequence:
+            self.blit(source, dest)
+
+class TextureCompositor:
+    """SDL2 Renderer 합성기 - 월드/엔티티는 캐시된 텍스처로 매 프레임 그리고, HUD/오버레이는 바뀐 영역만 텍스처에 올린다"""
+    def __init__(self, window, accelerated):
+        self.renderer = sdl2_video.Renderer(window, accelerated=-1 if accelerated else 0)
+        self.textures = TextureCache(self.renderer)
+        self.entity_target = TextureTarget(self.textures)
+        self.hud = RenderLayer()
+        self.overlay = RenderLayer()
+        self._hud_texture = sdl2_video.Texture.from_surface(self.renderer, self.hud.surface)
+        self._overlay_texture = sdl2_video.Texture.from_surface(self.renderer, self.overlay.surface)
+        self._chunk_textures = {}  # 청크 번호 -> [서피스, 버전, 텍스처]
+        self.overlay_active = False
+        self.full_redraw = True
+        self.lighting = None
+    
+    def invalidate(self):
+        """다음 present에서 HUD/오버레이 텍스처 전체를 다시 업로드"""
+        self.full_redraw = True
+    
+    def begin_entities(self):
+        # 매 프레임 화면 전체를 다시 그리므로 이전 영역을 지울 필요가 없다
+        pass
+    
+    def add_entity_rect(self, rect):
+        pass
+    
+    def set_lighting(self, lighting):
+        self.lighting = lighting
+    
+    def set_overlay_active(self, active):
+        if active != self.overlay_active:
+            self.overlay_active = active
+            self.overlay.clear()
+    
+    def draw_world(self, background, world_chunks, camera_y):
+        """배경 + 보이는 월드 청크 (청크가 다시 합성됐을 때만 텍스처 갱신)"""
+        self.textures.get(background).draw()
+        first, last = world_chunks.visible_range(camera_y)
+        for index in range(first, last + 1):
+            chunk = world_chunks.get(index)
+            version = world_chunks.versions[index]
+            entry = self._chunk_textures.get(index)
+            if entry is None or entry[0] is not chunk:
+                entry = [chunk, version, sdl2_video.Texture.from_surface(self.renderer, chunk)]
+                self._chunk_textures[index] = entry
+            elif entry[1] != version:
+                entry[2].update(chunk)
+                entry[1] = version
+            entry[2].draw(dstrect=world_chunks.screen_rect(index, camera_y))
+        
+        # LRU에서 빠진 청크의 텍스처도 버린다
+        for index in [i for i in self._chunk_textures if i not in world_chunks.chunks]:
+            del self._chunk_textures[index]
+    
+    def present(self):
+        """HUD/오버레이의 더티 영역만 텍스처에 올리고 위에 합성해 표시"""
+        for layer, texture in ((self.hud, self._hud_texture), (self.overlay, self._overlay_texture)):
+            rects = layer.take_dirty()
+            if self.full_redraw:
+                rects = [SCREEN_RECT]
+            for rect in merge_rects(rects):
+                # area를 Rect로 넘기면 위치가 무시되어 튜플로 넘긴다 (pygame-ce 2.5)
+                texture.update(layer.surface.subsurface(rect), tuple(rect))
+        self.full_redraw = False
+        
+        if self.lighting is not None:
+            self.lighting.draw_textured(self.renderer, self.textures)
+        self._hud_texture.draw()
+        if self.overlay_active:
+            self._overlay_texture.draw()
+        self.renderer.present()
+
+def gimmick_color(gimmick_type):
+    """기믹 타입별 색상"""
+    colors = {
+        'teleport': GIMMICK_TELEPORT,
+        'invisible': GIMMICK_INVISIBLE,
+        'slow': GIMMICK_SLOW,
+        'speed': GIMMICK_SPEED,
+        'stun': GIMMICK_STUN
+    }
+    return colors.get(gimmick_type, (255, 255, 255))
+
+def get_gimmick_glow_frames(gimmick_type):
+    """기믹 글로우 프레임 링 (펄스 단계별 (서피스, 오프셋), 같은 크기는 서피스 공유)"""
+    key = ('gimmick_glow', gimmick_type)
+    if key in _SPRITE_CACHE:
+        return _SPRITE_CACHE[key]
+    
+    width = 80
+    color = gimmick_color(gimmick_type)
+    by_size = {}
+    for pulse_size in set(GIMMICK_PULSE_LUT):
+        surf = _new_sprite_surface((width + pulse_size, FLOOR_HEIGHT + pulse_size))
+        surf.fill(color + (50,))
+        # 가운데 바닥 영역은 비워 둔다
+        surf.fill((0, 0, 0, 0), (pulse_size // 2, pulse_size // 2, width, FLOOR_HEIGHT))
+        by_size[pulse_size] = (surf, pulse_size // 2)
+    frames = [by_size[pulse_size] for pulse_size in GIMMICK_PULSE_LUT]
+    
+    _SPRITE_CACHE[key] = frames
+    return frames
+
 class Gimmick:
     """기믹 클래스"""
     def __init__(self, floor_num, gimmick_type, x_pos):
@@ -123,49 +1582,38 @@ class Gimmick:
         self.x = x_pos
         self.width = 80
         self.is_active = True
-        self.glow_pulse = 0
         
     def get_color(self):
         """기믹 타입별 색상"""
-        colors = {
-            'teleport': GIMMICK_TELEPORT,
-            'invisible': GIMMICK_INVISIBLE,
-            'slow': GIMMICK_SLOW,
-            'speed': GIMMICK_SPEED,
-            'stun': GIMMICK_STUN
-        }
-        return colors.get(self.type, (255, 255, 255))
+        return gimmick_color(self.type)
     
-    def draw(self, screen, camera_y):
-        """기믹 그리기"""
+    def draw(self, screen, camera_y, anim_tick):
+        """기믹 글로우 그리기 (공유 애니메이션 시계로 캐시된 프레임을 골라 blit, 그린 영역 반환)"""
         if not self.is_active:
-            return
+            return None
             
         y_pos = GAME_FIELD_Y + self.floor * FLOOR_HEIGHT - camera_y
         
         # 화면에 보이는지 확인
         if not (GAME_FIELD_Y - FLOOR_HEIGHT <= y_pos <= SCREEN_HEIGHT):
-            return
-        
-        # 글로우 펄스 애니메이션
-        self.glow_pulse = (self.glow_pulse + 0.1) % (3.14 * 2)
-        pulse_size = int(20 + 10 * abs(pygame.math.Vector2(1, 0).rotate(self.glow_pulse * 50).x))
+            return None
         
-        # 글로우 효과
-        glow_surf = pygame.Surface((self.width + pulse_size, FLOOR_HEIGHT + pulse_size), pygame.SRCALPHA)
-        color = self.get_color()
-        pygame.draw.rect(glow_surf, color + (50,), (0, 0, self.width + pulse_size, FLOOR_HEIGHT + pulse_size))
-        screen.blit(glow_surf, (self.x - pulse_size // 2, y_pos - pulse_size // 2))
-        
-        # 기믹 영역 표시
+        # 글로우 펄스 애니메이션 (바닥은 월드 청크에 그려지므로 테두리 부분만)
+        if not RENDER_QUALITY["glows"]:
+            return None
+        glow_surf, offset = get_gimmick_glow_frames(self.type)[anim_tick % GIMMICK_PULSE_STEPS]
+        return screen.blit(glow_surf, (self.x - offset, y_pos - offset))
+    
+    def draw_base(self, surface, y_pos):
+        """기믹 바닥 영역 (정적) 그리기"""
         gimmick_rect = pygame.Rect(self.x, y_pos, self.width, FLOOR_HEIGHT)
-        pygame.draw.rect(screen, color + (100,), gimmick_rect)
-        draw_rounded_rect(screen, color + (150,), gimmick_rect, 5, 2, color)
+        pygame.draw.rect(surface, self.get_color(), gimmick_rect)
 
 class Player:
     """플레이어 클래스"""
     def __init__(self, x, y):
         self.x = x
+        self.prev_x = x  # 직전 틱의 x (그리기 보간용)
         self.y = y
         self.width = PLAYER_SIZE
         self.height = PLAYER_SIZE
@@ -179,6 +1627,7 @@ class Player:
         # 상태 효과
         self.is_invisible = False
         self.invisible_end_floor = 0
+        self.effects = []  # 화면 효과용 이벤트 (종류, 중심 x, 층, 세부) - Game이 매 틱 가져간다
         self.is_stunned = False
         self.stun_timer = 0
         self.speed_effect_timer = 0
@@ -200,14 +1649,12 @@ class Player:
             return False
         
         if self.current_floor < TOTAL_FLOORS - 1:
-            current_holes = floors[self.current_floor]['holes']
-            for hole_start, hole_end in current_holes:
-                if hole_start <= self.x + self.width // 2 <= hole_end:
-                    self.current_floor += 1
-                    # 투명화 효과 체크
-                    if self.is_invisible and self.current_floor >= self.invisible_end_floor:
-                        self.is_invisible = False
-                    return True
+            if floors[self.current_floor]['holes'].contains(self.x + self.width // 2):
+                self.current_floor += 1
+                # 투명화 효과 체크
+                if self.is_invisible and self.current_floor >= self.invisible_end_floor:
+                    self.is_invisible = False
+                return True
         return False
     
     def jump(self):
@@ -220,39 +1667,33 @@ class Player:
             return True
         return False
     
-    def start_digging(self, floors, gimmicks):
+    def start_digging(self, floors, gimmick_index):
         """땅굴 파기"""
         if self.is_stunned:
             return
         
         if not self.is_digging:
-            current_holes = floors[self.current_floor]['holes']
             player_center = self.x + self.width // 2
             
             # 기믹 체크 (구멍 유무와 관계없이 먼저 체크)
-            for gimmick in gimmicks:
-                if gimmick.floor == self.current_floor and gimmick.is_active:
-                    if gimmick.x <= player_center <= gimmick.x + gimmick.width:
-                        self.activate_gimmick(gimmick)
-                        # 기믹을 획득했으므로 파기 시작
-                        self.is_digging = True
-                        self.dig_timer = self.dig_duration
-                        return
+            gimmick = gimmick_index.at(self.current_floor, player_center)
+            if gimmick is not None:
+                gimmick_index.remove(gimmick)
+                self.activate_gimmick(gimmick)
+                # 기믹을 획득했으므로 파기 시작
+                self.is_digging = True
+                self.dig_timer = self.dig_duration
+                return
             
             # 기믹이 없는 경우, 일반 파기 체크
-            already_dug = False
-            for hole_start, hole_end in current_holes:
-                if hole_start <= player_center <= hole_end:
-                    already_dug = True
-                    break
-            
-            if not already_dug:
+            if not floors[self.current_floor]['holes'].contains(player_center):
                 self.is_digging = True
                 self.dig_timer = self.dig_duration
     
     def activate_gimmick(self, gimmick):
         """기믹 활성화 - 최신 효과로 대체"""
         gimmick.is_active = False
+        self.effects.append(('gimmick', gimmick.x + gimmick.width // 2, gimmick.floor, gimmick.type))
         
         if gimmick.type == 'teleport':
             # 순간이동: 4층 아래로
@@ -290,7 +1731,8 @@ class Player:
                 hole_margin = 10
                 hole_start = self.x - hole_margin
                 hole_end = self.x + self.width + hole_margin
-                floors[self.current_floor]['holes'].append((hole_start, hole_end))
+                floors[self.current_floor]['holes'].add(hole_start, hole_end)
+                self.effects.append(('hole', self.x + self.width // 2, self.current_floor, None))
         
         # 마비 타이머
         if self.is_stunned:
@@ -304,99 +1746,105 @@ class Player:
             if self.speed_effect_timer <= 0:
                 self.speed_multiplier = 1.0
     
-    def draw(self, screen, camera_y):
-        """플레이어 그리기"""
+    def render_x(self, alpha):
+        """직전 틱과 현재 틱 사이 보간 위치 (alpha: 0~1)"""
+        return self.prev_x + (self.x - self.prev_x) * alpha
+    
+    def draw(self, screen, camera_y, alpha=1.0):
+        """플레이어 그리기 (캐시된 스프라이트 프레임 blit, 그린 영역 반환)"""
         y_pos = GAME_FIELD_Y + self.current_floor * FLOOR_HEIGHT + 10 - camera_y
         
-        # 그림자
-        shadow_surf = pygame.Surface((self.width + 10, 8), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf, (0, 0, 0, 60), (0, 0, self.width + 10, 8))
-        screen.blit(shadow_surf, (self.x - 5, y_pos + self.height))
-        
-        # 투명화 상태
-        if self.is_invisible:
-            alpha = 100
-            glow_color = GIMMICK_INVISIBLE + (80,)
-            glow_surf = pygame.Surface((self.width + 30, self.height + 30), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, glow_color, (self.width // 2 + 15, self.height // 2 + 15), self.width // 2 + 15)
-            screen.blit(glow_surf, (self.x - 15, y_pos - 15))
-        else:
-            alpha = 255
-        
-        # 마비 상태 표시
-        if self.is_stunned:
-            stun_surf = pygame.Surface((self.width + 20, self.height + 20), pygame.SRCALPHA)
-            pygame.draw.circle(stun_surf, (100, 100, 255, 100), (self.width // 2 + 10, self.height // 2 + 10), self.width // 2 + 10)
-            screen.blit(stun_surf, (self.x - 10, y_pos - 10))
-        
-        # 속도 효과 표시
-        if self.speed_multiplier != 1.0:
-            effect_color = GIMMICK_SPEED if self.speed_multiplier > 1.0 else GIMMICK_SLOW
-            effect_surf = pygame.Surface((self.width + 20, self.height + 20), pygame.SRCALPHA)
-            pygame.draw.circle(effect_surf, effect_color + (50,), (self.width // 2 + 10, self.height // 2 + 10), self.width // 2 + 10)
-            screen.blit(effect_surf, (self.x - 10, y_pos - 10))
-        
-        if self.is_digging:
-            shovel_angle = (self.dig_timer % 20) - 10
-            glow_surf = pygame.Surface((self.width + 20, self.height + 20), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, WARNING + (50,), (self.width//2 + 10, self.height//2 + 10), self.width//2 + 10)
-            screen.blit(glow_surf, (self.x - 10, y_pos - 10))
-            
-            body_rect = pygame.Rect(self.x + 5, y_pos + 20, self.width - 10, self.height - 25)
-            draw_rounded_rect(screen, PLAYER_COLOR, body_rect, 8)
-            pygame.draw.circle(screen, (255, 220, 177), (int(self.x + self.width//2), int(y_pos + 15)), 15)
-            pygame.draw.circle(screen, (245, 210, 167), (int(self.x + self.width//2), int(y_pos + 15)), 15, 2)
-            pygame.draw.circle(screen, (50, 50, 50), (int(self.x + self.width//2 - 5), int(y_pos + 13)), 2)
-            pygame.draw.circle(screen, (50, 50, 50), (int(self.x + self.width//2 + 5), int(y_pos + 13)), 2)
-            
-            shovel_x = self.x + self.width
-            shovel_y = y_pos + 20 + shovel_angle
-            pygame.draw.line(screen, (101, 67, 33), (shovel_x, shovel_y), (shovel_x + 30, shovel_y + 30), 5)
-            pygame.draw.polygon(screen, (156, 163, 175), [(shovel_x + 30, shovel_y + 30), (shovel_x + 45, shovel_y + 35), (shovel_x + 35, shovel_y + 45)])
-        else:
-            body_rect = pygame.Rect(self.x + 5, y_pos + 20, self.width - 10, self.height - 25)
-            draw_rounded_rect(screen, PLAYER_COLOR, body_rect, 8)
-            pygame.draw.circle(screen, (255, 220, 177), (int(self.x + self.width//2), int(y_pos + 15)), 15)
-            pygame.draw.circle(screen, (245, 210, 167), (int(self.x + self.width//2), int(y_pos + 15)), 15, 2)
-            pygame.draw.circle(screen, (50, 50, 50), (int(self.x + self.width//2 - 5), int(y_pos + 13)), 2)
-            pygame.draw.circle(screen, (50, 50, 50), (int(self.x + self.width//2 + 5), int(y_pos + 13)), 2)
-            pygame.draw.line(screen, (101, 67, 33), (self.x + self.width + 5, y_pos + 30), (self.x + self.width + 5, y_pos + 55), 5)
-            pygame.draw.polygon(screen, (156, 163, 175), [(self.x + self.width + 5, y_pos + 55), (self.x + self.width + 15, y_pos + 60), (self.x + self.width + 5, y_pos + 65)])
+        speed_state = 0
+        if self.speed_multiplier > 1.0:
+            speed_state = 1
+        elif self.speed_multiplier < 1.0:
+            speed_state = -1
+        frames = get_player_frames(self.is_invisible, self.is_stunned, speed_state)
+        frame = frames[1 + self.dig_timer % 20] if self.is_digging else frames[0]
+        return screen.blit(frame, (int(self.render_x(alpha)) - SPRITE_PADDING, int(y_pos) - SPRITE_PADDING))
     
     def get_rect(self):
         """충돌 감지용"""
         return pygame.Rect(self.x, GAME_FIELD_Y + self.current_floor * FLOOR_HEIGHT + 10, self.width, self.height)
 
+class TurnRolls:
+    """몬스터 방향 전환 난수 - 틱마다 방향 전환하는 몬스터 수만큼의 [0, 1) 값을 한 줄로 두고 Monster.update와 MonsterEngine이 같이 읽는다
+    
+    난수는 rng.randbytes로 MONSTER_RANDOM_BLOCK틱 분량을 한 번에 뽑아 32비트씩 잘라 쓴다 (몬스터마다 rng를 부르지 않음).
+    바이트 스트림이 이어지므로 한 번에 뽑는 틱 수와 관계없이 같은 시드면 같은 값.
+    """
+    RANGE = 2 ** 32  # 값 하나는 uint32 (roll = 값 / RANGE)
+    
+    def __init__(self, rng):
+        self.rng = rng
+        self.count = 0  # 틱당 값 개수 (방향 전환하는 몬스터 수)
+        self.values = []  # 뽑아 둔 uint32 값 (틱 순서, 틱 안에서는 turn_slot 순서로 펼친 1차원)
+        self.offset = 0  # 이번 틱 값의 시작 위치
+    
+    def register(self):
+        """방향 전환 몬스터 하나 등록 - 이번 틱 줄에서 읽을 위치(turn_slot) 반환 (첫 advance 전에만)"""
+        self.count += 1
+        return self.count - 1
+    
+    def advance(self):
+        """다음 틱으로 (뽑아 둔 값을 다 썼으면 MONSTER_RANDOM_BLOCK틱 분량을 새로 뽑는다)"""
+        self.offset += self.count
+        if self.offset + self.count <= len(self.values):
+            return
+        total = MONSTER_RANDOM_BLOCK * self.count
+        data = self.rng.randbytes(4 * total)
+        if np is not None:
+            self.values = np.frombuffer(data, dtype="<u4")
+        else:
+            self.values = struct.unpack(f"<{total}I", data)
+        self.offset = 0
+    
+    def current(self):
+        """이번 틱 uint32 값 전체 (turn_slot 순서, numpy 배열 view) - [0, 1) 값과 비교하려면 기준에 RANGE를 곱한다"""
+        return self.values[self.offset:self.offset + self.count]
+    
+    def roll(self, turn_slot):
+        """이번 틱 turn_slot 몬스터의 [0, 1) 값"""
+        return self.values[self.offset + turn_slot] / self.RANGE
+
 class Monster:
-    """몬스터 클래스"""
-    def __init__(self, floor_num, monster_type):
+    """몬스터 클래스 (시작 위치/방향은 배치에서 받고, 방향 전환 난수는 World가 넘겨준 TurnRolls에서 읽는다)"""
+    def __init__(self, floor_num, monster_type, x, direction, turn_rolls):
         self.floor = floor_num
         self.type = monster_type
-        self.x = random.randint(100, SCREEN_WIDTH - 100)
+        self.turn_rolls = turn_rolls
+        self.x = x
+        self.prev_x = self.x  # 직전 틱의 x (그리기 보간용)
         self.y = GAME_FIELD_Y + floor_num * FLOOR_HEIGHT + 15
         self.width = MONSTER_SIZE
         self.height = MONSTER_SIZE
         
+        tuning = MONSTER_TUNING
         underground_level = max(0, floor_num - 1)
-        base_speed = 1 + (underground_level // 3) * 0.5
+        base_speed = tuning["base_speed"] + (underground_level // tuning["speed_step_floors"]) * tuning["speed_step"]
         
         # 난이도 조정: 1~9층 14.5% 감소, 10~40층 18.8% 감소, 41~50층 27.8% 감소
         if floor_num >= 41:
-            base_speed *= 0.722  # 24% + 5% 추가 감소
+            base_speed *= tuning["speed_scale_deep"]  # 24% + 5% 추가 감소
         elif floor_num >= 10:
-            base_speed *= 0.8123  # 14.5% + 5% 추가 감소
+            base_speed *= tuning["speed_scale_mid"]  # 14.5% + 5% 추가 감소
         elif floor_num >= 1:
-            base_speed *= 0.855  # 14.5% 감소
+            base_speed *= tuning["speed_scale_shallow"]  # 14.5% 감소
         
         self.speed = base_speed
-        self.direction = random.choice([-1, 1])
+        self.direction = direction
         
         # 41층 이상 랜덤 방향 전환
-        self.can_random_turn = floor_num >= 41
+        self.can_random_turn = floor_num >= tuning["random_turn_floor"]
+        self.turn_slot = turn_rolls.register() if self.can_random_turn else None
         self.turn_cooldown = 0
         
+        # 충돌 판정용 영역 (층이 바뀌지 않으므로 x만 갱신해 재사용)
+        self.rect = pygame.Rect(self.x, self.y + 10, self.width, self.height - 10)
+        
     def update(self):
         """몬스터 이동"""
+        self.prev_x = self.x
         self.x += self.speed * self.direction
         
         # 벽에 닿으면 방향 전환 및 위치 조정
@@ -407,106 +1855,302 @@ class Monster:
             self.x = SCREEN_WIDTH - self.width - 50
             self.direction = -1
         
-        # 랜덤 방향 전환 (41층 이상)
-        if self.can_random_turn and self.turn_cooldown <= 0:
-            if random.random() < 0.01:  # 1% 확률
+        # 랜덤 방향 전환 (41층 이상) - 이번 틱 TurnRolls 줄에서 자기 자리 값을 읽는다 (MonsterEngine과 같은 값)
+        if self.can_random_turn:
+            if self.turn_cooldown <= 0 and self.turn_rolls.roll(self.turn_slot) < MONSTER_TUNING["random_turn_chance"]:  # 1% 확률
                 self.direction *= -1
-                self.turn_cooldown = 60  # 쿨다운
+                self.turn_cooldown = MONSTER_TUNING["turn_cooldown"]  # 쿨다운
         
         if self.turn_cooldown > 0:
             self.turn_cooldown -= 1
     
-    def draw(self, screen, camera_y):
-        """몬스터 그리기"""
+    def draw(self, screen, camera_y, alpha=1.0):
+        """몬스터 그리기 (캐시된 스프라이트 프레임 blit, 그린 영역 반환)"""
         y_pos = self.y - camera_y
+        frames = get_monster_frames(self.type)
+        # 박쥐 날갯짓: 100ms 단위로 프레임 전환
+        frame = frames[(pygame.time.get_ticks() // 100) % len(frames)]
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        return screen.blit(frame, (int(x) - SPRITE_PADDING, int(y_pos) - SPRITE_PADDING))
+    
+    def get_rect(self):
+        """충돌 감지용 (매번 같은 Rect를 현재 위치로 갱신해 반환)"""
+        self.rect.x = self.x
+        return self.rect
+
+class MonsterEngine:
+    """몬스터 일괄 시뮬레이션 - 위치/속도/방향/층/쿨다운을 numpy 배열로 모아 한 번에 갱신 (Monster.update와 같은 규칙)
+    
+    Monster 객체는 그리기용 보기로만 남고, 값은 sync()로 필요한 몬스터에만 반영한다.
+    방향 전환 난수는 Monster.update와 같은 TurnRolls 줄을 읽어, numpy 유무와 관계없이 같은 시드면 같은 움직임.
+    """
+    def __init__(self, monsters, turn_rolls):
+        self.turn_rolls = turn_rolls
+        # 층 순서로 슬롯 배치 -> 층별 몬스터가 배열의 연속 구간
+        self.monsters = sorted(monsters, key=lambda monster: monster.floor)
+        for slot, monster in enumerate(self.monsters):
+            monster.slot = slot
+        ordered = self.monsters
+        self.x = np.array([monster.x for monster in ordered], dtype=np.float64)
+        self.prev_x = self.x.copy()  # 직전 틱의 x (그리기 보간용)
+        self.speed = np.array([monster.speed for monster in ordered], dtype=np.float64)
+        self.direction = np.array([monster.direction for monster in ordered], dtype=np.int8)
+        self.floor = np.array([monster.floor for monster in ordered], dtype=np.int16)
+        self.turn_cooldown = np.array([monster.turn_cooldown for monster in ordered], dtype=np.int16)
+        self.width = np.array([monster.width for monster in ordered], dtype=np.int32)
+        self.y = np.array([monster.y for monster in ordered], dtype=np.int32)
+        self.right_wall = SCREEN_WIDTH - self.width - 50
+        self.floor_bounds = np.searchsorted(self.floor, np.arange(TOTAL_FLOORS + 1))
+        
+        # TurnRolls 줄 순서(turn_slot)대로 놓은 방향 전환 몬스터의 슬롯
+        turners = sorted((monster for monster in ordered if monster.can_random_turn), key=lambda monster: monster.turn_slot)
+        self.turners = np.array([monster.slot for monster in turners], dtype=np.intp)
+    
+    def update(self):
+        """전체 몬스터 한 틱 이동 (벽 반사, 41층 이상 랜덤 방향 전환, 쿨다운 감소)"""
+        x, direction = self.x, self.direction
+        self.prev_x[:] = x
+        x += self.speed * direction
+        
+        left = x <= 50
+        x[left] = 50
+        direction[left] = 1
+        right = x >= self.right_wall
+        x[right] = self.right_wall[right]
+        direction[right] = -1
+        
+        if len(self.turners):
+            # roll < chance 와 같은 판정을 uint32 그대로 (2의 거듭제곱 배율이라 반올림 차이 없음)
+            threshold = MONSTER_TUNING["random_turn_chance"] * TurnRolls.RANGE
+            rolls = self.turn_rolls.current()
+            turning = self.turners[(self.turn_cooldown[self.turners] <= 0) & (rolls < threshold)]  # 1% 확률
+            direction[turning] *= -1
+            self.turn_cooldown[turning] = MONSTER_TUNING["turn_cooldown"]
+        
+        np.subtract(self.turn_cooldown, 1, out=self.turn_cooldown, where=self.turn_cooldown > 0)
+    
+    def collide(self, floor_num, rect):
+        """floor_num 층에서 rect와 겹치는 몬스터 (없으면 None, Monster.get_rect와 같은 판정 영역)"""
+        start, end = self.floor_bounds[floor_num], self.floor_bounds[floor_num + 1]
+        if start == end:
+            return None
+        top = self.y[start] + 10
+        bottom = top + MONSTER_SIZE - 10
+        if not (rect.top < bottom and top < rect.bottom):
+            return None
+        left = self.x[start:end].astype(np.int32)  # Rect와 같이 정수로 자른다
+        hits = np.flatnonzero((left < rect.right) & (rect.left < left + self.width[start:end]))
+        return self.monsters[start + hits[0]] if len(hits) else None
+    
+    def sync(self, monsters):
+        """엔진 값을 몬스터 객체에 반영 (그리기 직전, 보이는 몬스터만)"""
+        x, prev_x, direction, turn_cooldown = self.x, self.prev_x, self.direction, self.turn_cooldown
+        for monster in monsters:
+            slot = monster.slot
+            monster.x = float(x[slot])
+            monster.prev_x = float(prev_x[slot])
+            monster.direction = int(direction[slot])
+            monster.turn_cooldown = int(turn_cooldown[slot])
+
+Action = namedtuple("Action", "move dig down jump", defaults=(0, False, False, False))
+Action.__doc__ = """한 틱 동안의 플레이어 행동 (move: -1/0/1, dig/down/jump: 이번 틱에 누른 키)"""
+IDLE = Action()
+
+def parse_seed_setting(value):
+    """시드 설정 문자열 -> 정수 시드 (daily면 오늘 날짜 YYYYMMDD, 비었거나 알 수 없으면 None = 판마다 새 시드)"""
+    if value == "daily":
+        return int(date.today().strftime("%Y%m%d"))
+    try:
+        return int(value)
+    except ValueError:
+        if value:
+            print(f"⚠️ 알 수 없는 시드 설정 '{value}' - 판마다 새 시드로 동작합니다.")
+        return None
+
+def seed_stream(seed, name):
+    """시드에서 용도별로 독립된 난수 스트림 (문자열 시드는 sha512로 펼쳐져 플랫폼/PYTHONHASHSEED와 무관)"""
+    return random.Random(f"{seed}:{name}")
+
+Layout = namedtuple("Layout", "seed gimmicks monsters")
+Layout.__doc__ = """시드로 정해지는 맵 배치 (gimmicks: (층, 종류, x), monsters: (층, 종류, x, 방향)) - 불변이라 캐시해 여러 World가 공유"""
+_LAYOUT_CACHE = OrderedDict()
+
+GIMMICK_FLOORS = {
+    'teleport': [6, 20, 28, 42],
+    'invisible': [5, 13, 34, 45],
+    'slow': [5, 14, 31, 46],
+    'speed': [8, 24, 37],
+    'stun': [3, 11, 22, 31, 45]
+}
+
+def monster_type_for_floor(floor_num):
+    """층별 몬스터 종류"""
+    floor_level = floor_num - 1
+    if floor_level < 10:
+        return 'skeleton'
+    elif floor_level < 20:
+        return 'bat'
+    elif floor_level < 30:
+        return 'zombie'
+    elif floor_level < 40:
+        return 'dracula'
+    return 'orc'
+
+def generate_layout(seed):
+    """시드 -> 맵 배치 (기믹은 layout 스트림, 몬스터는 spawn 스트림이라 몬스터 수를 바꿔도 기믹 위치는 그대로)"""
+    count_range = (MONSTER_TUNING["monsters_min"], MONSTER_TUNING["monsters_max"])
+    key = (seed, count_range)
+    layout = _LAYOUT_CACHE.get(key)
+    if layout is not None:
+        _LAYOUT_CACHE.move_to_end(key)
+        return layout
+    
+    layout_rng = seed_stream(seed, "layout")
+    gimmicks = []
+    for gimmick_type, floors in GIMMICK_FLOORS.items():
+        for floor in floors:
+            # 랜덤 x 위치 (몬스터와 겹치지 않도록)
+            gimmicks.append((floor, gimmick_type, layout_rng.randint(100, SCREEN_WIDTH - 180)))
+    
+    spawn_rng = seed_stream(seed, "spawn")
+    monsters = []
+    for i in range(1, TOTAL_FLOORS - 1):  # 지상(0층)과 최종층(50층)은 몬스터 없음
+        monster_type = monster_type_for_floor(i)
+        for _ in range(spawn_rng.randint(*count_range)):
+            monsters.append((i, monster_type, spawn_rng.randint(100, SCREEN_WIDTH - 100), spawn_rng.choice([-1, 1])))
+    
+    layout = Layout(seed, tuple(gimmicks), tuple(monsters))
+    _LAYOUT_CACHE[key] = layout
+    if len(_LAYOUT_CACHE) > LAYOUT_CACHE_SIZE:
+        _LAYOUT_CACHE.popitem(last=False)
+    return layout
+
+class World:
+    """게임 로직 - 화면/입력/SDL 없이 행동을 받아 한 틱씩 진행 (Game은 이 위에서 입력을 넘기고 그리기만 한다)
+    
+    같은 seed + 같은 행동 순서면 같은 판 (seed가 None이면 새로 뽑아 self.seed에 남긴다).
+    """
+    def __init__(self, seed=None):
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.layout = generate_layout(self.seed)
+        # 매 틱 몬스터 방향 전환 난수 (배치용 스트림과 분리, Monster/MonsterEngine이 같은 줄을 읽는다)
+        self.turn_rolls = TurnRolls(seed_stream(self.seed, "behaviour"))
+        self.player = Player(SCREEN_WIDTH // 2 - PLAYER_SIZE // 2, 10)
+        self.floors = self.init_floors()
+        self.monsters = self.init_monsters()  # 층별 버킷 self.monsters_by_floor도 함께 만든다
+        # numpy가 있으면 몬스터 이동/충돌은 배열로 일괄 처리
+        if np is not None:
+            self.monster_engine = MonsterEngine(self.monsters, self.turn_rolls)
+        else:
+            self.monster_engine = None
+        self.gimmicks = self.init_gimmicks()
+        # 층별 활성 기믹 색인 (땅파기 조회와 보이는 층 그리기에 사용)
+        self.gimmick_index = GimmickIndex(self.gimmicks)
+        self.state = "playing"  # playing / dead / clear
+        self.ticks = 0  # 진행한 틱 수 (랭킹 시간은 화면 속도와 관계없이 틱 기준)
+        self.elapsed_time = 0
+    
+    def init_floors(self):
+        """층 초기화"""
+        floors = []
+        for i in range(TOTAL_FLOORS):
+            floors.append({'floor_num': i, 'holes': HoleSet()})
+        return floors
+    
+    def init_gimmicks(self):
+        """기믹 초기화 (배치에서 매 판 새 객체로 - 기믹은 밟으면 비활성화되므로 공유하지 않는다)"""
+        return [Gimmick(floor, gimmick_type, x_pos) for floor, gimmick_type, x_pos in self.layout.gimmicks]
+    
+    def init_monsters(self):
+        """몬스터 초기화 (층별 버킷 self.monsters_by_floor도 함께 구성)"""
+        monsters = []
+        self.monsters_by_floor = [[] for _ in range(TOTAL_FLOORS)]
+        # 배치는 층 순서 -> monsters도 층 순서 (turn_slot도 층 순서로 매겨진다)
+        for floor_num, monster_type, x, direction in self.layout.monsters:
+            monster = Monster(floor_num, monster_type, x, direction, self.turn_rolls)
+            monsters.append(monster)
+            self.monsters_by_floor[floor_num].append(monster)
         
-        shadow_surf = pygame.Surface((self.width + 10, 8), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf, (0, 0, 0, 60), (0, 0, self.width + 10, 8))
-        screen.blit(shadow_surf, (self.x - 5, y_pos + self.height))
+        return monsters
+    
+    def step(self, action=IDLE):
+        """한 틱 진행 (끝난 게임이면 그대로) - 진행 후 상태 반환"""
+        player = self.player
+        player.prev_x = player.x
+        if self.state != "playing":
+            return self.state
+        
+        if action.move:
+            player.move(action.move, self.floors)
+        if action.dig:
+            player.start_digging(self.floors, self.gimmick_index)
+        if action.down:
+            player.move_down(self.floors)
+        if action.jump:
+            player.jump()
+        
+        self.ticks += 1
+        self.elapsed_time = int(self.ticks * TICK_MS)
+        player.update(self.floors)
+        
+        self.turn_rolls.advance()
+        if self.monster_engine is not None:
+            self.monster_engine.update()
+        else:
+            for monster in self.monsters:
+                monster.update()
         
-        if self.type == 'skeleton':
-            glow_surf = pygame.Surface((self.width + 20, self.height + 20), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, SKELETON_COLOR + (30,), (self.width//2 + 10, self.height//2 + 10), self.width//2 + 10)
-            screen.blit(glow_surf, (self.x - 10, y_pos - 10))
-            
-            pygame.draw.circle(screen, SKELETON_COLOR, (int(self.x + self.width//2), int(y_pos + 15)), 15)
-            pygame.draw.circle(screen, (203, 213, 225), (int(self.x + self.width//2), int(y_pos + 15)), 15, 2)
-            body_rect = pygame.Rect(self.x + 10, y_pos + 25, self.width - 20, self.height - 30)
-            draw_rounded_rect(screen, SKELETON_COLOR, body_rect, 5)
-            pygame.draw.circle(screen, DANGER, (int(self.x + 15), int(y_pos + 12)), 4)
-            pygame.draw.circle(screen, DANGER, (int(self.x + 35), int(y_pos + 12)), 4)
-            
-        elif self.type == 'bat':
-            wing_offset = abs((pygame.time.get_ticks() // 100) % 20 - 10)
-            glow_surf = pygame.Surface((self.width + 40, self.height + 20), pygame.SRCALPHA)
-            pygame.draw.ellipse(glow_surf, BAT_COLOR + (40,), (0, 0, self.width + 40, self.height + 20))
-            screen.blit(glow_surf, (self.x - 20, y_pos + 10))
-            
-            pygame.draw.ellipse(screen, BAT_COLOR, (self.x + 5, y_pos + 15, self.width - 10, 25))
-            left_wing = [(self.x + 5, y_pos + 25), (self.x - 15, y_pos + 20 + wing_offset), (self.x + 5, y_pos + 35)]
-            pygame.draw.polygon(screen, BAT_COLOR, left_wing)
-            pygame.draw.polygon(screen, INFO, left_wing, 2)
-            right_wing = [(self.x + self.width - 5, y_pos + 25), (self.x + self.width + 15, y_pos + 20 + wing_offset), (self.x + self.width - 5, y_pos + 35)]
-            pygame.draw.polygon(screen, BAT_COLOR, right_wing)
-            pygame.draw.polygon(screen, INFO, right_wing, 2)
-            
-        elif self.type == 'zombie':
-            glow_surf = pygame.Surface((self.width + 20, self.height + 20), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, ZOMBIE_COLOR + (40,), (self.width//2 + 10, self.height//2 + 10), self.width//2 + 10)
-            screen.blit(glow_surf, (self.x - 10, y_pos - 10))
-            
-            body_rect = pygame.Rect(self.x + 5, y_pos + 20, self.width - 10, self.height - 25)
-            draw_rounded_rect(screen, ZOMBIE_COLOR, body_rect, 5)
-            pygame.draw.circle(screen, (52, 211, 153), (int(self.x + self.width//2), int(y_pos + 15)), 15)
-            pygame.draw.circle(screen, ZOMBIE_COLOR, (int(self.x + self.width//2), int(y_pos + 15)), 15, 2)
-            pygame.draw.circle(screen, DANGER, (int(self.x + 15), int(y_pos + 12)), 5)
-            pygame.draw.circle(screen, DANGER, (int(self.x + 35), int(y_pos + 12)), 5)
-            
-        elif self.type == 'dracula':
-            glow_surf = pygame.Surface((self.width + 25, self.height + 25), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, DRACULA_COLOR + (50,), (self.width//2 + 12, self.height//2 + 12), self.width//2 + 12)
-            screen.blit(glow_surf, (self.x - 12, y_pos - 12))
-            
-            # 망토
-            pygame.draw.polygon(screen, (50, 10, 10), [(self.x, y_pos + 20), (self.x + self.width, y_pos + 20), (self.x + self.width + 10, y_pos + 50), (self.x - 10, y_pos + 50)])
-            
-            body_rect = pygame.Rect(self.x + 8, y_pos + 22, self.width - 16, self.height - 27)
-            draw_rounded_rect(screen, DRACULA_COLOR, body_rect, 5)
-            pygame.draw.circle(screen, (245, 220, 177), (int(self.x + self.width//2), int(y_pos + 15)), 15)
-            pygame.draw.circle(screen, DRACULA_COLOR, (int(self.x + self.width//2), int(y_pos + 15)), 15, 2)
-            pygame.draw.circle(screen, (255, 0, 0), (int(self.x + 15), int(y_pos + 12)), 4)
-            pygame.draw.circle(screen, (255, 0, 0), (int(self.x + 35), int(y_pos + 12)), 4)
-            
-        elif self.type == 'orc':
-            glow_surf = pygame.Surface((self.width + 22, self.height + 22), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, ORC_COLOR + (45,), (self.width//2 + 11, self.height//2 + 11), self.width//2 + 11)
-            screen.blit(glow_surf, (self.x - 11, y_pos - 11))
-            
-            body_rect = pygame.Rect(self.x + 3, y_pos + 18, self.width - 6, self.height - 23)
-            draw_rounded_rect(screen, ORC_COLOR, body_rect, 6)
-            pygame.draw.circle(screen, (34, 139, 34), (int(self.x + self.width//2), int(y_pos + 15)), 17)
-            pygame.draw.circle(screen, ORC_COLOR, (int(self.x + self.width//2), int(y_pos + 15)), 17, 2)
-            # 송곳니
-            pygame.draw.polygon(screen, (255, 255, 255), [(self.x + 18, y_pos + 20), (self.x + 20, y_pos + 25), (self.x + 22, y_pos + 20)])
-            pygame.draw.polygon(screen, (255, 255, 255), [(self.x + 28, y_pos + 20), (self.x + 30, y_pos + 25), (self.x + 32, y_pos + 20)])
-            pygame.draw.circle(screen, (255, 50, 50), (int(self.x + 15), int(y_pos + 12)), 5)
-            pygame.draw.circle(screen, (255, 50, 50), (int(self.x + 35), int(y_pos + 12)), 5)
+        if self.check_collisions() is not None:
+            self.state = "dead"
+            player.effects.append(('gameover', player.get_rect().centerx, player.current_floor, None))
+        elif player.current_floor >= TOTAL_FLOORS - 1:
+            # 지하 50층 도달
+            self.state = "clear"
+        return self.state
     
-    def get_rect(self):
-        """충돌 감지용"""
-        return pygame.Rect(self.x, self.y + 10, self.width, self.height - 10)
+    def check_collisions(self):
+        """충돌 감지 - 부딪힌 몬스터 반환 (없으면 None)"""
+        if self.player.is_invisible:
+            return None
+        
+        player_rect = self.player.get_rect()
+        
+        if self.monster_engine is not None:
+            hit = self.monster_engine.collide(self.player.current_floor, player_rect)
+        else:
+            hit = None
+            # 현재 층 버킷만 x 순서로 훑는다 (몬스터는 조금씩만 움직여 거의 정렬된 상태라 정렬 비용이 작다)
+            bucket = self.monsters_by_floor[self.player.current_floor]
+            bucket.sort(key=lambda monster: monster.x)
+            for monster in bucket:
+                if monster.x + monster.width < player_rect.left:
+                    continue
+                if monster.x > player_rect.right:
+                    break
+                if player_rect.colliderect(monster.get_rect()):
+                    hit = monster
+                    break
+        return hit
 
 class Game:
-    """게임 메인 클래스"""
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("🎮 땅굴파기 게임 - 공주 구출 대작전")
+    """게임 메인 클래스 - 입력을 World 행동으로 바꿔 넘기고 화면을 그린다"""
+    def __init__(self, render_backend=None, seed=None):
+        init_pygame()
+        title = "🎮 땅굴파기 게임 - 공주 구출 대작전"
+        self.render_backend = choose_render_backend(render_backend or RENDER_BACKEND)
+        if self.render_backend == "surface":
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption(title)
+        else:
+            self.screen = None
+            self.window = sdl2_video.Window(title, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        # 데스크톱에서는 직접 그리는 쪽이 PNG 디코드보다 빨라 웹 빌드에서만 아틀라스를 읽는다
+        self.atlas_loaded = load_sprite_atlas() if IS_WEB_BUILD else False
         self.clock = pygame.time.Clock()
+        self.frame_started = time.perf_counter()  # 이번 프레임 작업 시작 시각 (handle_input에서 갱신)
         self.running = True
         self.game_state = "playing"
         
-        self.start_time = pygame.time.get_ticks()
-        self.elapsed_time = 0
         self.final_time = 0
         
         self.ranking_file = "ranking.json"
@@ -521,68 +2165,50 @@ class Game:
         self.font_tiny = get_game_font(20)
         self.font_micro = get_game_font(16)
         
-        self.player = Player(SCREEN_WIDTH // 2 - PLAYER_SIZE // 2, 10)
-        self.floors = self.init_floors()
-        self.monsters = self.init_monsters()
-        self.gimmicks = self.init_gimmicks()
+        # 게임 로직은 World가 진행하고, Game은 입력을 행동으로 바꿔 넘기고 그린다
+        # 시드: 인자(재시작해도 유지) > TUNNELINGGAME_SEED > 판마다 새 시드
+        self.seed_setting = seed if seed is not None else getattr(self, "seed_setting", None)
+        self.world = World(self.seed_setting if self.seed_setting is not None else parse_seed_setting(SEED_SETTING))
+        self.player = self.world.player
+        self.floors = self.world.floors
+        self.monsters = self.world.monsters
+        self.monsters_by_floor = self.world.monsters_by_floor
+        self.monster_engine = self.world.monster_engine
+        self.gimmicks = self.world.gimmicks
+        self.gimmick_index = self.world.gimmick_index
+        self.queued_actions = set()  # 다음 틱에 넘길 키 입력 ('dig', 'down', 'jump')
         self.camera_y = 0
+        self.prev_camera_y = 0  # 직전 틱의 카메라 (그리기 보간용)
+        self.accumulator = 0.0  # 아직 진행하지 않은 시간 (ms)
+        self.render_alpha = 1.0  # 직전 틱 -> 현재 틱 사이 그리기 위치 (0~1)
+        self.anim_tick = 0  # 공유 애니메이션 시계 (기믹 펄스 등)
+        
+        # 렌더링 캐시/레이어
+        self.floor_cache = FloorSurfaceCache(16)
+        self.world_chunks = WorldChunkCache(self.floors, self.gimmick_index, self.floor_cache)
+        self.minimap = Minimap(self.floors, self.gimmick_index, self.monsters, self.floor_cache, self.monster_engine)
+        if self.render_backend == "surface":
+            self.compositor = Compositor(self.screen)
+        else:
+            self.compositor = TextureCompositor(self.window, accelerated=self.render_backend == "sdl2")
+        self._minimap_visible = False
+        self._world_camera_y = None
+        self._world_versions = {}
+        self._overlay_state = None
+        self._hud_cache = {}
+        self.lighting = LightingLayer()
+        self.particles = ParticleSystem() if np is not None else None
+        self.lighting_enabled = True
+        self.light_radius = LIGHT_RADIUS
+        # 화질 조절 (재시작으로 __init__이 다시 불려도 Q 키로 고정한 단계는 유지)
+        self.quality = getattr(self, "quality", None) or QualityGovernor(QUALITY_SETTING)
+        self.apply_quality()
         
         # View 모드
         self.view_mode = False
         self.manual_camera_y = 0
         self.camera_scroll_speed = 20
     
-    def init_floors(self):
-        """층 초기화"""
-        floors = []
-        for i in range(TOTAL_FLOORS):
-            floors.append({'floor_num': i, 'holes': []})
-        return floors
-    
-    def init_gimmicks(self):
-        """기믹 초기화"""
-        gimmicks = []
-        gimmick_positions = {
-            'teleport': [6, 20, 28, 42],
-            'invisible': [5, 13, 34, 45],
-            'slow': [5, 14, 31, 46],
-            'speed': [8, 24, 37],
-            'stun': [3, 11, 22, 31, 45]
-        }
-        
-        for gimmick_type, floors in gimmick_positions.items():
-            for floor in floors:
-                # 랜덤 x 위치 (몬스터와 겹치지 않도록)
-                x_pos = random.randint(100, SCREEN_WIDTH - 180)
-                gimmicks.append(Gimmick(floor, gimmick_type, x_pos))
-        
-        return gimmicks
-    
-    def init_monsters(self):
-        """몬스터 초기화"""
-        monsters = []
-        for i in range(TOTAL_FLOORS):
-            if i == 0 or i == TOTAL_FLOORS - 1:  # 지상(0층)과 최종층(50층)은 몬스터 없음
-                continue
-            
-            floor_level = i - 1
-            if floor_level < 10:
-                monster_type = 'skeleton'
-            elif floor_level < 20:
-                monster_type = 'bat'
-            elif floor_level < 30:
-                monster_type = 'zombie'
-            elif floor_level < 40:
-                monster_type = 'dracula'
-            else:
-                monster_type = 'orc'
-            
-            num_monsters = random.randint(1, 2)
-            for _ in range(num_monsters):
-                monsters.append(Monster(i, monster_type))
-        
-        return monsters
-    
     def load_rankings(self):
         """랭킹 로드"""
         if os.path.exists(self.ranking_file):
@@ -634,6 +2260,41 @@ class Game:
         ms = int((milliseconds % 1000) / 10)
         return f"{minutes:02d}:{seconds:02d}.{ms:02d}"
     
+    def apply_quality(self):
+        """현재 화질 단계 설정을 반영 - 스프라이트는 단계별로 캐시되고, 레이어는 다음 프레임에 전부 다시 그린다"""
+        RENDER_QUALITY.update(QUALITY_TIERS[self.quality.tier][1])
+        if self.particles is not None:
+            self.particles.density = RENDER_QUALITY["particles"]
+        self._world_camera_y = None
+        self._hud_cache = {}
+        self._overlay_state = None
+        self.compositor.invalidate()
+    
+    def cycle_quality(self):
+        """Q 키: 자동 -> 0단계 고정 -> ... -> 마지막 단계 고정 -> 자동"""
+        quality = self.quality
+        if quality.pinned is None:
+            quality.pin(0)
+        elif quality.pinned < len(QUALITY_TIERS) - 1:
+            quality.pin(quality.pinned + 1)
+        else:
+            quality.pin(None)
+        self.apply_quality()
+        print(f"🎨 화질: {quality.name} ({'자동' if quality.pinned is None else '고정'})")
+    
+    def end_frame(self):
+        """프레임 마무리 - 그리기 상한에 맞춰 대기하고, 이번 프레임 작업 시간으로 화질 단계 조절
+        
+        작업 시간은 handle_input 시작부터 여기까지 직접 잰다 (clock.get_rawtime은 웹 빌드에서
+        루프가 브라우저 프레임을 기다리는 asyncio.sleep까지 포함해 항상 약 16.7ms가 된다).
+        """
+        work_ms = (time.perf_counter() - self.frame_started) * 1000
+        self.clock.tick(RENDER_FPS)
+        if self.quality.record(work_ms, self.clock.get_time()):
+            self.apply_quality()
+            if DEV_TOOLS_ENABLED:
+                print(f"🎨 화질 자동 조절: {self.quality.name}")
+    
     def toggle_view_mode(self):
         """View 모드 ON/OFF"""
         self.view_mode = not self.view_mode
@@ -648,7 +2309,8 @@ class Game:
             self.manual_camera_y = self.camera_y
     
     def handle_input(self):
-        """입력 처리"""
+        """입력 이벤트 처리 (누르고 있는 키는 poll_held_keys가 틱마다 처리) - 프레임의 첫 작업이라 여기서 작업 시간 측정 시작"""
+        self.frame_started = time.perf_counter()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -660,6 +2322,10 @@ class Game:
                     view_button_rect = pygame.Rect(170, 10, 100, 70)
                     if view_button_rect.collidepoint(mouse_pos):
                         self.toggle_view_mode()
+                    elif self.view_mode and event.button == 1 and MINIMAP_RECT.collidepoint(event.pos):
+                        # 미니맵 클릭: 해당 위치로 카메라 이동
+                        max_camera_y = TOTAL_FLOORS * FLOOR_HEIGHT - (SCREEN_HEIGHT - GAME_FIELD_Y) + GAME_FIELD_Y
+                        self.manual_camera_y = max(0, min(self.minimap.camera_y_at(event.pos), max_camera_y))
             
             # 마우스 휠로 카메라 스크롤 (View 모드)
             if event.type == pygame.MOUSEWHEEL and self.view_mode and self.game_state == "playing":
@@ -670,13 +2336,15 @@ class Game:
             if event.type == pygame.KEYDOWN:
                 if self.game_state == "playing":
                     if event.key == pygame.K_l:
-                        self.player.start_digging(self.floors, self.gimmicks)
+                        self.queued_actions.add('dig')
                     elif event.key == pygame.K_s:
-                        self.player.move_down(self.floors)
+                        self.queued_actions.add('down')
                     elif event.key == pygame.K_SPACE:
-                        self.player.jump()
+                        self.queued_actions.add('jump')
                     elif event.key == pygame.K_v:  # V 키로도 토글 가능
                         self.toggle_view_mode()
+                    elif event.key == pygame.K_q:  # Q 키: 화질 단계 고정/자동 전환
+                        self.cycle_quality()
                     elif event.key == pygame.K_t and DEV_TOOLS_ENABLED:  # T 키: 테스트 모드 (개발 기능)
                         print("🧪 테스트 모드: 48층으로 이동 + 투명화 활성화")
                         self.player.current_floor = 48
@@ -686,7 +2354,7 @@ class Game:
                         # 48층, 49층에 구멍 생성 (클리어 진행 가능하도록)
                         for test_floor in [48, 49]:
                             if not self.floors[test_floor]['holes']:
-                                self.floors[test_floor]['holes'].append((self.player.x - 10, self.player.x + self.player.width + 10))
+                                self.floors[test_floor]['holes'].add(self.player.x - 10, self.player.x + self.player.width + 10)
                 
                 elif self.game_state == "name_input":
                     # ESC: 이름 등록 취소(팝업 닫기)
@@ -718,12 +2386,14 @@ class Game:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
         
+    def take_action(self):
+        """이번 틱 행동 - 쌓인 키 입력 + 누르고 있는 키 (View 모드 카메라 스크롤은 바로 반영)"""
+        queued = self.queued_actions
+        self.queued_actions = set()
+        move = 0
         if self.game_state == "playing":
             keys = pygame.key.get_pressed()
-            if keys[pygame.K_a]:
-                self.player.move(-1, self.floors)
-            if keys[pygame.K_d]:
-                self.player.move(1, self.floors)
+            move = keys[pygame.K_d] - keys[pygame.K_a]
             
             # View 모드에서 키보드로 카메라 이동
             if self.view_mode:
@@ -734,18 +2404,28 @@ class Game:
                     max_camera_y = TOTAL_FLOORS * FLOOR_HEIGHT - (SCREEN_HEIGHT - GAME_FIELD_Y) + GAME_FIELD_Y
                     self.manual_camera_y += self.camera_scroll_speed
                     self.manual_camera_y = min(self.manual_camera_y, max_camera_y)
+        return Action(move, 'dig' in queued, 'down' in queued, 'jump' in queued)
+    
+    def advance(self, frame_ms):
+        """고정 틱 진행 - 지난 프레임 시간만큼 틱을 돌리고(최대 MAX_CATCH_UP_STEPS) 남은 시간으로 보간 비율 계산"""
+        self.accumulator += min(frame_ms, TICK_MS * MAX_CATCH_UP_STEPS)
+        while self.accumulator >= TICK_MS:
+            self.prev_camera_y = self.camera_y
+            self.update()
+            self.accumulator -= TICK_MS
+        # 멈춘 화면(게임오버 등)은 보간하지 않는다 - 마지막 틱 위치 그대로
+        self.render_alpha = self.accumulator / TICK_MS if self.game_state == "playing" else 1.0
     
     def update(self):
-        """게임 업데이트"""
+        """게임 업데이트 (한 틱) - 행동을 World에 넘기고 카메라/연출/결과 화면 처리"""
+        self.anim_tick += 1
+        
+        # 빛 반지름은 목표값으로 천천히 변한다 (투명화 시작/종료)
+        target_radius = LIGHT_RADIUS_INVISIBLE if self.player.is_invisible else LIGHT_RADIUS
+        self.light_radius += max(-3, min(3, target_radius - self.light_radius))
+        
         if self.game_state == "playing":
-            self.elapsed_time = pygame.time.get_ticks() - self.start_time
-            
-            self.player.update(self.floors)
-            
-            for monster in self.monsters:
-                monster.update()
-            
-            self.check_collisions()
+            self.world.step(self.take_action())
             
             # 카메라 업데이트 (View 모드에 따라)
             if self.view_mode:
@@ -758,160 +2438,279 @@ class Game:
                 max_camera_y = TOTAL_FLOORS * FLOOR_HEIGHT - available_height + GAME_FIELD_Y
                 self.camera_y = max(0, min(target_camera_y, max_camera_y))
             
-            # 지하 50층 도달
-            if self.player.current_floor >= TOTAL_FLOORS - 1:
-                self.final_time = self.elapsed_time
-                if self.check_ranking(self.player.current_floor, self.final_time / 1000):
-                    self.is_new_record = True
-                    self.game_state = "name_input"
-                else:
-                    self.is_new_record = False
-                    self.game_state = "clear"
+            if self.world.state != "playing":
+                self.finish_run()
+        
+        self.update_particles()
     
-    def check_collisions(self):
-        """충돌 감지"""
-        if self.player.is_invisible:
+    def finish_run(self):
+        """몬스터와 충돌했거나 50층에 도달 - 기록 저장 여부에 따라 결과 화면으로"""
+        self.final_time = self.world.elapsed_time
+        if self.check_ranking(self.player.current_floor, self.final_time / 1000):
+            self.is_new_record = True
+            self.game_state = "name_input"
+        else:
+            self.is_new_record = False
+            self.game_state = "gameover" if self.world.state == "dead" else "clear"
+    
+    def update_particles(self):
+        """플레이어 이벤트를 파티클로 바꾸고 파티클 진행"""
+        if self.player.is_digging and self.game_state == "playing":
+            self.emit_effect('dig', self.player.x + self.player.width // 2, self.player.current_floor)
+        for effect in self.player.effects:
+            self.emit_effect(*effect)
+        self.player.effects.clear()
+        if self.particles is not None:
+            self.particles.update()
+    
+    def emit_effect(self, kind, x, floor_num, detail=None):
+        """효과 종류별 파티클 방출 (numpy가 없으면 무시)"""
+        particles = self.particles
+        if particles is None:
             return
+        floor_y = GAME_FIELD_Y + floor_num * FLOOR_HEIGHT
+        if kind == 'dig':
+            # 삽 끝에서 흙이 위로 튄다
+            particles.emit('dirt', 3, x + PLAYER_SIZE // 2 + 10, floor_y + FLOOR_HEIGHT - 15, DIRT_COLORS,
+                           speed=(1.5, 3.5), angle=(-math.pi * 0.9, -math.pi * 0.1))
+        elif kind == 'hole':
+            particles.emit('dirt', 80, x, floor_y + FLOOR_HEIGHT - 10, DIRT_COLORS,
+                           speed=(1.0, 4.0), angle=(-math.pi, 0.0), spread=(PLAYER_SIZE // 2 + 10, 4))
+        elif kind == 'gimmick':
+            colors = [gimmick_color(detail), TEXT_PRIMARY]
+            particles.emit('sparkle', 150, x, floor_y + FLOOR_HEIGHT // 2, colors, speed=(0.5, 3.0), spread=(40, 30))
+            if detail == 'teleport':
+                # 도착 지점에도 반짝임
+                arrive_y = GAME_FIELD_Y + self.player.current_floor * FLOOR_HEIGHT + FLOOR_HEIGHT // 2
+                particles.emit('sparkle', 150, self.player.x + self.player.width // 2, arrive_y, colors, speed=(0.5, 3.0), spread=(30, 30))
+        elif kind == 'gameover':
+            particles.emit('burst', 400, x, floor_y + 10 + PLAYER_SIZE // 2, [DANGER, TEXT_PRIMARY, WARNING], speed=(1.0, 6.0))
+    
+    def draw(self):
+        """화면 그리기 - 레이어별로 바뀐 부분만 그린 뒤 더티 영역만 표시"""
+        _SURFACE_POOL.begin_frame()
         
-        player_rect = self.player.get_rect()
+        # 그리는 동안만 카메라를 틱 사이 보간 위치로
+        sim_camera_y = self.camera_y
+        self.camera_y = int(self.prev_camera_y + (sim_camera_y - self.prev_camera_y) * self.render_alpha)
         
-        for monster in self.monsters:
-            if monster.floor == self.player.current_floor:
-                monster_rect = monster.get_rect()
-                if player_rect.colliderect(monster_rect):
-                    # 게임오버 시에도 기록 저장
-                    self.final_time = self.elapsed_time
-                    if self.check_ranking(self.player.current_floor, self.final_time / 1000):
-                        self.is_new_record = True
-                        self.game_state = "name_input"
-                    else:
-                        self.is_new_record = False
-                        self.game_state = "gameover"
-                    return
+        if self.render_backend == "surface":
+            self.draw_world()
+        else:
+            self.compositor.draw_world(get_world_background(), self.world_chunks, self.camera_y)
+        self.draw_entities()
+        self.compositor.set_lighting(self.update_lighting())
+        
+        hud = self.compositor.hud
+        for rect in self.draw_ui(hud.surface):
+            hud.mark(rect)
+        self.draw_minimap()
+        
+        self.draw_overlay()
+        self.compositor.present()
+        self.camera_y = sim_camera_y
     
-    def draw(self):
-        """화면 그리기"""
-        # 그라디언트 배경
-        for y in range(SCREEN_HEIGHT):
-            alpha = y / SCREEN_HEIGHT
-            r = int(BG_DARKER[0] + (BG_DARK[0] - BG_DARKER[0]) * alpha)
-            g = int(BG_DARKER[1] + (BG_DARK[1] - BG_DARKER[1]) * alpha)
-            b = int(BG_DARKER[2] + (BG_DARK[2] - BG_DARKER[2]) * alpha)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-        
-        # 층 그리기
-        for floor in self.floors:
-            floor_num = floor['floor_num']
-            y_pos = GAME_FIELD_Y + floor_num * FLOOR_HEIGHT - self.camera_y
-            
-            if GAME_FIELD_Y - FLOOR_HEIGHT <= y_pos <= SCREEN_HEIGHT:
-                if floor_num == 0:
-                    base_color = GROUND_SURFACE
-                    dark_color = GROUND_SURFACE_DARK
-                else:
-                    base_color = GROUND_UNDERGROUND
-                    dark_color = GROUND_UNDERGROUND_DARK
-                
-                floor_rect = pygame.Rect(55, y_pos + 5, SCREEN_WIDTH - 110, FLOOR_HEIGHT - 10)
-                
-                for i in range(FLOOR_HEIGHT - 10):
-                    alpha = i / (FLOOR_HEIGHT - 10)
-                    r = int(base_color[0] + (dark_color[0] - base_color[0]) * alpha)
-                    g = int(base_color[1] + (dark_color[1] - base_color[1]) * alpha)
-                    b = int(base_color[2] + (dark_color[2] - base_color[2]) * alpha)
-                    pygame.draw.line(self.screen, (r, g, b), (55, y_pos + 5 + i), (SCREEN_WIDTH - 55, y_pos + 5 + i))
-                
-                for hole_start, hole_end in floor['holes']:
-                    hole_width = hole_end - hole_start
-                    hole_rect = pygame.Rect(hole_start, y_pos, hole_width, FLOOR_HEIGHT)
-                    if hole_rect.right > 55 and hole_rect.left < SCREEN_WIDTH - 55:
-                        draw_rounded_rect(self.screen, HOLE_COLOR, hole_rect, 10, 3, CARD_BORDER)
-                        for i in range(FLOOR_HEIGHT - 6):
-                            alpha = i / FLOOR_HEIGHT
-                            shade = int(23 + 20 * alpha)
-                            pygame.draw.line(self.screen, (shade, shade, shade), (hole_start + 10, y_pos + 3 + i), (hole_start + hole_width - 10, y_pos + 3 + i))
-                
-                pygame.draw.rect(self.screen, CARD_BORDER, floor_rect, 2, border_radius=8)
-                
-                if floor_num == 0:
-                    floor_label = "지상"
-                    label_color = SUCCESS
-                    label_width = 38
-                elif floor_num == TOTAL_FLOORS - 1:
-                    floor_label = "B50"
-                    label_color = (255, 192, 203)  # 공주가 있는 층이므로 분홍색 유지
-                    label_width = 42
-                else:
-                    floor_label = f"B{floor_num}"
-                    label_color = TEXT_SECONDARY
-                    label_width = 38 if floor_num < 10 else 42
-                
-                label_bg = pygame.Rect(10, y_pos + FLOOR_HEIGHT // 2 - 12, label_width, 24)
-                draw_rounded_rect(self.screen, CARD_BG, label_bg, 5)
-                pygame.draw.rect(self.screen, CARD_BORDER, label_bg, 1, border_radius=5)
-                
-                floor_text = self.font_micro.render(floor_label, True, label_color)
-                text_rect = floor_text.get_rect(center=(label_bg.centerx, label_bg.centery))
-                self.screen.blit(floor_text, text_rect)
+    def draw_world(self):
+        """월드 레이어 (배경 + 월드 청크) - 카메라가 움직이면 전체, 아니면 바뀐 청크만 다시 그린다"""
+        world = self.compositor.world
+        background = get_world_background()
+        full = self._world_camera_y != self.camera_y
+        if full:
+            self._world_camera_y = self.camera_y
+            self._world_versions = {}
+            world.surface.blit(background, (0, 0))
+            world.mark_all()
+        
+        first, last = self.world_chunks.visible_range(self.camera_y)
+        for index in range(first, last + 1):
+            chunk = self.world_chunks.get(index)
+            version = self.world_chunks.versions[index]
+            if self._world_versions.get(index) == version:
+                continue
+            self._world_versions[index] = version
+            rect = self.world_chunks.screen_rect(index, self.camera_y)
+            if not full:
+                # 구멍/기믹이 바뀐 청크 영역만 배경부터 다시 합성
+                world.surface.blit(background, rect, rect)
+                world.mark(rect)
+            world.surface.blit(chunk, rect)
+    
+    def draw_entities(self):
+        """엔티티 레이어 - 이전 프레임 영역을 지우고 현재 위치에 다시 그린다"""
+        compositor = self.compositor
+        layer = compositor.entity_target
+        compositor.begin_entities()
+        
+        # 보이는 층의 버킷만 방문
+        first_floor, last_floor = visible_floor_range(self.camera_y)
         
         # 기믹 그리기
-        for gimmick in self.gimmicks:
-            gimmick.draw(self.screen, self.camera_y)
+        for floor_num in range(first_floor, last_floor + 1):
+            for gimmick in self.gimmick_index.on_floor(floor_num):
+                compositor.add_entity_rect(gimmick.draw(layer, self.camera_y, self.anim_tick))
         
         # 몬스터 그리기
-        for monster in self.monsters:
-            monster_y = monster.y - self.camera_y
-            if GAME_FIELD_Y - FLOOR_HEIGHT <= monster_y <= SCREEN_HEIGHT:
-                monster.draw(self.screen, self.camera_y)
+        for floor_num in range(first_floor, last_floor + 1):
+            if self.monster_engine is not None:
+                self.monster_engine.sync(self.monsters_by_floor[floor_num])
+            for monster in self.monsters_by_floor[floor_num]:
+                compositor.add_entity_rect(monster.draw(layer, self.camera_y, self.render_alpha))
         
         # 플레이어 그리기
-        self.player.draw(self.screen, self.camera_y)
+        compositor.add_entity_rect(self.player.draw(layer, self.camera_y, self.render_alpha))
+        
+        # 파티클 (흙, 반짝임, 게임오버)
+        if self.particles is not None:
+            for rect in self.particles.draw(layer, self.camera_y):
+                compositor.add_entity_rect(rect)
         
         # 공주 그리기 (50층)
         if self.player.current_floor >= TOTAL_FLOORS - 1:
-            self.draw_princess()
-        
-        self.draw_ui()
+            compositor.add_entity_rect(self.draw_princess(layer))
+    
+    def update_lighting(self):
+        """이번 프레임 조명 상태 (지상/View 모드/꺼짐이면 None)"""
+        ambient = ambient_for_floor(self.player.current_floor)
+        if not self.lighting_enabled or self.view_mode or ambient >= 255:
+            return None
+        center = (
+            int(self.player.render_x(self.render_alpha)) + self.player.width // 2,
+            GAME_FIELD_Y + self.player.current_floor * FLOOR_HEIGHT + 10 + self.player.height // 2 - self.camera_y,
+        )
+        self.lighting.set_state(ambient, self.light_radius, center)
+        return self.lighting
+    
+    def draw_minimap(self):
+        """미니맵 (View 모드에서만 HUD 레이어에 표시)"""
+        hud = self.compositor.hud
+        show = self.view_mode and self.game_state == "playing"
+        if show:
+            hud.mark(self.minimap.draw(hud.surface, self.camera_y, self.player))
+        elif self._minimap_visible:
+            hud.clear(MINIMAP_RECT)
+        self._minimap_visible = show
+    
+    def draw_overlay(self):
+        """오버레이 레이어 (게임오버/이름 입력/클리어) - 정적인 부분은 화면이 열릴 때 한 번, 이후엔 바뀐 애니메이션 조각만 다시 그린다"""
+        compositor = self.compositor
+        modal = {
+            "gameover": (self.draw_gameover, self.animate_gameover),
+            "name_input": (self.draw_name_input, self.animate_name_input),
+            "clear": (self.draw_clear, self.animate_clear),
+        }.get(self.game_state)
+        
+        compositor.set_overlay_active(modal is not None)
+        if modal is None:
+            self._overlay_state = None
+            return
         
-        if self.game_state == "gameover":
-            self.draw_gameover()
-        elif self.game_state == "name_input":
-            self.draw_name_input()
-        elif self.game_state == "clear":
-            self.draw_clear()
+        draw_static, animate = modal
+        overlay = compositor.overlay
+        surface = overlay.surface
+        pieces = [(rect.clip(SCREEN_RECT), key, paint) for rect, key, paint in animate()]
+        if self._overlay_state != self.game_state:
+            # 화면이 처음 열린 프레임: 전체를 그리고, 조각 영역의 글로우 아래/위 정적 그림을 떼어 둔다
+            self._overlay_state = self.game_state
+            surface.fill((0, 0, 0, 0))
+            draw_static(surface, False)
+            self._overlay_below = [surface.subsurface(rect).copy() for rect, _, _ in pieces]
+            above = get_scratch_surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            draw_static(above, True)
+            self._overlay_above = [above.subsurface(rect).copy() for rect, _, _ in pieces]
+            for _, _, paint in pieces:
+                paint(surface)
+            surface.blit(above, (0, 0))
+            self._overlay_keys = [key for _, key, _ in pieces]
+            overlay.mark_all()
+            return
         
-        pygame.display.flip()
+        for i, (rect, key, _) in enumerate(pieces):
+            if key == self._overlay_keys[i]:
+                continue
+            self._overlay_keys[i] = key
+            # 조각 영역만: 아래 그림 복원 -> 애니메이션(겹치는 다른 조각 포함) -> 위 그림
+            surface.set_clip(rect)
+            surface.fill((0, 0, 0, 0), rect)
+            surface.blit(self._overlay_below[i], rect, special_flags=pygame.BLEND_RGBA_MAX)
+            for _, _, paint in pieces:
+                paint(surface)
+            surface.blit(self._overlay_above[i], rect)
+            surface.set_clip(None)
+            overlay.mark(rect)
     
-    def draw_princess(self):
-        """공주 그리기"""
+    def draw_princess(self, surface):
+        """공주 그리기 (그린 영역 반환)"""
         y_pos = GAME_FIELD_Y + (TOTAL_FLOORS - 1) * FLOOR_HEIGHT + 20 - self.camera_y
         princess_x = SCREEN_WIDTH // 2 + 100
         
         # 공주 (분홍색 드레스)
-        pygame.draw.circle(self.screen, (255, 220, 177), (princess_x, int(y_pos + 15)), 15)
-        pygame.draw.polygon(self.screen, (255, 192, 203), [(princess_x - 20, y_pos + 30), (princess_x + 20, y_pos + 30), (princess_x + 25, y_pos + 55), (princess_x - 25, y_pos + 55)])
+        princess_rect = surface.blit(get_princess_sprite(), (princess_x - 25, int(y_pos)))
         
         # 하트
-        heart_x = (self.player.x + princess_x) // 2
-        heart_y = y_pos + 20
-        pygame.draw.circle(self.screen, (255, 0, 127), (heart_x - 8, heart_y), 10)
-        pygame.draw.circle(self.screen, (255, 0, 127), (heart_x + 8, heart_y), 10)
-        pygame.draw.polygon(self.screen, (255, 0, 127), [(heart_x - 18, heart_y), (heart_x, heart_y + 20), (heart_x + 18, heart_y)])
-    
-    def draw_ui(self):
-        """UI 그리기"""
-        pygame.draw.rect(self.screen, BG_DARK, (0, 0, SCREEN_WIDTH, UI_HEIGHT))
-        
-        gradient_surf = pygame.Surface((SCREEN_WIDTH, 5), pygame.SRCALPHA)
-        for i in range(5):
-            alpha = int(100 - (i * 20))
-            color = CARD_BORDER + (alpha,)
-            pygame.draw.line(gradient_surf, color, (0, i), (SCREEN_WIDTH, i))
-        self.screen.blit(gradient_surf, (0, UI_HEIGHT - 5))
-        
-        # 왼쪽 카드: 현재 층 정보 (크기 축소)
+        heart_x = int(self.player.x + princess_x) // 2
+        heart_y = int(y_pos) + 20
+        princess_rect.union_ip(surface.blit(get_heart_sprite(), (heart_x - 18, heart_y - 10)))
+        return princess_rect
+    
+    def draw_ui(self, surface):
+        """UI 그리기 - 값이 바뀐 카드만 다시 그리고 다시 그린 영역을 반환"""
+        hud = self._hud_cache
+        dirty = []
+        
+        # 배경, 카드 틀, 조작법 카드: 최초 1회만
+        if not hud:
+            self._draw_ui_static(surface)
+            dirty.append(pygame.Rect(0, 0, SCREEN_WIDTH, UI_HEIGHT))
+        
+        # 왼쪽 카드: 현재 층이 바뀐 경우만
+        if hud.get('floor') != self.player.current_floor:
+            hud['floor'] = self.player.current_floor
+            dirty.append(self._draw_floor_card(surface))
+        
+        # View 버튼: View 모드나 호버 상태가 바뀐 경우만
+        view_button_rect = pygame.Rect(170, 10, 100, 70)
+        is_hovering = bool(view_button_rect.collidepoint(pygame.mouse.get_pos()))
+        if hud.get('hover') != is_hovering:
+            # 커서는 호버 상태가 바뀔 때만 변경
+            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND if is_hovering else pygame.SYSTEM_CURSOR_ARROW)
+        if (hud.get('view_mode'), hud.get('hover')) != (self.view_mode, is_hovering):
+            hud['view_mode'] = self.view_mode
+            hud['hover'] = is_hovering
+            dirty.append(self._draw_view_button(surface, view_button_rect, is_hovering))
+        
+        # 중앙 카드: 표시되는 1/100초 값이 바뀐 경우만
+        time_display = self.format_time(self.world.elapsed_time)
+        if hud.get('time') != time_display:
+            hud['time'] = time_display
+            dirty.append(self._draw_timer_card(surface, time_display))
+        
+        return dirty
+    
+    def _draw_ui_static(self, surface):
+        """UI 배경과 바뀌지 않는 카드"""
+        pygame.draw.rect(surface, BG_DARK, (0, 0, SCREEN_WIDTH, UI_HEIGHT))
+        
+        if RENDER_QUALITY["gradients"]:
+            gradient_surf = get_gradient_surface((SCREEN_WIDTH, 5), CARD_BORDER, CARD_BORDER, (100, 0))
+            surface.blit(gradient_surf, (0, UI_HEIGHT - 5))
+        
+        # 우측 카드: 조작법
+        right_card = pygame.Rect(490, 10, 300, 70)
+        draw_rounded_rect(surface, CARD_BG, right_card, 10, 2, CARD_BORDER)
+        
+        controls_label = render_text(16, "조작법", TEXT_MUTED)
+        control_line1 = render_text(16, "이동: A , D  내려가기: S  파기: L", TEXT_SECONDARY)
+        control_line2 = render_text(16, "점프: Space  View 모드: V key", TEXT_SECONDARY)
+        
+        surface.blit(controls_label, (500, 14))
+        surface.blit(control_line1, (500, 36))
+        surface.blit(control_line2, (500, 58))
+    
+    def _draw_floor_card(self, surface):
+        """왼쪽 카드: 현재 층 정보 (크기 축소)"""
         left_card = pygame.Rect(10, 10, 150, 70)
-        draw_rounded_rect(self.screen, CARD_BG, left_card, 10, 2, CARD_BORDER)
+        pygame.draw.rect(surface, BG_DARK, left_card)
+        draw_rounded_rect(surface, CARD_BG, left_card, 10, 2, CARD_BORDER)
         
         if self.player.current_floor == 0:
             floor_display = "지상"
@@ -920,17 +2719,17 @@ class Game:
             floor_display = f"B{self.player.current_floor}"
             floor_color = PRIMARY
         
-        floor_label = self.font_micro.render("위치", True, TEXT_MUTED)
-        floor_text = self.font_micro.render(floor_display, True, floor_color)
-        goal_text = self.font_micro.render("→ B50", True, TEXT_SECONDARY)
-        
-        self.screen.blit(floor_label, (20, 16))
-        self.screen.blit(floor_text, (20, 35))
-        self.screen.blit(goal_text, (20, 63))
-        
-        # View 버튼 카드 (현재 위치 옆)
-        view_button_rect = pygame.Rect(170, 10, 100, 70)
+        floor_label = render_text(16, "위치", TEXT_MUTED)
+        floor_text = render_text(16, floor_display, floor_color)
+        goal_text = render_text(16, "→ B50", TEXT_SECONDARY)
         
+        surface.blit(floor_label, (20, 16))
+        surface.blit(floor_text, (20, 35))
+        surface.blit(goal_text, (20, 63))
+        return left_card
+    
+    def _draw_view_button(self, surface, view_button_rect, is_hovering):
+        """View 버튼 카드 (현재 위치 옆)"""
         # View 모드에 따라 버튼 색상 변경
         if self.view_mode:
             button_color = PRIMARY
@@ -944,80 +2743,77 @@ class Game:
             status_text = "OFF"
         
         # 마우스 호버 효과
-        mouse_pos = pygame.mouse.get_pos()
-        is_hovering = view_button_rect.collidepoint(mouse_pos)
         if is_hovering:
             button_color = tuple(min(c + 20, 255) for c in button_color[:3])
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-        else:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         
-        draw_rounded_rect(self.screen, button_color, view_button_rect, 10, 2, border_color)
+        pygame.draw.rect(surface, BG_DARK, view_button_rect)
+        draw_rounded_rect(surface, button_color, view_button_rect, 10, 2, border_color)
         
         # 버튼 내용 (이모지 대신 텍스트 사용)
-        view_label = self.font_micro.render("VIEW", True, TEXT_MUTED)
-        mode_label = self.font_micro.render("전체맵", True, text_color)
-        status_label = self.font_micro.render(status_text, True, text_color)
-        
-        self.screen.blit(view_label, (178, 14))
-        self.screen.blit(mode_label, (178, 33))
-        self.screen.blit(status_label, (178, 54))
-        
-        # 중앙 카드: 타이머
+        view_label = render_text(16, "VIEW", TEXT_MUTED)
+        mode_label = render_text(16, "전체맵", text_color)
+        status_label = render_text(16, status_text, text_color)
+        
+        surface.blit(view_label, (178, 14))
+        surface.blit(mode_label, (178, 33))
+        surface.blit(status_label, (178, 54))
+        return view_button_rect
+    
+    def _draw_timer_card(self, surface, time_display):
+        """중앙 카드: 타이머"""
         center_card = pygame.Rect(280, 10, 200, 70)
-        draw_rounded_rect(self.screen, CARD_BG, center_card, 10, 2, WARNING)
+        pygame.draw.rect(surface, BG_DARK, center_card)
+        draw_rounded_rect(surface, CARD_BG, center_card, 10, 2, WARNING)
         
-        time_display = self.format_time(self.elapsed_time)
-        timer_label = self.font_micro.render("⏱ TIMER", True, TEXT_MUTED)
-        time_text = self.font_medium.render(time_display, True, WARNING)
+        timer_label = render_text(16, "⏱ TIMER", TEXT_MUTED)
+        time_atlas = get_glyph_atlas(32, WARNING)
         
         timer_rect = timer_label.get_rect(center=(380, 22))
-        time_rect = time_text.get_rect(center=(380, 52))
-        
-        glow_surf = pygame.Surface((time_text.get_width() + 40, 40), pygame.SRCALPHA)
-        pygame.draw.ellipse(glow_surf, WARNING + (30,), (0, 0, time_text.get_width() + 40, 40))
-        self.screen.blit(glow_surf, (time_rect.x - 20, time_rect.y - 5))
-        
-        self.screen.blit(timer_label, timer_rect)
-        self.screen.blit(time_text, time_rect)
-        
-        # 우측 카드: 조작법
-        right_card = pygame.Rect(490, 10, 300, 70)
-        draw_rounded_rect(self.screen, CARD_BG, right_card, 10, 2, CARD_BORDER)
-        
-        controls_label = self.font_micro.render("조작법", True, TEXT_MUTED)
-        control_line1 = self.font_micro.render("이동: A , D  내려가기: S  파기: L", True, TEXT_SECONDARY)
-        control_line2 = self.font_micro.render("점프: Space  View 모드: V key", True, TEXT_SECONDARY)
-        
-        self.screen.blit(controls_label, (500, 14))
-        self.screen.blit(control_line1, (500, 36))
-        self.screen.blit(control_line2, (500, 58))
-    
-    def draw_gameover(self):
-        """게임 오버 화면"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for y in range(SCREEN_HEIGHT):
-            alpha = int(180 + (y / SCREEN_HEIGHT) * 60)
-            pygame.draw.line(overlay, BG_DARKER + (alpha,), (0, y), (SCREEN_WIDTH, y))
-        self.screen.blit(overlay, (0, 0))
-        
-        card_rect = pygame.Rect(SCREEN_WIDTH // 2 - 250, SCREEN_HEIGHT // 2 - 150, 500, 300)
-        shadow_surf = pygame.Surface((card_rect.width, card_rect.height), pygame.SRCALPHA)
-        shadow_surf.fill((0, 0, 0, 100))
-        self.screen.blit(shadow_surf, (card_rect.x + 8, card_rect.y + 8))
-        draw_rounded_rect(self.screen, CARD_BG, card_rect, 20, 3, DANGER)
-        
+        time_width = time_atlas.measure(time_display)
+        time_rect = pygame.Rect(0, 0, time_width, time_atlas.height)
+        time_rect.center = (380, 52)
+        
+        if RENDER_QUALITY["glows"]:
+            glow_surf = get_scratch_surface((time_width + 40, 40))
+            pygame.draw.ellipse(glow_surf, WARNING + (30,), (0, 0, time_width + 40, 40))
+            surface.blit(glow_surf, (time_rect.x - 20, time_rect.y - 5))
+        
+        surface.blit(timer_label, timer_rect)
+        time_atlas.draw(surface, time_display, topleft=time_rect.topleft)
+        return center_card
+    
+    def animate_gameover(self):
+        """게임 오버 화면의 애니메이션 조각 [(영역, 상태, 그리기 함수)] - 상태가 바뀐 조각만 다시 그린다"""
         pulse = abs(((pygame.time.get_ticks() // 10) % 100) - 50) / 50
         glow_size = int(100 + pulse * 50)
-        glow_surf = pygame.Surface((glow_size * 3, glow_size), pygame.SRCALPHA)
-        pygame.draw.ellipse(glow_surf, DANGER + (50,), (0, 0, glow_size * 3, glow_size))
-        self.screen.blit(glow_surf, (SCREEN_WIDTH // 2 - glow_size * 1.5, SCREEN_HEIGHT // 2 - 100 - glow_size // 2))
         
-        gameover_text = self.font_large.render("💀 GAME OVER", True, DANGER)
+        def draw_glow(surface):
+            if RENDER_QUALITY["glows"]:
+                draw_glow_ellipse(surface, DANGER + (50,), (glow_size * 3, glow_size),
+                                  (SCREEN_WIDTH // 2 - glow_size * 1.5, SCREEN_HEIGHT // 2 - 100 - glow_size // 2))
+        
+        # 영역: 펄스 글로우의 최대 크기
+        glow_rect = pygame.Rect(0, 0, 450, 150).move(SCREEN_WIDTH // 2 - 225, SCREEN_HEIGHT // 2 - 175)
+        return [(glow_rect, glow_size if RENDER_QUALITY["glows"] else None, draw_glow)]
+    
+    def draw_gameover(self, surface, above):
+        """게임 오버 화면의 정적인 부분 (above가 False면 글로우 아래 배경/카드, True면 그 위 글자)"""
+        if not above:
+            draw_modal_backdrop(surface, (180, 240))
+            
+            card_rect = pygame.Rect(SCREEN_WIDTH // 2 - 250, SCREEN_HEIGHT // 2 - 150, 500, 300)
+            if RENDER_QUALITY["shadows"]:
+                shadow_surf = get_scratch_surface((card_rect.width, card_rect.height))
+                shadow_surf.fill((0, 0, 0, 100))
+                surface.blit(shadow_surf, (card_rect.x + 8, card_rect.y + 8))
+            draw_rounded_rect(surface, CARD_BG, card_rect, 20, 3, DANGER)
+            return
+        
+        gameover_text = render_text(60, "💀 GAME OVER", DANGER)
         text_rect = gameover_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 70))
-        self.screen.blit(gameover_text, text_rect)
+        surface.blit(gameover_text, text_rect)
         
-        pygame.draw.line(self.screen, CARD_BORDER, (SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2 - 10), (SCREEN_WIDTH // 2 + 200, SCREEN_HEIGHT // 2 - 10), 2)
+        pygame.draw.line(surface, CARD_BORDER, (SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2 - 10), (SCREEN_WIDTH // 2 + 200, SCREEN_HEIGHT // 2 - 10), 2)
         
         # 도달한 층과 플레이 타임 표시
         floor_num = self.player.current_floor
@@ -1026,58 +2822,82 @@ class Game:
         else:
             floor_str = f"B{floor_num}"
         
-        floor_label = self.font_small.render("도달한 층", True, TEXT_MUTED)
-        floor_text = self.font_medium.render(floor_str, True, INFO)
+        floor_label = render_text(24, "도달한 층", TEXT_MUTED)
+        floor_text = render_text(32, floor_str, INFO)
         
         floor_label_rect = floor_label.get_rect(center=(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 20))
         floor_rect = floor_text.get_rect(center=(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 50))
         
-        self.screen.blit(floor_label, floor_label_rect)
-        self.screen.blit(floor_text, floor_rect)
+        surface.blit(floor_label, floor_label_rect)
+        surface.blit(floor_text, floor_rect)
         
         time_display = self.format_time(self.final_time)
-        time_label = self.font_small.render("플레이 타임", True, TEXT_MUTED)
-        time_text = self.font_medium.render(time_display, True, PRIMARY)
+        time_label = render_text(24, "플레이 타임", TEXT_MUTED)
+        time_text = render_text(32, time_display, PRIMARY)
         
         time_label_rect = time_label.get_rect(center=(SCREEN_WIDTH // 2 + 100, SCREEN_HEIGHT // 2 + 20))
         time_rect = time_text.get_rect(center=(SCREEN_WIDTH // 2 + 100, SCREEN_HEIGHT // 2 + 50))
         
-        self.screen.blit(time_label, time_label_rect)
-        self.screen.blit(time_text, time_rect)
+        surface.blit(time_label, time_label_rect)
+        surface.blit(time_text, time_rect)
         
-        restart_label = self.font_small.render("다시 도전하기", True, TEXT_MUTED)
-        restart_text = self.font_medium.render("R 키", True, PRIMARY)
+        restart_label = render_text(24, "다시 도전하기", TEXT_MUTED)
+        restart_text = render_text(32, "R 키", PRIMARY)
         
         restart_label_rect = restart_label.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 140))
         
-        self.screen.blit(restart_label, restart_label_rect)
-        self.screen.blit(restart_text, restart_rect)
-    
-    def draw_name_input(self):
-        """이름 입력 화면"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for y in range(SCREEN_HEIGHT):
-            alpha = int(200 + (y / SCREEN_HEIGHT) * 40)
-            pygame.draw.line(overlay, BG_DARKER + (alpha,), (0, y), (SCREEN_WIDTH, y))
-        self.screen.blit(overlay, (0, 0))
-        
-        # ESC 안내 문구까지 테두리(카드) 안에 들어오도록 카드 높이를 확대
-        card_rect = pygame.Rect(SCREEN_WIDTH // 2 - 280, SCREEN_HEIGHT // 2 - 200, 560, 400)
-        shadow_surf = pygame.Surface((card_rect.width, card_rect.height), pygame.SRCALPHA)
-        shadow_surf.fill((0, 0, 0, 120))
-        self.screen.blit(shadow_surf, (card_rect.x + 10, card_rect.y + 10))
-        draw_rounded_rect(self.screen, CARD_BG, card_rect, 25, 3, WARNING)
+        surface.blit(restart_label, restart_label_rect)
+        surface.blit(restart_text, restart_rect)
         
+        # 같은 판을 공유/재도전할 수 있게 시드 표시 (TUNNELINGGAME_SEED)
+        seed_text = render_text(16, f"시드 {self.world.seed}", TEXT_MUTED)
+        surface.blit(seed_text, seed_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 175)))
+    
+    def animate_name_input(self):
+        """이름 입력 화면의 애니메이션 조각 (펄스 글로우, 이름/커서가 바뀌는 입력 상자)"""
         pulse = abs(((pygame.time.get_ticks() // 10) % 100) - 50) / 50
         glow_size = int(120 + pulse * 60)
-        glow_surf = pygame.Surface((glow_size * 2, glow_size), pygame.SRCALPHA)
-        pygame.draw.ellipse(glow_surf, WARNING + (60,), (0, 0, glow_size * 2, glow_size))
-        self.screen.blit(glow_surf, (SCREEN_WIDTH // 2 - glow_size, SCREEN_HEIGHT // 2 - 140 - glow_size // 2))
         
-        congrats_text = self.font_large.render("🏆 신기록! 🏆", True, WARNING)
+        def draw_glow(surface):
+            if RENDER_QUALITY["glows"]:
+                draw_glow_ellipse(surface, WARNING + (60,), (glow_size * 2, glow_size),
+                                  (SCREEN_WIDTH // 2 - glow_size, SCREEN_HEIGHT // 2 - 140 - glow_size // 2))
+        
+        input_box = pygame.Rect(SCREEN_WIDTH // 2 - 180, SCREEN_HEIGHT // 2 + 55, 360, 60)
+        cursor_blink = (pygame.time.get_ticks() // 500) % 2
+        display_name = self.player_name + ("_" if cursor_blink else "")
+        
+        def draw_input(surface):
+            draw_nine_slice_rect(surface, BG_DARK, input_box, 12, 3, PRIMARY)
+            name_text = render_text(32, display_name, TEXT_PRIMARY)
+            name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 85))
+            surface.blit(name_text, name_rect)
+        
+        # 영역: 펄스 글로우의 최대 크기, 입력 상자
+        glow_rect = pygame.Rect(SCREEN_WIDTH // 2 - 180, SCREEN_HEIGHT // 2 - 230, 360, 180)
+        return [
+            (glow_rect, glow_size if RENDER_QUALITY["glows"] else None, draw_glow),
+            (input_box, display_name, draw_input),
+        ]
+    
+    def draw_name_input(self, surface, above):
+        """이름 입력 화면의 정적인 부분 (above가 False면 글로우 아래 배경/카드, True면 그 위 글자)"""
+        if not above:
+            draw_modal_backdrop(surface, (200, 240))
+            
+            # ESC 안내 문구까지 테두리(카드) 안에 들어오도록 카드 높이를 확대
+            card_rect = pygame.Rect(SCREEN_WIDTH // 2 - 280, SCREEN_HEIGHT // 2 - 200, 560, 400)
+            if RENDER_QUALITY["shadows"]:
+                shadow_surf = get_scratch_surface((card_rect.width, card_rect.height))
+                shadow_surf.fill((0, 0, 0, 120))
+                surface.blit(shadow_surf, (card_rect.x + 10, card_rect.y + 10))
+            draw_rounded_rect(surface, CARD_BG, card_rect, 25, 3, WARNING)
+            return
+        
+        congrats_text = render_text(60, "🏆 신기록! 🏆", WARNING)
         congrats_rect = congrats_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 140))
-        self.screen.blit(congrats_text, congrats_rect)
+        surface.blit(congrats_text, congrats_rect)
         
         # 도착한 층 표시
         floor_num = self.player.current_floor
@@ -1085,98 +2905,103 @@ class Game:
             floor_str = "지상"
         else:
             floor_str = f"B{floor_num}"
-        floor_label = self.font_small.render("도착한 층", True, TEXT_MUTED)
+        floor_label = render_text(24, "도착한 층", TEXT_MUTED)
         floor_color = (255, 192, 203) if floor_num >= TOTAL_FLOORS - 1 else INFO
-        floor_text = self.font_medium.render(floor_str, True, floor_color)
+        floor_text = render_text(32, floor_str, floor_color)
         
         floor_label_rect = floor_label.get_rect(center=(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 80))
         floor_rect = floor_text.get_rect(center=(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 50))
         
-        self.screen.blit(floor_label, floor_label_rect)
-        self.screen.blit(floor_text, floor_rect)
+        surface.blit(floor_label, floor_label_rect)
+        surface.blit(floor_text, floor_rect)
         
         # 시간 표시
         time_display = self.format_time(self.final_time)
-        time_label = self.font_small.render("플레이 타임", True, TEXT_MUTED)
-        time_text = self.font_medium.render(time_display, True, PRIMARY)
+        time_label = render_text(24, "플레이 타임", TEXT_MUTED)
+        time_text = render_text(32, time_display, PRIMARY)
         
         time_label_rect = time_label.get_rect(center=(SCREEN_WIDTH // 2 + 100, SCREEN_HEIGHT // 2 - 80))
         time_rect = time_text.get_rect(center=(SCREEN_WIDTH // 2 + 100, SCREEN_HEIGHT // 2 - 50))
         
-        self.screen.blit(time_label, time_label_rect)
-        self.screen.blit(time_text, time_rect)
+        surface.blit(time_label, time_label_rect)
+        surface.blit(time_text, time_rect)
         
-        pygame.draw.line(self.screen, CARD_BORDER, (SCREEN_WIDTH // 2 - 230, SCREEN_HEIGHT // 2 - 15), (SCREEN_WIDTH // 2 + 230, SCREEN_HEIGHT // 2 - 15), 2)
+        pygame.draw.line(surface, CARD_BORDER, (SCREEN_WIDTH // 2 - 230, SCREEN_HEIGHT // 2 - 15), (SCREEN_WIDTH // 2 + 230, SCREEN_HEIGHT // 2 - 15), 2)
         
-        prompt_text = self.font_small.render("명예의 전당에 새길 이름 (최대 10글자)", True, TEXT_SECONDARY)
+        prompt_text = render_text(24, "명예의 전당에 새길 이름 (최대 10글자)", TEXT_SECONDARY)
         prompt_rect = prompt_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-        self.screen.blit(prompt_text, prompt_rect)
+        surface.blit(prompt_text, prompt_rect)
         
-        input_box = pygame.Rect(SCREEN_WIDTH // 2 - 180, SCREEN_HEIGHT // 2 + 55, 360, 60)
-        draw_rounded_rect(self.screen, BG_DARK, input_box, 12, 3, PRIMARY)
-        
-        cursor_blink = (pygame.time.get_ticks() // 500) % 2
-        display_name = self.player_name + ("_" if cursor_blink else "")
-        name_text = self.font_medium.render(display_name, True, TEXT_PRIMARY)
-        name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 85))
-        self.screen.blit(name_text, name_rect)
-        
-        confirm_text = self.font_small.render("Enter 키를 눌러 등록", True, SUCCESS)
+        confirm_text = render_text(24, "Enter 키를 눌러 등록", SUCCESS)
         confirm_rect = confirm_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 135))
-        self.screen.blit(confirm_text, confirm_rect)
+        surface.blit(confirm_text, confirm_rect)
 
-        skip_text = self.font_small.render("ESC 키로 건너뛰기", True, TEXT_MUTED)
+        skip_text = render_text(24, "ESC 키로 건너뛰기", TEXT_MUTED)
         skip_rect = skip_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 165))
-        self.screen.blit(skip_text, skip_rect)
+        surface.blit(skip_text, skip_rect)
     
-    def draw_clear(self):
-        """클리어 화면"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for y in range(SCREEN_HEIGHT):
-            alpha = int(200 + (y / SCREEN_HEIGHT) * 40)
-            pygame.draw.line(overlay, BG_DARKER + (alpha,), (0, y), (SCREEN_WIDTH, y))
-        self.screen.blit(overlay, (0, 0))
-        
+    def animate_clear(self):
+        """클리어 화면의 애니메이션 조각 (무지개색 펄스 글로우, 무지개색 타이틀)"""
         time_offset = pygame.time.get_ticks() // 100
         color_r = abs(int(127 * (1 + pygame.math.Vector2(1, 0).rotate(time_offset * 10).x)))
         color_g = abs(int(127 * (1 + pygame.math.Vector2(1, 0).rotate(time_offset * 15).y)))
-        color_b = 255
+        color = (color_r, color_g, 255)
         
         pulse = abs(((pygame.time.get_ticks() // 10) % 100) - 50) / 50
         glow_size = int(150 + pulse * 80)
-        glow_surf = pygame.Surface((glow_size * 2, glow_size), pygame.SRCALPHA)
-        pygame.draw.ellipse(glow_surf, (color_r, color_g, color_b, 80), (0, 0, glow_size * 2, glow_size))
-        self.screen.blit(glow_surf, (SCREEN_WIDTH // 2 - glow_size, 60 - glow_size // 2))
         
-        clear_text = self.font_large.render("★ CLEAR ★", True, (color_r, color_g, color_b))
-        text_rect = clear_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        self.screen.blit(clear_text, text_rect)
+        def draw_glow(surface):
+            if RENDER_QUALITY["glows"]:
+                draw_glow_ellipse(surface, color + (80,), (glow_size * 2, glow_size), (SCREEN_WIDTH // 2 - glow_size, 60 - glow_size // 2))
+        
+        # 무지개 색이 계속 바뀌므로 텍스트 캐시를 거치지 않는다
+        title = self.font_large.render("★ CLEAR ★", True, color)
+        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 80))
         
-        princess_text = self.font_medium.render("💖 공주를 구출했습니다! 💖", True, (255, 192, 203))
+        def draw_title(surface):
+            surface.blit(title, title_rect)
+        
+        # 영역: 펄스 글로우의 최대 크기, 타이틀
+        glow_rect = pygame.Rect(SCREEN_WIDTH // 2 - 230, 60 - 115, 460, 230)
+        return [
+            (glow_rect, (glow_size, color) if RENDER_QUALITY["glows"] else None, draw_glow),
+            (title_rect, color, draw_title),
+        ]
+    
+    def draw_clear(self, surface, above):
+        """클리어 화면의 정적인 부분 (above가 False면 글로우 아래 배경, True면 타이틀 위에 오는 나머지)"""
+        if not above:
+            draw_modal_backdrop(surface, (200, 240))
+            return
+        
+        princess_text = render_text(32, "💖 공주를 구출했습니다! 💖", (255, 192, 203))
         princess_rect = princess_text.get_rect(center=(SCREEN_WIDTH // 2, 120))
-        self.screen.blit(princess_text, princess_rect)
+        surface.blit(princess_text, princess_rect)
         
         time_card = pygame.Rect(SCREEN_WIDTH // 2 - 150, 150, 300, 70)
-        draw_rounded_rect(self.screen, CARD_BG, time_card, 15, 3, SUCCESS)
+        draw_rounded_rect(surface, CARD_BG, time_card, 15, 3, SUCCESS)
         
-        time_label = self.font_small.render("클리어 타임", True, TEXT_MUTED)
+        time_label = render_text(24, "클리어 타임", TEXT_MUTED)
         time_display = self.format_time(self.final_time)
-        time_text = self.font_medium.render(time_display, True, SUCCESS)
+        time_text = render_text(32, time_display, SUCCESS)
         
         time_label_rect = time_label.get_rect(center=(SCREEN_WIDTH // 2, 165))
         time_rect = time_text.get_rect(center=(SCREEN_WIDTH // 2, 195))
         
-        self.screen.blit(time_label, time_label_rect)
-        self.screen.blit(time_text, time_rect)
+        surface.blit(time_label, time_label_rect)
+        surface.blit(time_text, time_rect)
+        
+        seed_text = render_text(16, f"시드 {self.world.seed}", TEXT_MUTED)
+        surface.blit(seed_text, seed_text.get_rect(center=(SCREEN_WIDTH // 2, 235)))
         
         ranking_card = pygame.Rect(SCREEN_WIDTH // 2 - 280, 250, 560, 220)
-        draw_rounded_rect(self.screen, CARD_BG, ranking_card, 20, 3, WARNING)
+        draw_rounded_rect(surface, CARD_BG, ranking_card, 20, 3, WARNING)
         
-        ranking_title = self.font_medium.render("🏆 명예의 전당 🏆", True, WARNING)
+        ranking_title = render_text(32, "🏆 명예의 전당 🏆", WARNING)
         ranking_title_rect = ranking_title.get_rect(center=(SCREEN_WIDTH // 2, 280))
-        self.screen.blit(ranking_title, ranking_title_rect)
+        surface.blit(ranking_title, ranking_title_rect)
         
-        pygame.draw.line(self.screen, CARD_BORDER, (SCREEN_WIDTH // 2 - 240, 310), (SCREEN_WIDTH // 2 + 240, 310), 2)
+        pygame.draw.line(surface, CARD_BORDER, (SCREEN_WIDTH // 2 - 240, 310), (SCREEN_WIDTH // 2 + 240, 310), 2)
         
         medals = ["🥇", "🥈", "🥉"]
         medal_colors = [WARNING, (192, 192, 192), (205, 127, 50)]
@@ -1185,13 +3010,13 @@ class Game:
             y_pos = 335 + i * 45
             rank_bg = pygame.Rect(SCREEN_WIDTH // 2 - 260, y_pos - 5, 520, 35)
             if i % 2 == 0:
-                draw_rounded_rect(self.screen, BG_DARK, rank_bg, 8)
+                draw_rounded_rect(surface, BG_DARK, rank_bg, 8)
             
-            medal_text = self.font_medium.render(f"{medals[i]} {i+1}위", True, medal_colors[i])
-            self.screen.blit(medal_text, (SCREEN_WIDTH // 2 - 240, y_pos))
+            medal_text = render_text(32, f"{medals[i]} {i+1}위", medal_colors[i])
+            surface.blit(medal_text, (SCREEN_WIDTH // 2 - 240, y_pos))
             
-            name_text = self.font_small.render(record['name'], True, TEXT_PRIMARY)
-            self.screen.blit(name_text, (SCREEN_WIDTH // 2 - 100, y_pos + 5))
+            name_text = render_text(24, record['name'], TEXT_PRIMARY)
+            surface.blit(name_text, (SCREEN_WIDTH // 2 - 100, y_pos + 5))
             
             # 층수 표시 (B50 또는 지상)
             floor_num = record.get('floor', 0)
@@ -1200,30 +3025,32 @@ class Game:
             else:
                 floor_str = f"B{floor_num}"
             floor_color = (255, 192, 203) if floor_num >= TOTAL_FLOORS - 1 else INFO
-            floor_render = self.font_small.render(floor_str, True, floor_color)
-            self.screen.blit(floor_render, (SCREEN_WIDTH // 2 + 20, y_pos + 5))
+            floor_render = render_text(24, floor_str, floor_color)
+            surface.blit(floor_render, (SCREEN_WIDTH // 2 + 20, y_pos + 5))
             
             # 시간 표시
             time_str = self.format_time(record['time'] * 1000)
-            time_render = self.font_small.render(time_str, True, PRIMARY)
+            time_render = render_text(24, time_str, PRIMARY)
             time_render_rect = time_render.get_rect(right=SCREEN_WIDTH // 2 + 240, centery=y_pos + 12)
-            self.screen.blit(time_render, time_render_rect)
+            surface.blit(time_render, time_render_rect)
         
         restart_card = pygame.Rect(SCREEN_WIDTH // 2 - 100, 500, 200, 50)
-        draw_rounded_rect(self.screen, CARD_BG, restart_card, 12, 3, PRIMARY)
+        draw_rounded_rect(surface, CARD_BG, restart_card, 12, 3, PRIMARY)
         
-        restart_text = self.font_medium.render("R 키로 재시작", True, PRIMARY)
+        restart_text = render_text(32, "R 키로 재시작", PRIMARY)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, 525))
-        self.screen.blit(restart_text, restart_rect)
+        surface.blit(restart_text, restart_rect)
     
     def run(self):
         """게임 실행"""
         while self.running:
             self.handle_input()
-            self.update()
+            self.advance(self.clock.get_time())
             self.draw()
-            self.clock.tick(FPS)
+            self.end_frame()
         
+        if DEV_TOOLS_ENABLED:
+            print(f"🧪 임시 서피스 풀: {_SURFACE_POOL.stats()}")
         pygame.quit()
         # 웹 빌드 환경에서는 sys.exit()가 불필요/문제가 될 수 있어 생략
         if not IS_WEB_BUILD:
@@ -1238,9 +3065,9 @@ if __name__ == "__main__":
             game = Game()
             while game.running:
                 game.handle_input()
-                game.update()
+                game.advance(game.clock.get_time())
                 game.draw()
-                game.clock.tick(FPS)
+                game.end_frame()
                 await asyncio.sleep(0)
             pygame.quit()
 
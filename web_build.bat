@@ -9,6 +9,15 @@ echo.
 echo [0/2] 한글 폰트 준비(최초 1회 다운로드)...
 python tools\fetch_font.py
 
+echo.
+echo [추가] 스프라이트 아틀라스 생성(assets\atlas.png, assets\atlas.json)...
+python tools\build_atlas.py
+if errorlevel 1 (
+  echo ❌ 아틀라스 생성에 실패했습니다.
+  pause
+  exit /b 1
+)
+
 echo.
 echo [2/2] 웹(브라우저) 빌드 생성 중...
 REM pygbag 옵션은 반드시 파일 경로 뒤가 아니라 앞에 와야 합니다.